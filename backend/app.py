@@ -1,32 +1,81 @@
 # app.py
 
-from flask import Flask, request, jsonify, abort
+from flask import Flask, request, jsonify, abort, Response
+from werkzeug.exceptions import HTTPException
 import numpy as np
 import logging
+import json
+import os
 
 from implementations.Network import NeuralNetwork
 from implementations.Activation import Activation
+from implementations.Loss import Loss
+from jobs import Job, JobManager
+from registry import ModelRegistry
+from diagrams import DiagramCache, DIAGRAM_MIMETYPES
 
 app = Flask(__name__)
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-app.logger.setLevel(logging.DEBUG) 
+# Log seviyesi ortam değişkeninden gelir (örn: LOG_LEVEL=DEBUG). Varsayılan INFO;
+# DEBUG açıkken kütüphane her ileri yayılımda dizileri loglar ve bu çok yavaştır.
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+logging.basicConfig(level=LOG_LEVEL, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+app.logger.setLevel(LOG_LEVEL)
 
-# Global değişken tehlikeli olabilri güncelleyeceğim burayı.
-model_instance: NeuralNetwork | None = None
+# Tek bir global model yerine model_id ile anahtarlanan, LRU tahliyeli model deposu.
+# model_id verilmeyen istekler (örn. frontend'in /api/predict çağrısı) en son oluşturulan modeli kullanır.
+model_registry = ModelRegistry(
+    max_models=int(os.environ.get('MAX_MODELS', 1000)),
+    memory_budget_bytes=int(float(os.environ.get('MODEL_MEMORY_BUDGET_MB', 512)) * 1024 * 1024),
+    # Model başına önbelleğe alınan tahmin satırı sayısı (0: kapalı)
+    prediction_cache_size=int(os.environ.get('PREDICTION_CACHE_SIZE', 1024)),
+    # Eşzamanlı /api/predict istekleri en fazla bu kadar bekletilip tek ileri yayılımda
+    # birleştirilir (0: kapalı); batch en fazla PREDICT_BATCH_MAX_ROWS satır olur.
+    batch_max_rows=int(os.environ.get('PREDICT_BATCH_MAX_ROWS', 256)),
+    batch_max_latency=float(os.environ.get('PREDICT_BATCH_MAX_LATENCY_MS', 2)) / 1000,
+)
+
+# Eğitim işleri arka planda bu havuzda çalışır, istek thread'i hiç bloklanmaz.
+job_manager = JobManager(max_workers=int(os.environ.get('TRAINING_WORKERS', 4)))
+# Tek bir eğitim işinin data-parallel modda açabileceği en fazla process sayısı
+MAX_TRAINING_PROCESSES = int(os.environ.get('MAX_TRAINING_PROCESSES', os.cpu_count() or 1))
+
+# Frontend'deki öğrenme yöntemi seçimi -> batch_size (None: tüm veri tek batch)
+LEARNING_METHOD_BATCH_SIZES = {
+    'sgd': 1,
+    'mini_batch': 32,
+    'batch': None,
+}
+
+# Bir sweep işinin en fazla deneme sayısı ve aynı anda eğitilen deneme sayısı
+MAX_SWEEP_TRIALS = int(os.environ.get('MAX_SWEEP_TRIALS', 256))
+SWEEP_WORKERS = int(os.environ.get('SWEEP_WORKERS', 4))
+
+# /api/train'in 'dataset' parametresiyle okunabilecek CSV/NPY dosyalarının bulunduğu klasör
+DATA_DIR = os.environ.get('DATA_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'))
+# Dosyadan okunan veri setlerinde 'batch' yöntemi tüm veriyi tek batch yapamaz, bu boyut kullanılır
+DATASET_FULL_BATCH_SIZE = 10000
+# İstekteki shuffle_buffer bu satır sayısıyla sınırlanır (eğitim işinin bellek üst sınırı)
+MAX_SHUFFLE_BUFFER = int(os.environ.get('MAX_SHUFFLE_BUFFER', 100000))
+
+# Aynı katman yapısındaki ağların diyagramları bir kez çizilip saklanır
+diagram_cache = DiagramCache(max_entries=int(os.environ.get('DIAGRAM_CACHE_SIZE', 128)))
+
+# Yeni modellerin varsayılan parametre tipi (istekte 'dtype' ile değiştirilebilir)
+DEFAULT_DTYPE = os.environ.get('DEFAULT_DTYPE', 'float32')
 
 # Burayı constants.py dosyasına taşıyıp oradan çekebilirim
 ACTIVATION_MAP = {
-    'relu': Activation.relu if Activation else None,
-    'sigmoid': Activation.sigmoid if Activation else None,
-    'linear': Activation.linear if Activation else None
+    name: Activation.get(name)
+    for name in ('relu', 'sigmoid', 'tanh', 'leaky_relu', 'gelu', 'softmax', 'linear')
 }
 
-def create_custom_model(input_dim, layer_neurons, activation_names, network_name="myNeural"):
+def create_custom_model(input_dim, layer_neurons, activation_names, network_name="myNeural", dtype=None):
     """
     input_dim girdi boyutu
     layer_neurons: katmandaki nöron listesi ama index = katman no olacak şekilde düşün (örn: [5, 3, 1])
     activation_names: her katman için aktivasyon fonksiyonu ismi veya tek bir isim
     network_name: ağ için isteğe bağlı isim
+    dtype: parametrelerin veri tipi ("float32", "float16", "float64"); verilmezse DEFAULT_DTYPE
     """
     if NeuralNetwork is None or Activation is None:
         app.logger.error("NeuralNetwork veya Activation sınıfları yüklenemedi.")
@@ -35,7 +84,11 @@ def create_custom_model(input_dim, layer_neurons, activation_names, network_name
         app.logger.error("Katman nöron listesi boş olamaz.")
         return None
 
-    network = NeuralNetwork(input_dim=input_dim, name=network_name)
+    try:
+        network = NeuralNetwork(input_dim=input_dim, name=network_name, dtype=dtype or DEFAULT_DTYPE)
+    except ValueError as e:
+        app.logger.error(f"Model oluşturulamadı: {e}")
+        return None
     num_layers = len(layer_neurons)
     activation_funcs = []
     if isinstance(activation_names, str):
@@ -80,7 +133,6 @@ def create_network_endpoint():
     tek bir formla çalışmasını bekliyorum
     çünkü fronta bir buton koyduk oradan bütün verilerle tetikliyoruz.
     """
-    global model_instance 
 
     data = request.get_json()
     if not data:
@@ -93,9 +145,7 @@ def create_network_endpoint():
         activation_function = data['activation_function'] # Örn: "relu" veya ["relu", "relu", "sigmoid"]
         num_features = data.get('input_dim', 5) # Eğer istekte yoksa varsayılan 5 
 
-        # Diğer parametreler (learning_rate, epochs) şu anda kullanılmıyor
-        learning_rate = data.get('learning_rate', 0.01) 
-        epochs = data.get('epochs', 10) 
+        # Eğitim parametreleri (learning_rate, epochs) burada kullanılmaz; eğitim /api/train ile başlatılır
 
         input_dim = num_features 
 
@@ -104,28 +154,34 @@ def create_network_endpoint():
         model_instance = create_custom_model(
             input_dim=input_dim,
             layer_neurons=layer_neurons,
-            activation_names=activation_function
+            activation_names=activation_function,
+            dtype=data.get('dtype')
         )
 
         if model_instance is None:
             app.logger.error("Model oluşturulamadı.")
             abort(500, description="Failed to create the neural network model.") 
 
+        model_id = model_registry.add(model_instance)
+
         loss = None
         accuracy = None
         history = {} 
 
         model_structure = {
+            "model_id": model_id,
             "name": model_instance.name,
             "input_dimension": model_instance.input_dim,
+            "dtype": str(model_instance.dtype),
             "layers": [str(layer) for layer in model_instance.layers],
             "total_parameters": sum([(l.input_dim * l.num_neurons) + l.num_neurons for l in model_instance.layers])
         }
 
-        app.logger.info("Model başarıyla oluşturuldu (eğitim yapılmadı).")
+        app.logger.info(f"Model başarıyla oluşturuldu: {model_id}")
 
         return jsonify({
-            'message': 'Model structure created successfully (Training not implemented).',
+            'message': 'Model structure created successfully. Train it with /api/train.',
+            'model_id': model_id,
             'model_structure': model_structure,
             'parameters_received': data, 
             'status': {
@@ -138,11 +194,589 @@ def create_network_endpoint():
     except KeyError as e:
         app.logger.error(f"İstekte eksik parametre: {e}")
         abort(400, description=f"Missing parameter in JSON body: {e}")
+    except HTTPException:
+        raise
     except Exception as e:
         app.logger.error(f"İstek işlenirken genel hata: {e}", exc_info=True) 
         abort(500, description="An internal server error occurred.")
 
 
+def _synthetic_dataset(input_dim, output_dim, num_samples, loss_name):
+    """
+    İstekte veri gönderilmediğinde kullanılan sentetik veri. Hedefler rastgele bir
+    "öğretmen" lineer dönüşümden üretilir ki ağın öğrenebileceği bir yapı olsun.
+    """
+    X = np.random.rand(num_samples, input_dim)
+    teacher = np.random.randn(input_dim, output_dim)
+    scores = (X - 0.5) @ teacher
+    if loss_name in ('binary_crossentropy', 'bce'):
+        return X, (scores > 0).astype(float)
+    if loss_name in ('categorical_crossentropy', 'cce'):
+        # En yüksek skorlu sınıf one-hot hedef olur
+        return X, np.eye(output_dim)[scores.argmax(axis=1)]
+    return X, scores
+
+
+def _dataset_loader(data):
+    """İstekteki 'dataset' adını DATA_DIR altında çözer ve bir StreamingDataLoader döndürür."""
+    from implementations.DataLoader import StreamingDataLoader
+
+    name = data['dataset']
+    if not isinstance(name, str) or not name:
+        abort(400, description="dataset must be a file name.")
+    data_dir = os.path.realpath(DATA_DIR)
+    path = os.path.realpath(os.path.join(data_dir, name))
+    # DATA_DIR dışına çıkan yollar (../ veya mutlak yol) reddedilir
+    if os.path.commonpath([data_dir, path]) != data_dir or not os.path.isfile(path):
+        abort(404, description=f"Dataset not found: {name}")
+
+    target_columns = data.get('target_columns', -1)
+    shuffle_buffer = min(int(data.get('shuffle_buffer', 10000)), MAX_SHUFFLE_BUFFER)
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return StreamingDataLoader.from_csv(path, target_columns=target_columns,
+                                            skip_header=int(data.get('skip_header', 0)),
+                                            shuffle_buffer=shuffle_buffer)
+    if extension == '.npy':
+        return StreamingDataLoader.from_npy(path, target_columns=target_columns,
+                                            shuffle_buffer=shuffle_buffer)
+    abort(400, description="dataset must be a .csv or .npy file.")
+
+
+@app.route('/api/train', methods=['POST'])
+def train_endpoint():
+    """
+    Modeli oluşturur ve eğitimini arka planda bir iş olarak başlatır.
+    Hemen job_id döner; ilerleme /api/train/<job_id> (veya /stream) üzerinden izlenir.
+
+    Beklenen JSON: layer_neurons, activation_function, loss_function, learning_method,
+    learning_rate, epochs. Opsiyonel: X, y (eğitim verisi), input_dim, batch_size,
+    optimizer ("sgd", "momentum", "adam"), num_samples (sentetik veri boyutu),
+    dtype ("float32" varsayılan, "float16", "float64"),
+    dataset (DATA_DIR altındaki .csv/.npy dosyası; diskten parça parça okunur),
+    target_columns (dataset'te hedef sütun indeksleri, varsayılan son sütun),
+    skip_header (CSV başlık satırı sayısı), shuffle_buffer (karıştırma havuzu satır sayısı,
+    en fazla MAX_SHUFFLE_BUFFER),
+    workers (>1 ise mini-batch'ler bu kadar process'e bölünür, data-parallel eğitim).
+    """
+
+    data = request.get_json()
+    if not data:
+        abort(400, description="Missing JSON body in request.")
+
+    try:
+        layer_neurons = data['layer_neurons']
+        activation_function = data['activation_function']
+    except KeyError as e:
+        abort(400, description=f"Missing parameter in JSON body: {e}")
+
+    loss_name = data.get('loss_function', 'mse')
+    optimizer_name = data.get('optimizer', 'sgd')
+    learning_method = data.get('learning_method', 'mini_batch')
+    try:
+        learning_rate = float(data.get('learning_rate', 0.01))
+        epochs = int(data.get('epochs', 10))
+        workers = int(data.get('workers', 1))
+        num_samples = int(data.get('num_samples', 1000))
+        requested_batch_size = int(data['batch_size']) if data.get('batch_size') else None
+    except (TypeError, ValueError):
+        abort(400, description="learning_rate, epochs, workers, num_samples and batch_size must be numbers.")
+
+    try:
+        Loss.get(loss_name)
+    except ValueError as e:
+        abort(400, description=str(e))
+    if epochs <= 0 or learning_rate <= 0:
+        abort(400, description="epochs and learning_rate must be positive.")
+    if workers <= 0 or workers > MAX_TRAINING_PROCESSES:
+        abort(400, description=f"workers must be between 1 and {MAX_TRAINING_PROCESSES}.")
+
+    loader = None
+    try:
+        if 'dataset' in data:
+            loader = _dataset_loader(data)
+            # Özellik sayısı CSV'nin ilk satırından veya .npy başlığından gelir; veri
+            # sadece eğitim işinde okunur
+            if loader.num_features is None:
+                abort(400, description="Dataset is empty.")
+            input_dim = loader.num_features
+            X = y = None
+        elif 'X' in data and 'y' in data:
+            X = np.asarray(data['X'], dtype=float)
+            y = np.asarray(data['y'], dtype=float)
+            if X.ndim != 2:
+                abort(400, description="X must be a 2-D list of rows.")
+            input_dim = X.shape[1]
+        else:
+            input_dim = int(data.get('input_dim', 5))
+            X = y = None
+    except (TypeError, ValueError, OSError) as e:
+        abort(400, description=f"Invalid training data: {e}")
+
+    network = create_custom_model(
+        input_dim=input_dim,
+        layer_neurons=layer_neurons,
+        activation_names=activation_function,
+        dtype=data.get('dtype')
+    )
+    if network is None:
+        abort(400, description="Failed to create the neural network model.")
+
+    if loader is not None:
+        batch_size = (requested_batch_size or LEARNING_METHOD_BATCH_SIZES.get(learning_method, 32)
+                      or DATASET_FULL_BATCH_SIZE)
+        loader.batch_size = int(batch_size)
+    else:
+        if X is None:
+            X, y = _synthetic_dataset(input_dim, network.layers[-1].num_neurons,
+                                      num_samples, loss_name.lower())
+        batch_size = requested_batch_size or LEARNING_METHOD_BATCH_SIZES.get(learning_method, 32) or X.shape[0]
+
+    def run_training(job: Job):
+        history = network.fit(loader if loader is not None else X, y, loss=loss_name, optimizer=optimizer_name,
+                              batch_size=int(batch_size), epochs=epochs,
+                              learning_rate=learning_rate, on_epoch_end=job.report_epoch,
+                              workers=workers)
+        # Eğitim gradyan buffer'ları ekledi, bellek bütçesini tekrar uygula
+        model_registry.trim()
+        return history
+
+    model_id = model_registry.add(network)
+    job = Job(kind="train", total_epochs=epochs, metadata={
+        "model_id": model_id,
+        "network_name": network.name,
+        "layer_neurons": layer_neurons,
+        "loss_function": loss_name,
+        "optimizer": optimizer_name,
+        "batch_size": int(batch_size),
+        "workers": workers,
+        "num_samples": int(X.shape[0]) if X is not None else None,
+        "dataset": data.get('dataset'),
+    }, model=network)
+    job_manager.submit(job, run_training)
+
+    app.logger.info(f"Eğitim işi başlatıldı: {job.job_id}")
+    return jsonify({
+        'message': 'Training started.',
+        'job_id': job.job_id,
+        'model_id': model_id,
+        'status_url': f"/api/train/{job.job_id}",
+        'stream_url': f"/api/train/{job.job_id}/stream",
+    }), 202
+
+
+@app.route('/api/sweep', methods=['POST'])
+def sweep_endpoint():
+    """
+    Hiperparametre taraması başlatır. Arama uzayındaki her konfigürasyon create_custom_model
+    ile kurulur ve SWEEP_WORKERS thread'lik bir havuzda eğitilir; kötü giden denemeler
+    erken durdurulur. İş bitince job.result doğrulama kaybına göre sıralı leaderboard'dur
+    ve en iyi model registry'ye eklenir.
+
+    Beklenen JSON: space ({"layer_neurons": [[8, 1], [16, 8, 1]], "activation_function": [...],
+    "learning_rate": [...], "epochs": [...], "optimizer": [...], "batch_size": [...]}).
+    Opsiyonel: loss_function, X, y (yoksa sentetik veri: input_dim, num_samples),
+    validation_split, grace_epochs, workers, seed.
+    """
+    from sweep import Sweep, MedianStoppingRule, expand_grid
+
+    data = request.get_json()
+    if not data or not isinstance(data.get('space'), dict):
+        abort(400, description="Missing 'space' object in JSON body.")
+
+    loss_name = data.get('loss_function', 'mse')
+    try:
+        Loss.get(loss_name)
+        configs = expand_grid(data['space'], max_trials=MAX_SWEEP_TRIALS)
+        if 'X' in data and 'y' in data:
+            X = np.asarray(data['X'], dtype=float)
+            y = np.asarray(data['y'], dtype=float)
+            if X.ndim != 2:
+                abort(400, description="X must be a 2-D list of rows.")
+        else:
+            output_dims = {config['layer_neurons'][-1] for config in configs if config['layer_neurons']}
+            if len(output_dims) != 1:
+                abort(400, description="All layer_neurons options must have the same output size.")
+            X, y = _synthetic_dataset(int(data.get('input_dim', 5)), output_dims.pop(),
+                                      int(data.get('num_samples', 1000)), loss_name.lower())
+        workers = max(1, min(int(data.get('workers', SWEEP_WORKERS)), SWEEP_WORKERS))
+        sweep = Sweep(create_custom_model, configs, X, y, loss=loss_name,
+                      validation_split=float(data.get('validation_split', 0.2)),
+                      max_workers=workers,
+                      stopping_rule=MedianStoppingRule(grace_epochs=int(data.get('grace_epochs', 2))),
+                      seed=data.get('seed'))
+    except (TypeError, ValueError, KeyError) as e:
+        abort(400, description=f"Invalid sweep request: {e}")
+
+    def run_sweep(job: Job):
+        finished = []
+
+        def on_trial_end(trial):
+            # İş ilerlemesi deneme bazında raporlanır (history: biten denemelerin en iyi kaybı)
+            finished.append(trial["trial_id"])
+            job.report_epoch(len(finished) - 1, trial["best_val_loss"] if trial["best_val_loss"] is not None
+                             else float("nan"))
+
+        leaderboard = sweep.run(on_trial_end=on_trial_end)
+        best = sweep.best_model()
+        if best is not None:
+            leaderboard[0]["model_id"] = model_registry.add(best)
+            job.metadata["best_model_id"] = leaderboard[0]["model_id"]
+        return {"leaderboard": leaderboard}
+
+    job = Job(kind="sweep", total_epochs=len(configs), metadata={
+        "num_trials": len(configs),
+        "workers": workers,
+        "loss_function": loss_name,
+        "num_samples": int(X.shape[0]),
+    })
+    job_manager.submit(job, run_sweep)
+
+    app.logger.info(f"Sweep işi başlatıldı: {job.job_id} ({len(configs)} deneme)")
+    return jsonify({
+        'message': 'Sweep started.',
+        'job_id': job.job_id,
+        'num_trials': len(configs),
+        'status_url': f"/api/train/{job.job_id}",
+        'stream_url': f"/api/train/{job.job_id}/stream",
+    }), 202
+
+
+def _get_job_or_404(job_id):
+    job = job_manager.get(job_id)
+    if job is None:
+        abort(404, description=f"Job not found: {job_id}")
+    return job
+
+
+@app.route('/api/train/<job_id>', methods=['GET'])
+def train_status_endpoint(job_id):
+    """Eğitim işinin durumu ve epoch başına loss geçmişi. ?since=N ile sadece yeni epoch'lar."""
+    job = _get_job_or_404(job_id)
+    since = request.args.get('since', 0, type=int)
+    return jsonify(job.to_dict(since=since))
+
+
+@app.route('/api/train/<job_id>/stream', methods=['GET'])
+def train_stream_endpoint(job_id):
+    """Her epoch sonunda loss'u Server-Sent Events olarak gönderir, iş bitince kapanır."""
+    job = _get_job_or_404(job_id)
+
+    def events():
+        seen = 0
+        while True:
+            if not job.wait_for_update(seen):
+                yield ": keep-alive\n\n"
+                continue
+            state = job.to_dict(since=seen)
+            for loss in state['history']['loss']:
+                seen += 1
+                yield f"event: epoch\ndata: {json.dumps({'epoch': seen, 'loss': loss})}\n\n"
+            if job.done:
+                yield f"event: {state['status']}\ndata: {json.dumps(state)}\n\n"
+                return
+
+    return Response(events(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache'})
+
+
+@app.route('/api/predict', methods=['POST'])
+def predict_endpoint():
+    """
+    Bir veya birden fazla satır için tahmin döndürür. Tüm satırlar tek bir
+    vektörize ileri yayılımla hesaplanır. Registry'deki modeller için önce tahmin önbelleğine
+    bakılır; eşzamanlı istekler micro-batcher'da birleştirilip tek ileri yayılımda hesaplanır.
+
+    Beklenen JSON: input_data (tek satır [..] veya satır listesi [[..], ..]).
+    Opsiyonel: model_id veya job_id (o eğitim işinin modeli); ikisi de yoksa son oluşturulan model.
+    use_cache: false ise modelin tahmin önbelleği atlanır (varsayılan true).
+    """
+    data = request.get_json()
+    if not data or 'input_data' not in data:
+        abort(400, description="Missing 'input_data' in JSON body.")
+
+    entry = None
+    if data.get('job_id'):
+        job = _get_job_or_404(data['job_id'])
+        entry = model_registry.get_entry(job.metadata.get('model_id')) if job.metadata.get('model_id') else None
+        # Model registry'den çıkarıldıysa işin kendi modeli kullanılır; registry'deki model
+        # düzenlenmiş olabileceğinden varsa o tercih edilir
+        network = entry.network if entry is not None else job.model
+    else:
+        entry = model_registry.get_entry(data.get('model_id'))
+        network = entry.network if entry is not None else None
+    if network is None:
+        abort(404, description="No model available. Create or train a model first.")
+
+    try:
+        X = np.asarray(data['input_data'], dtype=float)
+    except (TypeError, ValueError) as e:
+        abort(400, description=f"Invalid input_data: {e}")
+    single = X.ndim == 1
+    if single:
+        X = X.reshape(1, -1)
+    if X.ndim != 2 or X.shape[1] != network.input_dim:
+        abort(400, description=f"input_data rows must have {network.input_dim} features.")
+
+    if entry is not None:
+        predictions = entry.predict(X, use_cache=bool(data.get('use_cache', True)))
+    else:
+        predictions = network.predict(X)
+    return jsonify({
+        'predictions': (predictions[0] if single else predictions).tolist(),
+        'num_rows': int(X.shape[0]),
+    })
+
+
+@app.route('/api/network/<model_id>/diagram', methods=['GET'])
+def network_diagram_endpoint(model_id):
+    """
+    Modelin diyagramını ekran gerektirmeden (Agg) SVG veya PNG olarak döndürür.
+
+    Query parametreleri: format (svg | png, varsayılan svg), max_neurons (katman başına
+    çizilecek en fazla nöron, varsayılan 16), color_by_weight (1 ise bağlantılar ağırlığa
+    göre renklendirilir). Görüntüler katman yapısına göre önbelleğe alınır; ETag ile
+    tarayıcı aynı diyagramı tekrar indirmez.
+    """
+    entry = model_registry.get_entry(None if model_id == 'latest' else model_id)
+    if entry is None:
+        abort(404, description=f"Model not found: {model_id}")
+    if not isinstance(entry.network, NeuralNetwork):
+        abort(400, description="Diagrams are only supported for float models.")
+
+    image_format = request.args.get('format', 'svg').lower()
+    if image_format not in DIAGRAM_MIMETYPES:
+        abort(400, description=f"Unsupported format: {image_format} (svg or png).")
+    try:
+        max_neurons = int(request.args.get('max_neurons', 16))
+    except ValueError:
+        abort(400, description="max_neurons must be an integer.")
+    if not 2 <= max_neurons <= 256:
+        abort(400, description="max_neurons must be between 2 and 256.")
+    color_by_weight = request.args.get('color_by_weight', '0').lower() in ('1', 'true', 'yes')
+
+    key, image = diagram_cache.get_or_render(entry.network, image_format, max_neurons, color_by_weight,
+                                            model_id=entry.model_id)
+    if request.if_none_match.contains(key):
+        return Response(status=304, headers={'ETag': f'"{key}"'})
+    return Response(image, mimetype=DIAGRAM_MIMETYPES[image_format],
+                    headers={'ETag': f'"{key}"', 'Cache-Control': 'no-cache'})
+
+
+@app.route('/api/profile', methods=['POST'])
+def profile_endpoint():
+    """
+    Modelin katman başına çalışma maliyetini ölçer (süre, tahmini FLOP, ayrılan bellek, çıktı shape'i).
+
+    Opsiyonel JSON: model_id (yoksa son model), X (yoksa num_samples, varsayılan 256, adet
+    rastgele satır), repeats (varsayılan 10), backward (true ise her tekrarda bir eğitim
+    adımının forward+backward'ı da ölçülür; hedefler rastgeledir), loss_function (varsayılan mse).
+    Ölçüm, ağırlıkları paylaşan ayrı bir kopya üzerinde yapılır; çalışan model etkilenmez.
+    """
+    data = request.get_json(silent=True) or {}
+    entry = model_registry.get_entry(data.get('model_id'))
+    if entry is None:
+        abort(404, description="No model available. Create or train a model first.")
+    if not isinstance(entry.network, NeuralNetwork):
+        abort(400, description="Profiling is only supported for float models.")
+    network = entry.network.shallow_copy()
+
+    try:
+        repeats = int(data.get('repeats', 10))
+        if 'X' in data:
+            X = np.asarray(data['X'], dtype=float)
+            if X.ndim != 2 or X.shape[1] != network.input_dim:
+                abort(400, description=f"X rows must have {network.input_dim} features.")
+        else:
+            X = np.random.rand(int(data.get('num_samples', 256)), network.input_dim)
+        backward = bool(data.get('backward', False))
+        if backward:
+            loss_name = data.get('loss_function', 'mse')
+            Loss.get(loss_name)
+            y = np.random.rand(X.shape[0], network.layers[-1].num_neurons)
+    except (TypeError, ValueError) as e:
+        abort(400, description=f"Invalid profile parameters: {e}")
+    if not 0 < repeats <= 1000 or X.shape[0] == 0:
+        abort(400, description="repeats must be in 1..1000 and X must have rows.")
+
+    with network.profile() as profiler:
+        for _ in range(repeats):
+            network.predict(X)
+            if backward:
+                network.compute_gradients(X, y, loss=loss_name)
+    report = profiler.report()
+    report.update(model_id=entry.model_id, num_rows=int(X.shape[0]), repeats=repeats)
+    return jsonify(report)
+
+
+@app.route('/api/models', methods=['GET'])
+def list_models_endpoint():
+    return jsonify({
+        'models': model_registry.list(),
+        'total_bytes': model_registry.total_bytes(),
+        'memory_budget_bytes': model_registry.memory_budget_bytes,
+    })
+
+
+@app.route('/api/models/<model_id>', methods=['GET'])
+def get_model_endpoint(model_id):
+    entry = model_registry.get_entry(model_id)
+    if entry is None:
+        abort(404, description=f"Model not found: {model_id}")
+    return jsonify(entry.to_dict())
+
+
+@app.route('/api/models/<model_id>', methods=['DELETE'])
+def delete_model_endpoint(model_id):
+    if not model_registry.remove(model_id):
+        abort(404, description=f"Model not found: {model_id}")
+    return jsonify({'message': 'Model deleted.', 'model_id': model_id})
+
+
+@app.route('/api/models/<model_id>/cache', methods=['GET', 'DELETE'])
+def model_cache_endpoint(model_id):
+    """Modelin tahmin önbelleği istatistikleri (GET) veya önbelleğin temizlenmesi (DELETE)."""
+    entry = model_registry.get_entry(model_id)
+    if entry is None:
+        abort(404, description=f"Model not found: {model_id}")
+    if entry.cache is None:
+        abort(404, description="Prediction cache is disabled (PREDICTION_CACHE_SIZE=0).")
+    if request.method == 'DELETE':
+        entry.cache.clear()
+    return jsonify({'model_id': model_id, 'prediction_cache': entry.cache.stats()})
+
+
+@app.route('/api/models/<model_id>/quantize', methods=['POST'])
+def quantize_model_endpoint(model_id):
+    """
+    Modelin int8 kuantize edilmiş tahmin kopyasını oluşturup registry'ye yeni bir model
+    olarak ekler ve float modele göre doğruluk raporunu döndürür.
+
+    Opsiyonel JSON: X (ve sınıflandırma için y) karşılaştırma verisi; verilmezse
+    num_samples (varsayılan 256) adet [0, 1) aralığında rastgele satır kullanılır.
+    """
+    from implementations.Quantization import QuantizedNetwork, quantization_report
+
+    entry = model_registry.get_entry(model_id)
+    if entry is None:
+        abort(404, description=f"Model not found: {model_id}")
+    network = entry.network
+    if isinstance(network, QuantizedNetwork):
+        abort(400, description="Model is already quantized.")
+
+    data = request.get_json(silent=True) or {}
+    try:
+        if 'X' in data:
+            X = np.asarray(data['X'], dtype=float)
+            y = np.asarray(data['y'], dtype=float) if 'y' in data else None
+            if X.ndim != 2 or X.shape[1] != network.input_dim:
+                abort(400, description=f"X rows must have {network.input_dim} features.")
+        else:
+            X = np.random.rand(int(data.get('num_samples', 256)), network.input_dim)
+            y = None
+    except (TypeError, ValueError) as e:
+        abort(400, description=f"Invalid evaluation data: {e}")
+
+    with entry.lock:
+        quantized = network.quantize()
+    report = quantization_report(network, quantized, X, y)
+    quantized_id = model_registry.add(quantized)
+    app.logger.info(f"Model {model_id} int8'e çevrildi: {quantized_id} ({report['compression']:.1f}x)")
+    return jsonify({
+        'message': 'Model quantized.',
+        'model_id': quantized_id,
+        'source_model_id': model_id,
+        'report': report,
+    })
+
+
+def _activation_or_400(name):
+    func = ACTIVATION_MAP.get(name.lower()) if isinstance(name, str) else None
+    if func is None:
+        abort(400, description=f"Unsupported activation function: {name}")
+    return func
+
+
+def _edit_model(model_id, edit):
+    """
+    Modelin katman yapısını edit(network) ile yerinde düzenler; ağ baştan kurulmaz ve
+    etkilenmeyen katmanların eğitilmiş ağırlıkları korunur (bkz. NeuralNetwork.insert_layer vb.).
+    Düzenleme ağırlıkları paylaşan bir kopya üzerinde yapılıp registry'deki ağın yerine
+    konur, böylece o sırada çalışan tahminler yarım düzenlenmiş bir ağ görmez.
+    Eğitimi süren bir model düzenlenemez (409).
+    """
+    entry = model_registry.get_entry(model_id)
+    if entry is None:
+        abort(404, description=f"Model not found: {model_id}")
+    if not isinstance(entry.network, NeuralNetwork):
+        abort(400, description="Only float models can be edited.")
+
+    with entry.lock:
+        network = entry.network
+        if job_manager.active_for(network):
+            abort(409, description="Model is being trained; wait for the training job to finish.")
+        edited = network.shallow_copy()
+        try:
+            edit(edited)
+        except (TypeError, ValueError) as e:
+            abort(400, description=str(e))
+        entry.network = edited
+    # Katman büyüdüyse bellek bütçesi aşılmış olabilir
+    model_registry.trim()
+    app.logger.info(f"Model {model_id} düzenlendi: {[layer.num_neurons for layer in edited.layers]}")
+    return jsonify({'message': 'Model updated.', 'model': entry.to_dict()})
+
+
+@app.route('/api/models/<model_id>/layers', methods=['POST'])
+def insert_layer_endpoint(model_id):
+    """
+    Modele yeni bir katman ekler. Beklenen JSON: num_neurons, activation_function.
+    Opsiyonel: index (varsayılan sona ekler), name.
+    """
+    data = request.get_json()
+    if not data or 'num_neurons' not in data or 'activation_function' not in data:
+        abort(400, description="num_neurons and activation_function are required.")
+    activation = _activation_or_400(data['activation_function'])
+    try:
+        num_neurons = int(data['num_neurons'])
+        index = int(data['index']) if 'index' in data else None
+    except (TypeError, ValueError):
+        abort(400, description="num_neurons and index must be integers.")
+
+    def edit(network):
+        position = len(network.layers) if index is None else index
+        network.insert_layer(position, num_neurons, activation, name=data.get('name'))
+
+    return _edit_model(model_id, edit)
+
+
+@app.route('/api/models/<model_id>/layers/<int(signed=True):index>', methods=['PATCH', 'DELETE'])
+def edit_layer_endpoint(model_id, index):
+    """
+    Tek bir katmanı düzenler (PATCH) veya çıkarır (DELETE). Negatif indeksler sondan sayılır.
+    PATCH JSON: num_neurons (katmanı genişletir/daraltır) ve/veya activation_function.
+    """
+    if request.method == 'DELETE':
+        return _edit_model(model_id, lambda network: network.remove_layer(index))
+
+    data = request.get_json()
+    if not data or ('num_neurons' not in data and 'activation_function' not in data):
+        abort(400, description="num_neurons or activation_function is required.")
+    activation = _activation_or_400(data['activation_function']) if 'activation_function' in data else None
+    try:
+        num_neurons = int(data['num_neurons']) if 'num_neurons' in data else None
+    except (TypeError, ValueError):
+        abort(400, description="num_neurons must be an integer.")
+
+    def edit(network):
+        if num_neurons is not None:
+            network.resize_layer(index, num_neurons)
+        if activation is not None:
+            network.set_layer_activation(index, activation)
+
+    return _edit_model(model_id, edit)
+
+
 @app.route('/api/sendParameters', methods=['POST'])
 def send_parameters():
     data = request.get_json()
@@ -153,4 +787,5 @@ def send_parameters():
     return jsonify(data)
 
 if __name__ == '__main__':
+    # Geliştirme sunucusu. Üretimde tahmin sunmak için: python serve.py --models-dir <klasör>
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,190 @@
+# batching.py
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingRequest:
+    __slots__ = ("X", "result", "error", "done", "lead", "event")
+
+    def __init__(self, X: np.ndarray):
+        self.X = X
+        self.result: Optional[np.ndarray] = None
+        self.error: Optional[BaseException] = None
+        self.done = False
+        self.lead = False  # True ise bu isteğin thread'i bir sonraki batch'i toplayıp çalıştırır
+        self.event = threading.Event()
+
+
+class MicroBatcher:
+    """
+    Aynı modele eşzamanlı gelen tahmin isteklerini tek bir ileri yayılımda birleştirir.
+
+    Ayrı bir arka plan thread'i yoktur: lider yokken gelen istek thread'i "lider" olur,
+    max_latency saniye boyunca ya da kuyrukta max_rows satır birikene kadar bekler, kuyruktaki
+    istekleri birleştirip predict_fn'i bir kez çağırır ve sonuçları isteklere dağıtır. Diğer
+    istek thread'leri kendi Event'lerini bekler (her batch'te tüm thread'ler uyandırılmaz);
+    lider işini bitirdiğinde kuyrukta kalan ilk istek yeni lider olur. Böylece eşzamanlı yük
+    altında batch boyutu büyür ve matris çarpımlarının vektörizasyonundan faydalanılır; tek
+    bir istek en fazla max_latency kadar (artı önündeki batch'in süresi) gecikir.
+
+    Bekleme uyarlamalıdır: önceki batch tek bir istekten oluştuysa (eşzamanlı yük yok)
+    lider beklemeden çalışır, böylece sıralı istek yapan tek bir istemci gecikme ödemez.
+    Yük artıp lider çalışırken istekler birikmeye başlayınca batch'ler tekrar beklemeli olur.
+
+    max_rows'tan büyük istekler zaten yeterince büyük olduğundan beklemeden doğrudan çalışır.
+    """
+
+    def __init__(self, predict_fn: Callable[[np.ndarray], np.ndarray], max_rows: int = 256,
+                 max_latency: float = 0.002):
+        if max_rows <= 0:
+            raise ValueError("max_rows pozitif olmalıdır.")
+        if max_latency < 0:
+            raise ValueError("max_latency negatif olamaz.")
+        self.predict_fn = predict_fn
+        self.max_rows = max_rows
+        self.max_latency = max_latency
+        self._queue: "deque[_PendingRequest]" = deque()
+        self._queued_rows = 0
+        self._leader_active = False
+        self._last_batch_requests = 0
+        self._lock = threading.Lock()
+        # Sadece lider bekler; kuyruk max_rows'a ulaşınca uyandırılır
+        self._full = threading.Condition(self._lock)
+        self.requests = 0
+        self.batches = 0
+        self.rows = 0
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """predict_fn(X) ile aynı sonucu döndürür; X shape (m, input_dim) olmalıdır."""
+        if X.shape[0] >= self.max_rows:
+            with self._lock:
+                self.requests += 1
+                self.batches += 1
+                self.rows += X.shape[0]
+            return self.predict_fn(X)
+
+        request = _PendingRequest(X)
+        with self._lock:
+            self._queue.append(request)
+            self._queued_rows += X.shape[0]
+            self.requests += 1
+            if not self._leader_active:
+                self._leader_active = request.lead = True
+            elif self._queued_rows >= self.max_rows:
+                self._full.notify()
+
+        while True:
+            if request.lead:
+                self._lead()
+            if request.done:
+                break
+            request.event.wait()
+            request.event.clear()
+
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _lead(self):
+        """Kuyruktan bir batch toplar, çalıştırır ve liderliği sıradaki isteğe devreder."""
+        with self._lock:
+            deadline = time.perf_counter() + self.max_latency
+            concurrent = self._last_batch_requests > 1 or len(self._queue) > 1
+            while concurrent and self._queued_rows < self.max_rows:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._full.wait(remaining)
+
+            batch, rows = [], 0
+            while self._queue and (not batch or rows + self._queue[0].X.shape[0] <= self.max_rows):
+                request = self._queue.popleft()
+                batch.append(request)
+                rows += request.X.shape[0]
+            self._queued_rows -= rows
+            self._last_batch_requests = len(batch)
+            self.batches += 1
+            self.rows += rows
+
+        # İleri yayılım kilit dışında yapılır; bu sırada yeni istekler kuyruğa girebilir
+        self._run_batch(batch)
+
+        with self._lock:
+            if self._queue:
+                successor = self._queue[0]
+                successor.lead = True
+            else:
+                successor = None
+                self._leader_active = False
+        for request in batch:
+            request.lead = False
+            request.done = True
+            request.event.set()
+        if successor is not None:
+            successor.event.set()
+
+    def _run_batch(self, batch: List[_PendingRequest]):
+        try:
+            X = batch[0].X if len(batch) == 1 else np.concatenate([request.X for request in batch])
+            outputs = self.predict_fn(X)
+            start = 0
+            for request in batch:
+                end = start + request.X.shape[0]
+                request.result = outputs[start:end]
+                start = end
+        except Exception as e:
+            for request in batch:
+                request.error = e
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Micro-batch: %d requests, %d rows", len(batch), sum(r.X.shape[0] for r in batch))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_rows": self.max_rows,
+                "max_latency_ms": self.max_latency * 1000,
+                "requests": self.requests,
+                "batches": self.batches,
+                "rows": self.rows,
+                "mean_batch_rows": self.rows / self.batches if self.batches else None,
+            }
+
+
+def create_batcher(predict_fn: Callable[[np.ndarray], np.ndarray], max_rows: int,
+                   max_latency: float) -> Optional[MicroBatcher]:
+    """max_latency 0 ise (veya max_rows 1 ise) birleştirme kapalıdır."""
+    if max_latency <= 0 or max_rows <= 1:
+        return None
+    return MicroBatcher(predict_fn, max_rows=max_rows, max_latency=max_latency)
+
+
+# --- Örnek Kullanım (Test Amaçlı) ---
+if __name__ == '__main__':
+    from concurrent.futures import ThreadPoolExecutor
+
+    from implementations.Activation import Activation
+    from implementations.Layer import Layer
+    from implementations.Network import NeuralNetwork
+
+    network = NeuralNetwork(input_dim=64, name="BatchingExample")
+    network._append_layer(Layer(2048, 64, Activation.relu, "hidden_1"))
+    network._append_layer(Layer(2048, 2048, Activation.relu, "hidden_2"))
+    network._append_layer(Layer(1, 2048, Activation.sigmoid, "output"))
+    rows = np.random.rand(2000, 64)
+
+    for clients in (1, 8, 32):
+        for name, predict in (("direct", network.predict),
+                              ("batched", MicroBatcher(network.predict, max_rows=64, max_latency=0.002).predict)):
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=clients) as executor:
+                list(executor.map(lambda i: predict(rows[i:i + 1]), range(rows.shape[0])))
+            elapsed = time.perf_counter() - start
+            print(f"{clients:>3} clients  {name:<8} {rows.shape[0] / elapsed:>10,.0f} requests/s")
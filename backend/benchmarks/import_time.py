@@ -0,0 +1,104 @@
+# benchmarks/import_time.py
+"""
+Başlangıç (import) süresi bütçe kontrolü.
+
+Her ölçüm temiz bir Python process'inde yapılır: modül import edilir, süre ve yüklenen
+modüller raporlanır. Medyan süre --budget'ı aşarsa veya yasaklı modüllerden biri
+(varsayılan: matplotlib, multiprocessing, Visualizer, Parallel, sweep) import sırasında
+yüklenirse çıkış kodu 1 olur. -X importtime çıktısından kendi süresi en uzun modüller de
+listelenir, böylece bütçeyi aşan import kolayca bulunur.
+
+Kullanım (backend klasöründen):
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --module serve --budget 0.5 --repeats 7
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_FORBIDDEN = [
+    "matplotlib",
+    "multiprocessing",
+    "implementations.Visualizer",
+    "implementations.Parallel",
+    "sweep",
+]
+
+# Temiz process'te çalışan ölçüm kodu: süre ve yüklenen modül listesi JSON olarak yazılır
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure(module, repeats):
+    """Her tekrar için (süre, yüklenen modüller); ilk çalıştırma .pyc'leri ısıtmak için atılır."""
+    runs = []
+    for _ in range(repeats + 1):
+        output = subprocess.run([sys.executable, "-c", _PROBE.format(module=module)], cwd=BACKEND_DIR,
+                                env=dict(os.environ, LOG_LEVEL="WARNING"),
+                                capture_output=True, text=True, check=True).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    return runs[1:]
+
+
+def slowest_imports(module, count):
+    """-X importtime ile kendi (self) süresi en uzun modüller: [(mikrosaniye, modül), ...]."""
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=BACKEND_DIR,
+                            env=dict(os.environ, LOG_LEVEL="WARNING"),
+                            capture_output=True, text=True, check=True).stderr
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:"):].split("|")
+        entries.append((int(self_us), name.strip()))
+    return sorted(entries, reverse=True)[:count]
+
+
+def loaded_forbidden(modules, forbidden):
+    return sorted(name for name in modules
+                  if any(name == f or name.startswith(f + ".") for f in forbidden))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import-time budget check")
+    parser.add_argument("--module", default="app", help="Ölçülecek modül (backend klasörüne göre)")
+    parser.add_argument("--budget", type=float, default=1.0, help="İzin verilen medyan import süresi (saniye)")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--forbidden", type=lambda v: [m for m in v.split(",") if m], default=DEFAULT_FORBIDDEN,
+                        help="Import sırasında yüklenmemesi gereken modüller (virgülle ayrılmış)")
+    parser.add_argument("--top", type=int, default=10, help="Listelenecek en yavaş modül sayısı")
+    args = parser.parse_args(argv)
+
+    runs = measure(args.module, args.repeats)
+    seconds = statistics.median(run["seconds"] for run in runs)
+    modules = runs[-1]["modules"]
+    print(f"import {args.module}: median {seconds * 1000:.1f} ms over {args.repeats} runs "
+          f"(budget {args.budget * 1000:.0f} ms), {len(modules)} modules loaded")
+    print("slowest imports (self time):")
+    for self_us, name in slowest_imports(args.module, args.top):
+        print(f"  {self_us / 1000:>8.1f} ms  {name}")
+
+    status = 0
+    if seconds > args.budget:
+        print(f"OVER BUDGET: {seconds * 1000:.1f} ms > {args.budget * 1000:.0f} ms")
+        status = 1
+    forbidden = loaded_forbidden(modules, args.forbidden)
+    if forbidden:
+        print(f"FORBIDDEN MODULES LOADED: {', '.join(forbidden)}")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
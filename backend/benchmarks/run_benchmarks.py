@@ -0,0 +1,247 @@
+# benchmarks/run_benchmarks.py
+"""
+NeuralNetwork için verim (throughput) benchmark'ları.
+
+Katman genişliği x derinlik x batch boyutu ızgarası üzerinde şunları ölçer:
+  forward     NeuralNetwork.predict
+  train_step  forward + backward + optimizer adımı (fit'in bir batch'i)
+  loss_mse    Loss.mean_squared_error
+  loss_bce    Loss.binary_crossentropy
+  loss_bce_vg Loss.binary_crossentropy_value_and_grad (kayıp + gradyan tek geçişte)
+
+Her ölçüm için saniyedeki örnek sayısı (samples/sec, tekrarların medyanı) ve
+tracemalloc ile ölçülen tepe bellek (peak bytes) raporlanır. Sonuçlar JSON
+olarak yazılır; --compare ile önceki bir sonuç dosyasına göre gerileme kontrolü
+yapılır ve eşik aşılırsa çıkış kodu 1 olur.
+
+--dtypes ile her ağ verilen veri tiplerinde ölçülür. Ağ önce float64 oluşturulur ve her
+tip bu ağın astype ile çevrilmiş kopyasıdır; tahminler ve kayıp orijinal float64 ağla
+karşılaştırılır (NeuralNetwork.check_precision), yani depolama yuvarlaması da ölçülür.
+Hata tipin toleransını aşarsa çıkış kodu yine 1 olur.
+
+Kullanım (backend klasöründen):
+    python benchmarks/run_benchmarks.py --output bench.json
+    python benchmarks/run_benchmarks.py --widths 64,256 --depths 2 --batch-sizes 32,256 \\
+        --compare bench.json --threshold 0.15
+    python benchmarks/run_benchmarks.py --dtypes float64,float32,float16
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from implementations.Activation import Activation  # noqa: E402
+from implementations.Layer import Layer  # noqa: E402
+from implementations.Loss import Loss  # noqa: E402
+from implementations.Network import NeuralNetwork  # noqa: E402
+from implementations.Optimizer import Optimizer  # noqa: E402
+
+INPUT_DIM = 64
+OUTPUT_DIM = 1
+
+
+def build_network(width, depth, dtype="float32"):
+    """depth adet width genişliğinde ReLU katmanı + sigmoid çıkış katmanı."""
+    # add_layer her katman için print ettiği için katmanlar doğrudan oluşturuluyor
+    network = NeuralNetwork(input_dim=INPUT_DIM, name=f"bench_w{width}_d{depth}", dtype=dtype)
+    layer_input_dim = INPUT_DIM
+    for i in range(depth):
+        network._append_layer(Layer(width, layer_input_dim, Activation.relu, f"hidden_{i}", dtype=dtype))
+        layer_input_dim = width
+    network._append_layer(Layer(OUTPUT_DIM, layer_input_dim, Activation.sigmoid, "output", dtype=dtype))
+    return network
+
+
+def make_cases(network, batch_size):
+    """Her benchmark için (isim, çağrılabilir) çiftleri."""
+    X = np.random.rand(batch_size, INPUT_DIM).astype(network.compute_dtype)
+    y = (np.random.rand(batch_size, OUTPUT_DIM) > 0.5).astype(network.compute_dtype)
+    y_pred = network.predict(X)
+    optimizer = Optimizer.create("sgd", learning_rate=0.01)
+    loss_fn, wrt_logits = Loss.value_and_grad("binary_crossentropy", network.layers[-1].activation_function)
+    grad_out = np.empty_like(y_pred)
+
+    def train_step():
+        network._forward_backward(X, y, loss_fn, wrt_logits)
+        optimizer.step(network.layers)
+
+    return [
+        ("forward", lambda: network.predict(X)),
+        ("train_step", train_step),
+        ("loss_mse", lambda: Loss.mean_squared_error(y_pred, y)),
+        ("loss_bce", lambda: Loss.binary_crossentropy(y_pred, y)),
+        ("loss_bce_vg", lambda: Loss.binary_crossentropy_value_and_grad(y_pred, y, out=grad_out)),
+    ]
+
+
+def time_call(func, min_time, repeats):
+    """
+    Her tekrarda fonksiyonu en az min_time saniye çalıştırır ve çağrı başına süreyi
+    ölçer. Tekrarların medyanı döndürülür.
+    """
+    func()  # ısınma (buffer'lar, optimizer durumu)
+    per_call = []
+    for _ in range(repeats):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            func()
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        per_call.append(elapsed / calls)
+    return statistics.median(per_call)
+
+
+def peak_memory(func):
+    """Tek bir çağrı sırasında tracemalloc'un gördüğü tepe bellek (byte)."""
+    func()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def run(widths, depths, batch_sizes, min_time, repeats, dtypes=("float32",)):
+    results = []
+    precision = []
+    for width in widths:
+        for depth in depths:
+            reference = build_network(width, depth, "float64")
+            X = np.random.rand(256, INPUT_DIM)
+            y = (np.random.rand(256, OUTPUT_DIM) > 0.5).astype(np.float64)
+            for dtype in dtypes:
+                network = reference.shallow_copy().astype(dtype)
+                network.name = f"bench_w{width}_d{depth}"
+                check = network.check_precision(X, reference=reference, y=y, loss="binary_crossentropy")
+                check.update(width=width, depth=depth)
+                precision.append(check)
+                print(f"precision   w={width:<5} d={depth:<3} {dtype:<8} max rel error {check['max_rel_error']:.2e} "
+                      f"loss rel error {check['loss_rel_error']:.2e} "
+                      f"(tolerance {check['tolerance']:.0e}) {'ok' if check['within_tolerance'] else 'FAIL'}")
+                results.extend(run_network(network, width, depth, dtype, batch_sizes, min_time, repeats))
+    return results, precision
+
+
+def run_network(network, width, depth, dtype, batch_sizes, min_time, repeats):
+    """Tek bir ağ için tüm batch boyutlarında benchmark'ları çalıştırır."""
+    results = []
+    params = sum(l.weights.size + l.biases.size for l in network.layers)
+    for batch_size in batch_sizes:
+        for name, func in make_cases(network, batch_size):
+            seconds = time_call(func, min_time, repeats)
+            result = {
+                "benchmark": name,
+                "width": width,
+                "depth": depth,
+                "dtype": dtype,
+                "batch_size": batch_size,
+                "parameters": int(params),
+                "seconds_per_call": seconds,
+                "samples_per_sec": batch_size / seconds,
+                "peak_bytes": peak_memory(func),
+            }
+            results.append(result)
+            print(f"{name:<11} w={width:<5} d={depth:<3} {dtype:<8} bs={batch_size:<6} "
+                  f"{result['samples_per_sec']:>14,.0f} samples/s  "
+                  f"peak {result['peak_bytes'] / 1024:>10,.1f} KiB")
+    return results
+
+
+def result_key(result):
+    # dtype alanı olmayan eski sonuç dosyaları float64 ile ölçülmüştü
+    return (result["benchmark"], result["width"], result["depth"], result.get("dtype", "float64"),
+            result["batch_size"])
+
+
+def compare(results, baseline_path, threshold):
+    """Baseline'a göre samples_per_sec'i threshold'dan fazla düşen ölçümleri döndürür."""
+    with open(baseline_path) as f:
+        baseline = {result_key(r): r for r in json.load(f)["results"]}
+    regressions = []
+    for result in results:
+        base = baseline.get(result_key(result))
+        if base is None:
+            continue
+        change = result["samples_per_sec"] / base["samples_per_sec"] - 1
+        if change < -threshold:
+            regressions.append((result, change))
+    return regressions
+
+
+def parse_int_list(value):
+    return [int(v) for v in value.split(",") if v]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="NeuralNetwork throughput benchmarks")
+    parser.add_argument("--widths", type=parse_int_list, default=[32, 128, 512])
+    parser.add_argument("--depths", type=parse_int_list, default=[1, 2, 4])
+    parser.add_argument("--batch-sizes", type=parse_int_list, default=[1, 32, 256])
+    parser.add_argument("--dtypes", type=lambda v: [d for d in v.split(",") if d], default=["float32"],
+                        help="Ölçülecek veri tipleri (float64, float32, float16)")
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="Her tekrarın en az süresi (saniye)")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", default=None, help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", default=None, help="Karşılaştırılacak önceki JSON sonuç dosyası")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Gerileme sayılacak samples/sec düşüş oranı (0.10 = %%10)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    np.random.seed(args.seed)
+    results, precision = run(args.widths, args.depths, args.batch_sizes, args.min_time, args.repeats, args.dtypes)
+
+    report = {
+        "metadata": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "min_time": args.min_time,
+            "repeats": args.repeats,
+        },
+        "results": results,
+        "precision": precision,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    status = 0
+    precision_failures = [check for check in precision if not check["within_tolerance"]]
+    for check in precision_failures:
+        print(f"PRECISION {check['dtype']} w={check['width']} d={check['depth']}: "
+              f"max rel error {check['max_rel_error']:.2e}, loss rel error {check['loss_rel_error']:.2e} "
+              f"(tolerance {check['tolerance']:.0e})")
+    if precision_failures:
+        status = 1
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        for result, change in regressions:
+            print(f"REGRESSION {result['benchmark']} w={result['width']} d={result['depth']} "
+                  f"bs={result['batch_size']}: {change:+.1%}")
+        if regressions:
+            return 1
+        print(f"No regressions above {args.threshold:.0%} compared to {args.compare}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
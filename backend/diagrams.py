@@ -0,0 +1,93 @@
+# diagrams.py
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DIAGRAM_MIMETYPES = {
+    "svg": "image/svg+xml",
+    "png": "image/png",
+}
+
+
+class DiagramCache:
+    """
+    Ağ diyagramlarını (SVG/PNG byte'ları) katman boyutu yapısının özetine göre saklayan LRU önbellek.
+
+    Diyagram sadece katman boyutlarına ve çizim seçeneklerine bağlıdır (başlık da yapıdan
+    üretilir), bu yüzden aynı topolojideki farklı modeller aynı görüntüyü paylaşır.
+    Ağırlığa göre renklendirilmiş diyagramlar ağırlıklara bağlı olduğundan anahtara modelin
+    kimliği (model_id) ve version değeri de eklenir. version sadece o ağın kendi sayaçlarıdır,
+    aynı yapıdaki iki yeni model aynı version'a sahip olabilir; kimlik bu yüzden gereklidir.
+
+    Çizim tek bir kilit altında yapılır (matplotlib thread-safe değildir); aynı anahtar
+    için eşzamanlı istekler diyagramı bir kez çizer.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        if max_entries <= 0:
+            raise ValueError("max_entries pozitif olmalıdır.")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._render_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(network, format: str, max_neurons_per_layer: int, color_by_weight: bool,
+            model_id: Optional[str] = None) -> str:
+        """model_id verilmezse ağ nesnesinin kimliği kullanılır (sadece nesne yaşadığı sürece tekildir)."""
+        layer_sizes = [network.input_dim] + [layer.num_neurons for layer in network.layers]
+        parts = ["-".join(map(str, layer_sizes)), format, str(max_neurons_per_layer)]
+        if color_by_weight:
+            identity = model_id if model_id is not None else f"object:{id(network)}"
+            parts.append(f"weights:{identity}:{network.version}")
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()[:32]
+
+    def get_or_render(self, network, format: str = "svg", max_neurons_per_layer: int = 16,
+                      color_by_weight: bool = False, model_id: Optional[str] = None) -> Tuple[str, bytes]:
+        """(anahtar, görüntü byte'ları) döndürür; önbellekte yoksa çizer."""
+        key = self.key(network, format, max_neurons_per_layer, color_by_weight, model_id)
+        image = self._lookup(key)
+        if image is not None:
+            return key, image
+
+        with self._render_lock:
+            # Kilidi beklerken başka bir istek aynı diyagramı çizmiş olabilir
+            image = self._lookup(key, count=False)
+            if image is not None:
+                return key, image
+            from implementations.Visualizer import Visualizer
+
+            layer_sizes = [network.input_dim] + [layer.num_neurons for layer in network.layers]
+            visualizer = Visualizer(network, max_neurons_per_layer=max_neurons_per_layer,
+                                    color_by_weight=color_by_weight)
+            image = visualizer.render(format, title="-".join(map(str, layer_sizes)))
+
+        with self._lock:
+            self._entries[key] = image
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        logger.debug("Rendered %s diagram %s (%d bytes)", format, key, len(image))
+        return key, image
+
+    def _lookup(self, key: str, count: bool = True) -> Optional[bytes]:
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+            if count:
+                if image is not None:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+            return image
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
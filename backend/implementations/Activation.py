@@ -1,27 +1,283 @@
 import numpy as np
 import logging
 
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Kütüphane modülleri loglama yapılandırmasını (basicConfig) uygulamaya bırakır.
+# Logger bir kez alınır; hot path'te mesaj sadece DEBUG gerçekten açıksa formatlanır.
+logger = logging.getLogger(__name__)
+
+# Python float: NumPy skalerleri (np.float64) float32 dizilerle işlemde float64'e yükseltip
+# her çağrıda geçici bir dönüşüm buffer'ı ayırır, Python float'ları dizinin tipine uyar.
+_SQRT_2_OVER_PI = float(np.sqrt(2.0 / np.pi))
+_GELU_COEFF = 0.044715
+
+
+def _empty_like(z):
+    """out verilmediğinde sonuç dizisi (z skaler olsa bile ufunc'ların yazabileceği bir dizi)."""
+    z = np.asarray(z)
+    return np.empty(z.shape, dtype=np.result_type(z.dtype, np.float16))
 
 class Activation:
 
     # Nesne oluşturulmaya gerek kalmasın diye static method olarak tanımladım.
     
     def __init__(self):
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.logger.debug("Activation class initialized.")
 
+    # Tüm aktivasyonlar f(z, out=None) imzasını izler. out verilirse sonuç bu diziye
+    # yazılır (out, z'nin kendisi de olabilir) ve yeni dizi ayrılmaz; verilmezse
+    # sonuç için tek bir yeni dizi ayrılır. Ara sonuçlar da out üzerinde tutulur.
+
+    @staticmethod
+    def sigmoid(z, out=None):
+        """
+        Sayısal olarak kararlı sigmoid: sigmoid(z) = 0.5 * (1 + tanh(z / 2)).
+        1 / (1 + exp(-z)) büyük negatif z için exp taşmasına (overflow) yol açar;
+        tanh formu hiçbir z için taşmaz ve ara dizi gerektirmez.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sigmoid called with input: %s", z)
+        if out is None:
+            out = _empty_like(z)
+        out = np.multiply(z, 0.5, out=out)
+        np.tanh(out, out=out)
+        out += 1.0
+        out *= 0.5
+        return out
+
+    @staticmethod
+    def tanh(z, out=None):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Tanh called with input: %s", z)
+        if out is None:
+            out = _empty_like(z)
+        return np.tanh(z, out=out)
+
+    @staticmethod
+    def relu(z, out=None):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ReLU called with input: %s", z)
+        return np.maximum(z, 0, out=out)
+
+    @staticmethod
+    def leaky_relu(z, out=None, alpha: float = 0.01):
+        """leaky_relu(z) = z (z > 0), alpha * z (z <= 0). 0 < alpha < 1 varsayılır."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Leaky ReLU called with input: %s", z)
+        if out is None:
+            out = _empty_like(z)
+        if out is z:
+            # Yerinde: sadece negatif elemanlar alpha ile çarpılır
+            return np.multiply(z, alpha, out=z, where=z < 0)
+        out = np.multiply(z, alpha, out=out)
+        return np.maximum(z, out, out=out)
+
+    @staticmethod
+    def gelu(z, out=None):
+        """
+        GELU (tanh yaklaşımı):
+        gelu(z) = 0.5 * z * (1 + tanh(sqrt(2/pi) * (z + 0.044715 * z^3)))
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GELU called with input: %s", z)
+        if out is None:
+            out = _empty_like(z)
+        if out is z:
+            # Sonuç z'nin üzerine yazılacaksa z'ye formülün sonunda hâlâ ihtiyaç var
+            z = z.copy()
+        out = np.power(z, 3, out=out)
+        out *= _GELU_COEFF
+        out += z
+        out *= _SQRT_2_OVER_PI
+        np.tanh(out, out=out)
+        out += 1.0
+        out *= z
+        out *= 0.5
+        return out
+
+    @staticmethod
+    def softmax(z, out=None):
+        """
+        Son eksen üzerinde kararlı softmax: exp(z - max(z)) / sum(exp(z - max(z))).
+        Maksimumun çıkarılması exp taşmasını önler.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Softmax called with input: %s", z)
+        if out is None:
+            out = _empty_like(z)
+        out = np.subtract(z, np.max(z, axis=-1, keepdims=True), out=out)
+        np.exp(out, out=out)
+        out /= np.sum(out, axis=-1, keepdims=True)
+        return out
+
+    @staticmethod
+    def linear(z, out=None):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Linear called with input: %s", z)
+        if out is None or out is z:
+            return z
+        np.copyto(out, z)
+        return out
+
+    # --- Türevler (geri yayılım için) ---
+    # Hepsi aktivasyon öncesi lineer çıktı z'yi alır ve dA/dZ'yi eleman bazında döndürür.
+    # Aktivasyonlar gibi out= parametresiyle önceden ayrılmış buffer'a yazabilirler.
+    # Softmax eleman bazlı değildir (Jacobian tam matristir), bkz. softmax_backward.
+
+    @staticmethod
+    def sigmoid_derivative(z, out=None):
+        """sigmoid'(z) = s * (1 - s) = 0.25 * (1 - tanh(z / 2)^2)"""
+        if out is None:
+            out = _empty_like(z)
+        out = np.multiply(z, 0.5, out=out)
+        np.tanh(out, out=out)
+        np.square(out, out=out)
+        np.subtract(1.0, out, out=out)
+        out *= 0.25
+        return out
+
+    @staticmethod
+    def tanh_derivative(z, out=None):
+        """tanh'(z) = 1 - tanh(z)^2"""
+        if out is None:
+            out = _empty_like(z)
+        out = np.tanh(z, out=out)
+        np.square(out, out=out)
+        np.subtract(1.0, out, out=out)
+        return out
+
+    @staticmethod
+    def relu_derivative(z, out=None):
+        if out is None:
+            out = _empty_like(z)
+        np.greater(z, 0, out=out)
+        return out
+
+    @staticmethod
+    def leaky_relu_derivative(z, out=None, alpha: float = 0.01):
+        if out is None:
+            out = _empty_like(z)
+        np.greater(z, 0, out=out)
+        out *= 1.0 - alpha
+        out += alpha
+        return out
+
+    @staticmethod
+    def gelu_derivative(z, out=None):
+        """
+        u = sqrt(2/pi) * (z + 0.044715 * z^3), t = tanh(u)
+        gelu'(z) = 0.5 * (1 + t) + 0.5 * z * (1 - t^2) * sqrt(2/pi) * (1 + 3 * 0.044715 * z^2)
+        """
+        if out is None:
+            out = _empty_like(z)
+        if out is z:
+            z = z.copy()
+        t = np.power(z, 3, out=out)
+        t *= _GELU_COEFF
+        t += z
+        t *= _SQRT_2_OVER_PI
+        np.tanh(t, out=t)
+        # du = 0.5 * z * du/dz * (1 - t^2)  (tek ara dizi)
+        du = np.square(z)
+        du *= 3 * _GELU_COEFF
+        du += 1.0
+        du *= _SQRT_2_OVER_PI * 0.5
+        du *= z
+        du *= 1.0 - np.square(t)
+        # out = 0.5 * (1 + t) + du
+        t += 1.0
+        t *= 0.5
+        t += du
+        return t
+
+    @staticmethod
+    def linear_derivative(z, out=None):
+        if out is None:
+            return np.ones_like(z)
+        out.fill(1.0)
+        return out
+
+    @staticmethod
+    def softmax_backward(a, dA, out=None):
+        """
+        Softmax için Jacobian-vektör çarpımı: dZ = a * (dA - sum(dA * a, axis=-1)).
+        a softmax çıktısıdır (forward'da saklanan layer_activation).
+        """
+        out = np.multiply(dA, a, out=out)
+        dot = np.sum(out, axis=-1, keepdims=True)
+        np.subtract(dA, dot, out=out)
+        out *= a
+        return out
+
+    @staticmethod
+    def backward(activation_func, z, a, dA, out=None):
+        """
+        dA (kaybın aktivasyon çıktısına göre gradyanı) -> dZ (lineer çıktıya göre gradyan).
+        Eleman bazlı aktivasyonlarda dZ = dA * f'(z); softmax için Jacobian-vektör çarpımı kullanılır.
+        """
+        if activation_func is Activation.softmax:
+            return Activation.softmax_backward(a, dA, out=out)
+        out = Activation.derivative(activation_func)(z, out=out)
+        out *= dA
+        return out
+
+    @staticmethod
+    def supports_out(activation_func) -> bool:
+        """
+        Fonksiyon out= parametresini kabul ediyor mu. Bu sınıftaki aktivasyonlar kabul eder;
+        kullanıcının verdiği f(z) fonksiyonlarının kabul ettiği varsayılmaz.
+        """
+        name = getattr(activation_func, "__name__", None)
+        return name is not None and getattr(Activation, name, None) is activation_func
+
+    @staticmethod
+    def apply(activation_func, z, out=None):
+        """
+        activation_func(z) sonucunu out'a (verilmemişse yeni diziye) yazar. Bu sınıftaki
+        fonksiyonlar out= ile ek dizi ayırmadan çağrılır; diğerleri f(z) ile çağrılır ve
+        sonuç out'a kopyalanır.
+        """
+        if Activation.supports_out(activation_func):
+            return activation_func(z, out=out)
+        result = activation_func(z)
+        if out is None:
+            return result
+        np.copyto(out, result, casting='unsafe')
+        return out
+
     @staticmethod
-    def sigmoid(z):
-        logging.getLogger(__name__).debug(f"Sigmoid called with input: {z}")
-        return 1 / (1 + np.exp(-z))
+    def is_inplace_safe(activation_func) -> bool:
+        """
+        f(z, out=z) ek dizi ayırmadan çalışabiliyor mu. GELU sonucu hesaplarken z'ye
+        tekrar ihtiyaç duyduğu için yerinde çağrıldığında z'nin bir kopyasını alır;
+        out almayan kullanıcı fonksiyonları her çağrıda yeni dizi döndürür.
+        """
+        return Activation.supports_out(activation_func) and activation_func is not Activation.gelu
 
     @staticmethod
-    def relu(z):
-        logging.getLogger(__name__).debug(f"ReLU called with input: {z}")
-        return np.maximum(0, z)
+    def get(name: str):
+        """İsmi verilen aktivasyon fonksiyonunu döndürür (örn. "relu" -> Activation.relu)."""
+        activations = {
+            'sigmoid': Activation.sigmoid,
+            'tanh': Activation.tanh,
+            'relu': Activation.relu,
+            'leaky_relu': Activation.leaky_relu,
+            'gelu': Activation.gelu,
+            'softmax': Activation.softmax,
+            'linear': Activation.linear,
+        }
+        func = activations.get(name.lower())
+        if func is None:
+            raise ValueError(f"Geçersiz veya desteklenmeyen aktivasyon fonksiyonu: {name}")
+        return func
 
     @staticmethod
-    def linear(z):
-        logging.getLogger(__name__).debug(f"Linear called with input: {z}")
-        return z
+    def derivative(activation_func):
+        """
+        Verilen aktivasyon fonksiyonunun türevini döndürür.
+        Eşleştirme fonksiyon ismiyle yapılır (örn. relu -> relu_derivative).
+        """
+        derivative_func = getattr(Activation, f"{activation_func.__name__}_derivative", None)
+        if derivative_func is None:
+            raise ValueError(f"'{activation_func.__name__}' aktivasyonu için türev tanımlı değil.")
+        return derivative_func
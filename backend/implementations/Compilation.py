@@ -0,0 +1,192 @@
+import logging
+import numpy as np
+from typing import Callable, List, Optional, Tuple
+
+from .Activation import Activation
+from .Network import NeuralNetwork
+
+logger = logging.getLogger(__name__)
+
+
+# Aktivasyon çekirdekleri: z'nin üzerine yazarak çalışır ve sonucu döndürür. Sık kullanılanlar
+# Activation fonksiyonlarının log kontrolü ve out/None dallanması olmadan doğrudan ufunc çağırır;
+# diğerleri Activation.apply ile z'ye yazılır. linear için çekirdek yoktur (None).
+def _relu(z):
+    return np.maximum(z, 0, out=z)
+
+
+def _tanh(z):
+    return np.tanh(z, out=z)
+
+
+def _sigmoid(z):
+    z *= 0.5
+    np.tanh(z, out=z)
+    z += 1.0
+    z *= 0.5
+    return z
+
+
+_KERNELS = {
+    Activation.relu: _relu,
+    Activation.tanh: _tanh,
+    Activation.sigmoid: _sigmoid,
+    Activation.linear: None,
+}
+
+
+def activation_kernel(activation_func) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+    """Aktivasyonun yerinde çalışan çekirdeği (linear için None)."""
+    if activation_func in _KERNELS:
+        return _KERNELS[activation_func]
+    return lambda z: Activation.apply(activation_func, z, out=z)
+
+
+# Planın bir adımı: z = X @ weights + biases, ardından kernel(z)
+Step = Tuple[np.ndarray, np.ndarray, Optional[Callable[[np.ndarray], np.ndarray]]]
+
+
+class CompiledNetwork:
+    """
+    NeuralNetwork'ün sadece tahmin için derlenmiş hali: katmanlar düz bir
+    (weights, bias, aktivasyon çekirdeği) listesine çevrilir.
+
+    NeuralNetwork.predict her katmanda Layer.forward'a gider: girdi shape/dtype kontrolü,
+    cache/buffer dallanması, hook kontrolü ve Activation fonksiyonlarının log kontrolü
+    her çağrıda tekrar çalışır. Derlenmiş ağda shape'ler derleme sırasında bir kez
+    doğrulanır; predict sadece girdinin sütun sayısını kontrol edip her adımda bir matris
+    çarpımı, yerinde bias ekleme ve yerinde aktivasyon yapar. Küçük modellerde gecikme
+    Python yükü yerine matematik tarafından belirlenir.
+
+    Aktivasyonu linear olan katman sonraki katmanla birleştirilir:
+        (X W1 + b1) W2 + b2 = X (W1 W2) + (b1 W2 + b2)
+    Bu sadece daha ucuzsa yapılır (n x k ve k x m yerine n x m çarpım; örn. darboğaz
+    katmanları birleştirilmez). Birleştirilen ağırlıklar hesaplama tipinde ayrı dizilerdir,
+    diğer adımlar katmanların dizilerini kopyalamadan kullanır.
+
+    Ağ değiştiğinde (eğitim adımı, set_parameters, katman düzenleme) version değişir ve plan
+    bir sonraki predict'te yeniden derlenir. predict ara değer saklamaz ve paylaşılan buffer
+    kullanmaz, farklı thread'lerden güvenle çağrılabilir. Katman hook'ları çağrılmaz;
+    profil için NeuralNetwork.predict kullanılmalıdır (bkz. Profiler).
+    """
+
+    def __init__(self, network: NeuralNetwork, fold_linear: bool = True):
+        self.network = network
+        self.fold_linear = fold_linear
+        self.input_dim = network.input_dim
+        self.steps: List[Step] = []
+        self._version = None
+        self.compile()
+
+    def compile(self):
+        """Planı ağın şu anki haline göre (yeniden) oluşturur."""
+        network = self.network
+        if not network.layers:
+            raise RuntimeError("Ağa henüz hiçbir katman eklenmedi.")
+        version = network.version
+        dtype = network.compute_dtype
+
+        steps: List[Step] = []
+        expected_dim = network.input_dim
+        weights = biases = None
+        pending_linear = False
+        for layer in network.layers:
+            if layer.weights.shape != (expected_dim, layer.num_neurons) or layer.biases.shape != (layer.num_neurons,):
+                raise ValueError(
+                    f"'{layer.name}' katmanının parametre shape'leri ({layer.weights.shape}, {layer.biases.shape}) "
+                    f"ağın yapısıyla ({expected_dim}, {layer.num_neurons}) eşleşmiyor."
+                )
+            expected_dim = layer.num_neurons
+
+            if pending_linear and self._folding_is_cheaper(weights, layer.weights):
+                # Önceki linear adım bu katmana katlanır
+                layer_weights = layer.weights.astype(dtype, copy=False)
+                biases = biases.astype(dtype) @ layer_weights + layer.biases
+                weights = weights.astype(dtype) @ layer_weights
+            else:
+                if weights is not None:
+                    steps.append((weights, biases, None))
+                weights, biases = layer.weights, layer.biases
+
+            kernel = activation_kernel(layer.activation_function)
+            if kernel is None and self.fold_linear:
+                pending_linear = True
+                continue
+            steps.append((weights, biases, kernel))
+            weights = biases = None
+            pending_linear = False
+        if weights is not None:
+            steps.append((weights, biases, None))
+
+        self.steps = steps
+        self.output_dim = expected_dim
+        self.dtype = dtype
+        self._version = version
+        logger.debug("Compiled %s: %d layers -> %d steps", network.name, len(network.layers), len(steps))
+        return self
+
+    @staticmethod
+    def _folding_is_cheaper(first: np.ndarray, second: np.ndarray) -> bool:
+        """Satır başına çarpma sayısı: birleşik n*m, ayrı n*k + k*m."""
+        n, k = first.shape
+        m = second.shape[1]
+        return n * m <= n * k + k * m
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """NeuralNetwork.predict ile aynı arayüz: X shape (n, input_dim) veya (input_dim,)."""
+        if self.network.version != self._version:
+            self.compile()
+        if X.ndim not in (1, 2) or X.shape[-1] != self.input_dim:
+            raise ValueError(
+                f"Ağ girdisinin boyutu ({X.shape[-1] if X.ndim else 0}) beklenen boyutla "
+                f"({self.input_dim}) eşleşmiyor."
+            )
+        if X.dtype != self.dtype:
+            X = X.astype(self.dtype)
+        for weights, biases, kernel in self.steps:
+            X = X @ weights
+            X += biases
+            if kernel is not None:
+                X = kernel(X)
+        return X
+
+    __call__ = predict
+
+    @property
+    def nbytes(self) -> int:
+        """Sadece derlemenin ayırdığı (birleştirilmiş) dizilerin boyutu; katman dizileri paylaşılır."""
+        shared = {id(array) for layer in self.network.layers for array in (layer.weights, layer.biases)}
+        return sum(array.nbytes for weights, biases, _ in self.steps for array in (weights, biases)
+                   if id(array) not in shared)
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+
+# --- Örnek Kullanım (Test Amaçlı) ---
+if __name__ == '__main__':
+    import timeit
+
+    network = NeuralNetwork(input_dim=16, name="CompileExample")
+    network.add_layer(num_neurons=64, activation_func=Activation.relu)
+    network.add_layer(num_neurons=32, activation_func=Activation.linear)
+    network.add_layer(num_neurons=8, activation_func=Activation.tanh)
+    network.add_layer(num_neurons=1, activation_func=Activation.sigmoid)
+
+    compiled = network.compile()
+    print(f"{len(network.layers)} layers -> {len(compiled)} steps, extra memory {compiled.nbytes} bytes")
+
+    for rows in (1, 32, 1024):
+        X = np.random.rand(rows, 16)
+        diff = np.abs(compiled.predict(X) - network.predict(X)).max()
+        number = 20000 if rows < 1024 else 500
+        eager = min(timeit.repeat(lambda: network.predict(X), number=number, repeat=3)) / number
+        fused = min(timeit.repeat(lambda: compiled.predict(X), number=number, repeat=3)) / number
+        print(f"batch {rows:>5}: predict {eager * 1e6:8.1f} us, compiled {fused * 1e6:8.1f} us "
+              f"({eager / fused:.2f}x), max abs diff {diff:.2e}")
+
+    # Ağırlıklar değişince plan bir sonraki çağrıda yeniden derlenir
+    network.layers[0].weights *= 2
+    network.layers[0].mark_updated()
+    X = np.random.rand(4, 16)
+    print(f"After weight update, max abs diff {np.abs(compiled.predict(X) - network.predict(X)).max():.2e}")
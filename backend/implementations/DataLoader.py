@@ -0,0 +1,210 @@
+import itertools
+import numpy as np
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+Batch = Tuple[np.ndarray, np.ndarray]
+Columns = Union[int, Sequence[int]]
+
+
+class StreamingDataLoader:
+    """
+    Diskteki veri setini parça parça (chunk) okuyup mini-batch'ler üreten loader.
+
+    Veri hiçbir zaman tamamen belleğe alınmaz: her seferde en fazla bir chunk ve
+    karıştırma (shuffle) havuzu bellekte tutulur, bu yüzden tepe bellek veri setinin
+    boyutundan bağımsızdır. Her iterasyon (epoch) veriyi baştan okur, böylece
+    NeuralNetwork.fit'e doğrudan verilebilir:
+
+        loader = StreamingDataLoader.from_csv("data.csv", target_columns=-1, batch_size=64)
+        network.fit(loader, epochs=5)
+
+    Karıştırma sınırlı bir havuzla yapılır: her yeni chunk havuzdaki satırlarla
+    birlikte karıştırılır, havuzda shuffle_buffer kadar satır bir sonraki chunk'a
+    bırakılır ve geri kalanı batch'ler halinde verilir. shuffle_buffer=0 ise veri
+    dosyadaki sırasıyla okunur.
+    """
+
+    def __init__(self, chunk_reader, batch_size: int = 32, shuffle_buffer: int = 0,
+                 drop_last: bool = False, seed: Optional[int] = None):
+        """
+        chunk_reader: Çağrıldığında (X_chunk, y_chunk) çiftleri üreten bir iterator döndüren
+                      fonksiyon. Her epoch'ta yeniden çağrılır.
+        batch_size: Üretilecek mini-batch boyutu.
+        shuffle_buffer: Karıştırma havuzunda tutulacak satır sayısı (0: karıştırma yok).
+        drop_last: Son eksik batch atılsın mı.
+        seed: Karıştırma için rastgele sayı üreteci tohumu.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size pozitif olmalıdır.")
+        if shuffle_buffer < 0:
+            raise ValueError("shuffle_buffer negatif olamaz.")
+        self.chunk_reader = chunk_reader
+        self.batch_size = batch_size
+        self.shuffle_buffer = shuffle_buffer
+        self.drop_last = drop_last
+        self.rng = np.random.default_rng(seed)
+        # Özellik sütunu sayısı; biliniyorsa from_* tarafından veri okunmadan doldurulur
+        self.num_features: Optional[int] = None
+
+    @classmethod
+    def from_csv(cls, path: str, target_columns: Columns = -1, chunk_size: int = 10000,
+                 delimiter: str = ",", skip_header: int = 0, dtype=np.float32, **kwargs) -> "StreamingDataLoader":
+        """
+        CSV dosyasından okuyan loader. Dosya chunk_size satırlık parçalar halinde okunur.
+
+        target_columns: Hedef sütun(lar)ın indeksi; geri kalan sütunlar özellik olur.
+        skip_header: Dosyanın başında atlanacak satır sayısı (örn. başlık satırı için 1).
+        dtype: Batch'lerin veri tipi; ağın hesaplama tipiyle aynıysa batch'ler eğitimde tekrar çevrilmez.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size pozitif olmalıdır.")
+
+        def read_chunks():
+            with open(path, "r") as f:
+                for _ in range(skip_header):
+                    next(f, None)
+                while True:
+                    lines = list(itertools.islice(f, chunk_size))
+                    if not lines:
+                        return
+                    lines = [line for line in lines if line.strip()]
+                    if not lines:
+                        continue
+                    data = np.loadtxt(lines, delimiter=delimiter, dtype=dtype, ndmin=2)
+                    yield _split_columns(data, target_columns)
+
+        loader = cls(read_chunks, **kwargs)
+        # Genişlik sadece ilk dolu satırdan öğrenilir (dosya boşsa None kalır)
+        with open(path, "r") as f:
+            for _ in range(skip_header):
+                next(f, None)
+            first_line = next((line for line in f if line.strip()), None)
+        if first_line is not None:
+            loader.num_features = len(_feature_columns(len(first_line.split(delimiter)), target_columns))
+        return loader
+
+    @classmethod
+    def from_npy(cls, x_path: str, y_path: Optional[str] = None, target_columns: Columns = -1,
+                 chunk_size: int = 10000, shuffle_chunks: bool = True, dtype=np.float32,
+                 **kwargs) -> "StreamingDataLoader":
+        """
+        .npy dosya(lar)ından memory-mapped okuyan loader.
+
+        y_path verilirse özellikler x_path'ten, hedefler y_path'ten okunur; verilmezse
+        x_path tek bir (m, n) matristir ve hedefler target_columns ile ayrılır.
+        shuffle_chunks: Memmap rastgele erişime izin verdiği için, shuffle_buffer > 0
+                        olduğunda chunk'lar her epoch'ta rastgele sırayla okunur.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size pozitif olmalıdır.")
+        X_all = np.load(x_path, mmap_mode="r")
+        y_all = np.load(y_path, mmap_mode="r") if y_path is not None else None
+        if y_all is not None and y_all.shape[0] != X_all.shape[0]:
+            raise ValueError(f"X ({X_all.shape[0]}) ve y ({y_all.shape[0]}) örnek sayıları eşleşmiyor.")
+
+        loader = cls(None, **kwargs)
+        # Shape .npy başlığından gelir, veri okunmaz (boş dosyada None kalır)
+        if X_all.ndim == 2 and X_all.shape[0] > 0:
+            loader.num_features = (X_all.shape[1] if y_all is not None
+                                   else len(_feature_columns(X_all.shape[1], target_columns)))
+
+        def read_chunks():
+            starts = np.arange(0, X_all.shape[0], chunk_size)
+            if shuffle_chunks and loader.shuffle_buffer > 0:
+                loader.rng.shuffle(starts)
+            for start in starts:
+                end = min(start + chunk_size, X_all.shape[0])
+                # Sadece bu chunk diskten okunup belleğe kopyalanır
+                X_chunk = np.asarray(X_all[start:end], dtype=dtype)
+                if y_all is None:
+                    yield _split_columns(np.atleast_2d(X_chunk), target_columns)
+                else:
+                    yield X_chunk, np.asarray(y_all[start:end], dtype=dtype)
+
+        loader.chunk_reader = read_chunks
+        return loader
+
+    @classmethod
+    def from_arrays(cls, X: np.ndarray, y: np.ndarray, chunk_size: int = 10000, **kwargs) -> "StreamingDataLoader":
+        """Bellekteki (veya memmap) dizilerden aynı arayüzle batch üreten loader."""
+        def read_chunks():
+            for start in range(0, X.shape[0], chunk_size):
+                yield X[start:start + chunk_size], y[start:start + chunk_size]
+
+        loader = cls(read_chunks, **kwargs)
+        loader.num_features = X.shape[1]
+        return loader
+
+    def __iter__(self) -> Iterator[Batch]:
+        pool_X: Optional[np.ndarray] = None
+        pool_y: Optional[np.ndarray] = None
+
+        for X_chunk, y_chunk in self.chunk_reader():
+            if y_chunk.ndim == 1:
+                y_chunk = y_chunk.reshape(-1, 1)
+            if pool_X is None or pool_X.shape[0] == 0:
+                pool_X, pool_y = X_chunk, y_chunk
+            else:
+                pool_X = np.concatenate((pool_X, X_chunk))
+                pool_y = np.concatenate((pool_y, y_chunk))
+
+            if self.shuffle_buffer > 0:
+                order = self.rng.permutation(pool_X.shape[0])
+                pool_X, pool_y = pool_X[order], pool_y[order]
+
+            # Havuzda shuffle_buffer kadar satır bırakıp kalanını tam batch'ler halinde ver
+            ready = max(0, pool_X.shape[0] - self.shuffle_buffer)
+            ready -= ready % self.batch_size
+            for start in range(0, ready, self.batch_size):
+                yield pool_X[start:start + self.batch_size], pool_y[start:start + self.batch_size]
+            pool_X, pool_y = pool_X[ready:], pool_y[ready:]
+
+        if pool_X is None or pool_X.shape[0] == 0:
+            return
+        if self.shuffle_buffer > 0:
+            order = self.rng.permutation(pool_X.shape[0])
+            pool_X, pool_y = pool_X[order], pool_y[order]
+        for start in range(0, pool_X.shape[0], self.batch_size):
+            X_batch = pool_X[start:start + self.batch_size]
+            if self.drop_last and X_batch.shape[0] < self.batch_size:
+                return
+            yield X_batch, pool_y[start:start + self.batch_size]
+
+
+def _target_columns(n_columns: int, target_columns: Columns) -> List[int]:
+    targets: List[int] = [target_columns] if isinstance(target_columns, (int, np.integer)) else list(target_columns)
+    return [c % n_columns for c in targets]
+
+
+def _feature_columns(n_columns: int, target_columns: Columns) -> List[int]:
+    targets = _target_columns(n_columns, target_columns)
+    return [c for c in range(n_columns) if c not in targets]
+
+
+def _split_columns(data: np.ndarray, target_columns: Columns) -> Batch:
+    """(m, n) matrisi özellik ve hedef sütunlarına ayırır."""
+    n_columns = data.shape[1]
+    return data[:, _feature_columns(n_columns, target_columns)], data[:, _target_columns(n_columns, target_columns)]
+
+
+# --- Örnek Kullanım (Test Amaçlı) ---
+if __name__ == '__main__':
+    import os
+    import tempfile
+    import tracemalloc
+
+    # Sentetik bir veri seti .npy olarak diske yazılır, sonra memmap ile parça parça okunur
+    tmp_dir = tempfile.mkdtemp()
+    for rows in (100_000, 1_000_000):
+        data = np.random.rand(rows, 9)
+        data[:, -1] = data[:, :-1].sum(axis=1)
+        path = os.path.join(tmp_dir, f"data_{rows}.npy")
+        np.save(path, data)
+        del data
+
+        loader = StreamingDataLoader.from_npy(path, batch_size=64, chunk_size=10_000, shuffle_buffer=20_000)
+        tracemalloc.start()
+        batches = sum(1 for _ in loader)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{rows} rows -> {batches} batches, peak = {peak / 1024 / 1024:.1f} MiB")
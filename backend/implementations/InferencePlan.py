@@ -0,0 +1,201 @@
+import logging
+import numpy as np
+from typing import List, Optional
+
+from .Activation import Activation
+from .Network import NeuralNetwork
+
+logger = logging.getLogger(__name__)
+
+
+class InferencePlan:
+    """
+    Sabit bir batch boyutu için önceden ayrılmış buffer'larla tekrar tekrar tahmin yapar.
+
+    NeuralNetwork.predict her çağrıda her katman için yeni z/aktivasyon dizileri ayırır.
+    Plan ise her katmanın çıktı buffer'ını bir kez (batch_size, num_neurons) olarak ayırır
+    ve her çağrıda aynı buffer'lara yazar: matmul(out=), bias ekleme ve aktivasyon
+    (out=) yerinde yapılır. Sabit batch boyutunda kararlı durumda yeni dizi ayrılmaz.
+
+    Batch boyutu değişirse:
+      - daha küçük batch'ler buffer'ların ilk satırlarını kullanır,
+      - daha büyük batch'ler batch_size'lık parçalar halinde işlenir; sonuç için
+        (out verilmediyse) tek bir çıktı dizisi ayrılır.
+
+    Notlar:
+      - predict'in döndürdüğü dizi (out verilmediyse) planın kendi buffer'ıdır ve
+        bir sonraki çağrıda üzerine yazılır; saklanacaksa kopyalanmalı ya da out verilmelidir.
+      - Buffer'lar paylaşıldığı için bir plan aynı anda tek bir thread tarafından
+        kullanılmalıdır (thread başına bir plan oluşturun).
+      - Ağırlıklar her çağrıda katmanlardan okunur; eğitimle yerinde güncellenen
+        ağırlıklar plana otomatik yansır. Bias'lar (ve float16 ağlarda ağırlıkların float32
+        kopyaları) katmanın version'ı değiştiğinde yenilenir; ağırlıklar elle yerinde
+        değiştirilirse Layer.mark_updated çağrılmalıdır. Katman eklenir/çıkarılırsa plan
+        yeniden oluşturulmalıdır.
+      - Buffer'lar ağın hesaplama tipindedir (float16 ağda float32). Girdi farklı tipteyse
+        (örn. float64) planın girdi buffer'ına kopyalanarak çevrilir, yeni dizi ayrılmaz.
+      - NumPy broadcast'li iki girdili işlemlerde (örn. z += bias) her çağrıda geçici bir
+        iterasyon buffer'ı ayırır. Bu yüzden bias her satıra önceden kopyalanmış bir
+        (batch_size, num_neurons) karoda tutulur; softmax'ın satır maksimumu/toplamı da
+        plan buffer'larına yazılıp karoya kopyalanarak uygulanır.
+    """
+
+    # Yerinde (out=z) çağrıldığında geçici dizi ayıran aktivasyonlar z'yi ayrı bir buffer'da tutar:
+    # GELU z'yi kopyalar, leaky_relu negatif maske ayırır; softmax'ın z'si karo olarak kullanılır.
+    _SEPARATE_Z = (Activation.leaky_relu, Activation.softmax)
+
+    def __init__(self, network: NeuralNetwork, batch_size: int):
+        if not network.layers:
+            raise RuntimeError("Ağa henüz hiçbir katman eklenmedi.")
+        if batch_size <= 0:
+            raise ValueError("batch_size pozitif olmalıdır.")
+
+        self.network = network
+        self.batch_size = batch_size
+        self.layers = list(network.layers)
+        self.input_dim = network.input_dim
+        self.output_dim = self.layers[-1].num_neurons
+        self.dtype = network.compute_dtype
+        self._buffers: List[np.ndarray] = [
+            np.empty((batch_size, layer.num_neurons), dtype=self.dtype)
+            for layer in self.layers
+        ]
+        self._z_buffers: List[Optional[np.ndarray]] = [
+            None if (Activation.is_inplace_safe(layer.activation_function)
+                     and layer.activation_function not in self._SEPARATE_Z)
+            else np.empty((batch_size, layer.num_neurons), dtype=self.dtype)
+            for layer in self.layers
+        ]
+        # Bias karoları: her satırda katmanın bias'ı (bkz. _parameters)
+        self._bias_tiles: List[np.ndarray] = [
+            np.empty((batch_size, layer.num_neurons), dtype=self.dtype)
+            for layer in self.layers
+        ]
+        # Ağırlıkları hesaplama tipinde olmayan (float16) katmanlar için float32 kopyalar
+        self._weight_copies: List[Optional[np.ndarray]] = [
+            None if layer.weights.dtype == self.dtype
+            else np.empty(layer.weights.shape, dtype=self.dtype)
+            for layer in self.layers
+        ]
+        self._versions: List[Optional[int]] = [None] * len(self.layers)
+        # Softmax'ın satır maksimumu ve toplamı için
+        self._row_buffer = np.empty((batch_size, 1), dtype=self.dtype)
+        # Farklı tipteki girdiler için (ilk kullanımda ayrılır)
+        self._input_buffer: Optional[np.ndarray] = None
+
+    def _parameters(self, i: int):
+        """i. katmanın (ağırlık, bias karosu); katmanın version'ı değiştiyse yenilenir."""
+        layer = self.layers[i]
+        weights = self._weight_copies[i]
+        if self._versions[i] != layer.version:
+            np.copyto(self._bias_tiles[i], layer.biases)
+            if weights is not None:
+                np.copyto(weights, layer.weights)
+            self._versions[i] = layer.version
+        return (layer.weights if weights is None else weights), self._bias_tiles[i]
+
+    def _softmax(self, z: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Activation.softmax ile aynı sonuç; z karo olarak kullanılır (üzerine yazılır)."""
+        row = self._row_buffer[:z.shape[0]]
+        np.maximum.reduce(z, axis=1, keepdims=True, out=row)
+        np.copyto(out, row)
+        np.subtract(z, out, out=out)
+        np.exp(out, out=out)
+        np.add.reduce(out, axis=1, keepdims=True, out=row)
+        np.copyto(z, row)
+        return np.divide(out, z, out=out)
+
+    def _run(self, X: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+        """X.shape[0] <= batch_size olan tek bir parça için ileri yayılım."""
+        rows = X.shape[0]
+        full = rows == self.batch_size
+        if X.dtype != self.dtype:
+            if self._input_buffer is None:
+                self._input_buffer = np.empty((self.batch_size, self.input_dim), dtype=self.dtype)
+            current = self._input_buffer[:rows]
+            np.copyto(current, X, casting='unsafe')
+        else:
+            current = X
+        last = len(self.layers) - 1
+        for i, layer in enumerate(self.layers):
+            if i == last and out is not None:
+                buffer = out
+            else:
+                buffer = self._buffers[i] if full else self._buffers[i][:rows]
+            z = self._z_buffers[i]
+            if z is None:
+                z = buffer
+            elif not full:
+                z = z[:rows]
+            weights, bias_tile = self._parameters(i)
+            np.matmul(current, weights, out=z)
+            np.add(z, bias_tile if full else bias_tile[:rows], out=z)
+            if layer.activation_function is Activation.softmax:
+                self._softmax(z, buffer)
+            else:
+                Activation.apply(layer.activation_function, z, out=buffer)
+            current = buffer
+        return current
+
+    def predict(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        X: shape (n, input_dim) veya tek örnek için (input_dim,).
+        out: opsiyonel (n, output_dim) çıktı dizisi. Verilirse sonuç buraya yazılır.
+        """
+        single = X.ndim == 1
+        if single:
+            X = X.reshape(1, -1)
+        if X.ndim != 2 or X.shape[1] != self.input_dim:
+            raise ValueError(
+                f"Ağ girdisinin boyutu ({X.shape[-1] if X.ndim else 0}) beklenen boyutla "
+                f"({self.input_dim}) eşleşmiyor."
+            )
+        rows = X.shape[0]
+        if out is not None and out.shape != (rows, self.output_dim):
+            raise ValueError(f"out shape'i ({rows}, {self.output_dim}) olmalıdır, gelen: {out.shape}.")
+
+        if rows <= self.batch_size:
+            result = self._run(X, out)
+        else:
+            logger.debug("Batch size %d exceeds plan batch size %d, running in chunks.", rows, self.batch_size)
+            result = out if out is not None else np.empty((rows, self.output_dim), dtype=self.dtype)
+            for start in range(0, rows, self.batch_size):
+                end = min(start + self.batch_size, rows)
+                self._run(X[start:end], result[start:end])
+
+        return result[0] if single else result
+
+    __call__ = predict
+
+
+# --- Örnek Kullanım (Test Amaçlı) ---
+if __name__ == '__main__':
+    import tracemalloc
+
+    network = NeuralNetwork(input_dim=64, name="PlanExample")
+    network.add_layer(num_neurons=256, activation_func=Activation.relu)
+    network.add_layer(num_neurons=128, activation_func=Activation.gelu)
+    network.add_layer(num_neurons=10, activation_func=Activation.sigmoid)
+
+    batch = np.random.rand(32, 64)
+    plan = InferencePlan(network, batch_size=32)
+    print(f"Max abs diff vs predict: {np.abs(plan.predict(batch) - network.predict(batch)).max():.3e}")
+
+    # Kararlı durumda ayrılan bellek. NeuralNetwork.predict her çağrıda katman başına yeni
+    # diziler ayırır, bu yüzden tepe değeri batch boyutuyla büyür. Plan yeni dizi ayırmaz;
+    # görülen birkaç yüz byte'lık tepe değeri NumPy'ın ufunc çağrılarının kendi küçük
+    # nesneleridir, batch boyutundan bağımsızdır (bkz. tests/test_inference_plan.py).
+    for rows in (32, 1024):
+        big_batch = np.random.rand(rows, 64)
+        big_plan = InferencePlan(network, batch_size=rows)
+        for name, func in (("InferencePlan.predict", big_plan.predict), ("NeuralNetwork.predict", network.predict)):
+            func(big_batch)
+            tracemalloc.start()
+            for _ in range(100):
+                func(big_batch)
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{name} (batch {rows}): retained = {current} bytes, peak = {peak} bytes")
+
+    print(f"Smaller batch (5 rows): {plan.predict(batch[:5]).shape}")
+    print(f"Larger batch (100 rows): {plan.predict(np.random.rand(100, 64)).shape}")
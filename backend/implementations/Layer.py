@@ -1,15 +1,45 @@
+import time
 import numpy as np
-from typing import List, Callable, Optional
+from typing import List, Callable, Optional, Dict
 from .Neuron import Neuron
+from .Activation import Activation
+
+# Desteklenen parametre veri tipleri. float16 sadece depolama içindir: hesaplamalar
+# (matris çarpımı birikimi, aktivasyonlar, gradyanlar) float32'de yapılır.
+SUPPORTED_DTYPES = (np.dtype(np.float16), np.dtype(np.float32), np.dtype(np.float64))
+
+
+def resolve_dtype(dtype) -> np.dtype:
+    """dtype'ı (isim veya numpy tipi) doğrular ve np.dtype olarak döndürür."""
+    try:
+        dtype = np.dtype(dtype)
+    except TypeError:
+        raise ValueError(f"Geçersiz veri tipi: {dtype}")
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError(f"Desteklenmeyen veri tipi: {dtype}. Desteklenenler: float16, float32, float64.")
+    return dtype
+
+
+def compute_dtype_for(dtype) -> np.dtype:
+    """Verilen depolama tipindeki parametrelerle hesap yapılacak tip (float16 -> float32)."""
+    dtype = np.dtype(dtype)
+    return np.dtype(np.float32) if dtype == np.float16 else dtype
+
 
 class Layer:
 
-    def __init__(self, num_neurons, input_dim, activation_func, name):
+    def __init__(self, num_neurons, input_dim, activation_func, name,
+                 weights: Optional[np.ndarray] = None, biases: Optional[np.ndarray] = None,
+                 dtype=np.float32):
         """
         num_neurons Bu katmanda bulunacak nöron sayısı.
         input_dim Bu katmana gelen girdi sayısı (önceki katmanın nöron sayısı veya ilk katman için özellik sayısı).
         activation_func  Bu katmandaki tüm nöronlar için kullanılacak varsayılan aktivasyon fonksiyonu.
         name opsiyonel isim.
+        weights, biases opsiyonel hazır parametreler (örn. dosyadan yüklenen, memmap olabilir).
+                 Verilirse rastgele başlatma yapılmaz ve diziler kopyalanmadan kullanılır.
+        dtype parametrelerin veri tipi (float32 varsayılan, float16 veya float64).
+                 weights verilirse dtype onların tipinden alınır.
         """
         if num_neurons <= 0:
             raise ValueError("Nöron sayısı pozitif olmalıdır.")
@@ -21,10 +51,24 @@ class Layer:
         self.activation_function = activation_func
         self.name = name if name else f"Layer_{num_neurons}neurons"
 
-        self.neurons: List[Neuron] = [
-            Neuron(input_dim=self.input_dim, activation_func=self.activation_function)
-            for _ in range(self.num_neurons)
-        ]
+        # Katmanın tüm ağırlıkları tek ve bitişik (contiguous) bir matriste tutulur.
+        # weights shape: (input_dim, num_neurons) -> j. sütun j. nöronun ağırlıkları
+        # biases shape: (num_neurons,)
+        # Böylece katmanın çıktısı nöron başına np.dot yerine tek bir matris çarpımıyla hesaplanır.
+        # Neuron nesneleri artık hesaplamada kullanılmıyor, sadece geriye dönük uyumluluk
+        # ve inceleme için katman matrislerine bakan view'lar olarak ilk erişimde oluşturuluyor.
+        self._neurons: Optional[List[Neuron]] = None
+
+        # Ağırlıklar her değiştiğinde artan sayaç (set_parameters, optimizer adımı).
+        # Tahmin önbellekleri gibi ağırlıklardan türetilen sonuçları geçersiz kılmak için kullanılır.
+        self.version = 0
+
+        if weights is None:
+            dtype = resolve_dtype(dtype)
+            weights = (np.random.randn(self.input_dim, self.num_neurons) * 0.01).astype(dtype)
+        if biases is None:
+            biases = np.zeros(self.num_neurons, dtype=weights.dtype)
+        self.set_parameters(weights, biases)
 
         # bunları şunun için ekledim: eğer bir katman 
         # ilk katman ise, ilk katmanın nöronları için ağırlıklar ve bias'lar
@@ -35,47 +79,270 @@ class Layer:
         self.is_output_layer: bool = False
 
         self.last_input: Optional[np.ndarray] = None # Bu katmana gelen son girdi (A_prev)
+        self.z: Optional[np.ndarray] = None # Aktivasyon öncesi lineer çıktı (Z)
         self.layer_activation: Optional[np.ndarray] = None # Bu katmanın çıktısı (A)
 
-    def forward(self, inputs):
+        # Geri yayılımda hesaplanan gradyanlar. İlk backward çağrısında bir kez
+        # oluşturulur ve sonraki adımlarda aynı buffer'lara yazılır.
+        self.dW: Optional[np.ndarray] = None
+        self.db: Optional[np.ndarray] = None
+
+        # Eğitim sırasında her batch için yeniden ayrılmaması gereken ara diziler
+        # (z, aktivasyon, dZ, dA_prev). Bkz. _buffer.
+        self._buffers: Dict[str, np.ndarray] = {}
+
+        # Profil hook'ları (bkz. add_hook). Boşsa forward/backward'a ek maliyet getirmez.
+        self._hooks: List[Callable] = []
+        # Katmanın kendi ayırdığı dizilerin toplam boyutu (byte); hook'lara çağrı başına fark verilir
+        self._allocated_bytes = 0
+
+    @property
+    def neurons(self) -> List[Neuron]:
+        """Katmandaki nöronlar. Her biri weights/biases dizilerinin ilgili kısmına bakan bir view'dır."""
+        if self._neurons is None:
+            self._neurons = [
+                Neuron(input_dim=self.input_dim,
+                       activation_func=self.activation_function,
+                       weights=self.weights[:, j],
+                       bias=self.biases[j:j + 1])
+                for j in range(self.num_neurons)
+            ]
+        return self._neurons
+
+    def add_hook(self, hook: Callable):
+        """
+        Her forward/backward çağrısından sonra çağrılacak bir fonksiyon ekler:
+            hook(layer, phase, rows, output_shape, seconds, allocated_bytes)
+        phase "forward" veya "backward"; output_shape backward'da dA_prev'in shape'idir
+        (ilk katmanda None). allocated_bytes çağrı sırasında katmanın ayırdığı dizilerin
+        boyutudur (NumPy'nin ara geçici dizileri dahil değildir). Bkz. Profiler.
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable):
+        if hook in self._hooks:
+            self._hooks.remove(hook)
+
+    def _run_hooks(self, phase: str, rows: int, output: Optional[np.ndarray], start: float, allocated: int):
+        seconds = time.perf_counter() - start
+        shape = output.shape if output is not None else None
+        for hook in list(self._hooks):
+            hook(self, phase, rows, shape, seconds, self._allocated_bytes - allocated)
+
+    def forward(self, inputs, cache: bool = True, reuse_buffers: bool = False):
+        if not self._hooks:
+            return self._forward(inputs, cache, reuse_buffers)
+        start, allocated = time.perf_counter(), self._allocated_bytes
+        output = self._forward(inputs, cache, reuse_buffers)
+        self._run_hooks("forward", inputs.shape[0] if inputs.ndim == 2 else 1, output, start, allocated)
+        return output
+
+    def _forward(self, inputs, cache: bool = True, reuse_buffers: bool = False):
         """
         inputs : Önceki katmandan gelen aktivasyonlar (A_prev).
-                 Shape (input_dim,) olmalıdır (tek örnek için).
-                 (Batch processing için (batch_size, input_dim) gerekir
-                  ama şimdilik tek örnek varsayalım).
+                 Tek örnek için shape (input_dim,),
+                 mini-batch için shape (batch_size, input_dim) olmalıdır.
+        cache : True ise girdi, z ve çıktı geri yayılım için katmanda saklanır.
+                Sadece tahmin yapılırken False verilir; böylece aynı model üzerinde
+                eşzamanlı tahminler (veya tahmin + eğitim) birbirinin durumunu ezmez.
+        reuse_buffers : True ise z ve aktivasyon katmanın önceden ayrılmış buffer'larına
+                yazılır (eğitim döngüsü için). Dönen dizi bir sonraki forward çağrısında
+                üzerine yazılır, saklanacaksa kopyalanmalıdır.
 
         Returns:
-        Bu katmandaki tüm nöronların aktivasyon değerlerini içeren vektör (A). Shape (num_neurons,).
+        Bu katmandaki tüm nöronların aktivasyon değerleri (A).
+        Tek örnek için shape (num_neurons,), batch için (batch_size, num_neurons).
         """
-        if inputs.shape[0] != self.input_dim:
+        if inputs.ndim not in (1, 2) or inputs.shape[-1] != self.input_dim:
              raise ValueError(
-                 f"'{self.name}' için girdi boyutu ({inputs.shape[0]}) "
+                 f"'{self.name}' için girdi boyutu ({inputs.shape[-1] if inputs.ndim else 0}) "
                  f"beklenen boyutla ({self.input_dim}) eşleşmiyor."
              )
+        if inputs.dtype != self.compute_dtype:
+            # Hesaplama katmanın tipinde yapılır (örn. float64 girdi float32 ağda float32'ye çevrilir)
+            inputs = inputs.astype(self.compute_dtype)
+            self._allocated_bytes += inputs.nbytes
+
+        # Tüm katman (ve tüm batch) tek bir matris çarpımıyla: Z = X . W + b
+        if reuse_buffers and inputs.ndim == 2:
+            rows = inputs.shape[0]
+            z = np.matmul(inputs, self.weights, out=self._buffer('z', rows, self.num_neurons))
+            z += self.biases
+            activation = Activation.apply(self.activation_function, z, out=self._buffer('a', rows, self.num_neurons))
+        elif cache:
+            z = inputs @ self.weights + self.biases
+            activation = self.activation_function(z)
+            self._allocated_bytes += z.nbytes + activation.nbytes
+        else:
+            # z geri yayılım için gerekmiyor, aktivasyon z'nin üzerine yazılır
+            z = inputs @ self.weights
+            z += self.biases
+            activation = Activation.apply(self.activation_function, z, out=z)
+            self._allocated_bytes += z.nbytes
+
+        if cache:
+            self.last_input = inputs # Geri yayılım için saklanır
+            self.z = z
+            self.layer_activation = activation
+
+        return activation
+
+    def set_parameters(self, weights: np.ndarray, biases: np.ndarray):
+        """
+        Katmanın ağırlık matrisini ve bias vektörünü verilen dizilerle değiştirir (kopyalamadan).
+        Diziler memmap veya paylaşımlı bellek üzerindeki view'lar olabilir. Katmanın veri tipi
+        (dtype) ve hesaplama tipi (compute_dtype) ağırlıkların tipinden belirlenir.
+        """
+        if weights.shape != (self.input_dim, self.num_neurons):
+            raise ValueError(
+                f"'{self.name}' için ağırlık shape'i {weights.shape}, "
+                f"beklenen ({self.input_dim}, {self.num_neurons})."
+            )
+        if biases.shape != (self.num_neurons,):
+            raise ValueError(
+                f"'{self.name}' için bias shape'i {biases.shape}, beklenen ({self.num_neurons},)."
+            )
+        dtype = resolve_dtype(weights.dtype)
+        if biases.dtype != dtype:
+            raise ValueError(f"'{self.name}' için bias tipi ({biases.dtype}) ağırlık tipiyle ({dtype}) aynı olmalıdır.")
+        self.weights = weights
+        self.biases = biases
+        self.dtype = dtype
+        self.compute_dtype = compute_dtype_for(dtype)
+        self.mark_updated()
+        # Gradyanlar hesaplama tipinde tutulur; tip değiştiyse eski buffer'lar kullanılamaz
+        dW = getattr(self, 'dW', None)
+        if dW is not None and (dW.shape != weights.shape or dW.dtype != self.compute_dtype):
+            self.dW = self.db = None
+        # Eski dizilere bakan nöron view'ları geçersiz oldu
+        self._neurons = None
+
+    def resize(self, num_neurons: Optional[int] = None, input_dim: Optional[int] = None):
+        """
+        Katmanın nöron sayısını ve/veya girdi boyutunu yerinde değiştirir (ağ düzenleme için).
+        Mevcut ağırlıkların örtüşen kısmı korunur. Yeni nöronların (sütunların) ağırlıkları
+        __init__'teki gibi küçük rastgele değerlerle, bias'ları sıfırla başlatılır; yeni
+        girdilerin (satırların) mevcut nöronlara ağırlıkları sıfırdır, yani eklenen girdiler
+        katmanın çıktısını değiştirmez. Çıkarılan nöron/girdiler sondan kesilir.
+        """
+        num_neurons = self.num_neurons if num_neurons is None else num_neurons
+        input_dim = self.input_dim if input_dim is None else input_dim
+        if num_neurons <= 0:
+            raise ValueError("Nöron sayısı pozitif olmalıdır.")
+        if input_dim <= 0:
+            raise ValueError("Girdi boyutu pozitif olmalıdır.")
+        if (num_neurons, input_dim) == (self.num_neurons, self.input_dim):
+            return
+
+        keep_rows, keep_cols = min(input_dim, self.input_dim), min(num_neurons, self.num_neurons)
+        weights = np.zeros((input_dim, num_neurons), dtype=self.dtype)
+        weights[:keep_rows, :keep_cols] = self.weights[:keep_rows, :keep_cols]
+        if num_neurons > self.num_neurons:
+            weights[:, self.num_neurons:] = np.random.randn(input_dim, num_neurons - self.num_neurons) * 0.01
+        biases = np.zeros(num_neurons, dtype=self.dtype)
+        biases[:keep_cols] = self.biases[:keep_cols]
+
+        self.num_neurons, self.input_dim = num_neurons, input_dim
+        self.set_parameters(weights, biases)
+        self.reset_state()
+
+    def reset_state(self):
+        """
+        Eğitim durumunu bırakır: saklanan ara değerler, gradyanlar ve buffer'lar. Katmanın
+        shape'i, tipi veya aktivasyonu değiştiğinde eskileri geçersizdir; gerektiğinde yeniden ayrılır.
+        """
+        self.last_input = self.z = self.layer_activation = None
+        self.dW = self.db = None
+        self._buffers.clear()
+
+    def mark_updated(self):
+        """
+        Ağırlıkların değiştiğini bildirir (version'ı artırır). Optimizer'lar her adımdan sonra
+        çağırır; weights/biases dizileri elle yerinde değiştirilirse de çağrılmalıdır.
+        """
+        self.version += 1
 
-        self.last_input = inputs # Geri yayılım için saklanabilir
+    def backward(self, dA: np.ndarray, wrt_z: bool = False) -> Optional[np.ndarray]:
+        if not self._hooks:
+            return self._backward(dA, wrt_z)
+        start, allocated = time.perf_counter(), self._allocated_bytes
+        dA_prev = self._backward(dA, wrt_z)
+        self._run_hooks("backward", dA.shape[0] if dA.ndim == 2 else 1, dA_prev, start, allocated)
+        return dA_prev
 
-        # Her nöron için ileri yayılımı hesapla ve sonuçları topla
-        activations = [neuron.forward(inputs) for neuron in self.neurons]
+    def _backward(self, dA: np.ndarray, wrt_z: bool = False) -> Optional[np.ndarray]:
+        """
+        Katman üzerinden geri yayılım. forward() sırasında saklanan last_input ve z kullanılır.
+
+        dA : Kaybın bu katmanın çıktısına göre gradyanı. Shape (batch_size, num_neurons).
+        wrt_z : True ise dA zaten kaybın z'ye göre gradyanıdır (dZ) ve aktivasyon türevi
+                uygulanmaz (örn. softmax + çapraz entropi birleştirilmiş kayıplar).
+
+        dW ve db gradyanlarını self.dW / self.db buffer'larına yazar.
+
+        Returns:
+        Kaybın bu katmanın girdisine göre gradyanı (dA_prev), shape (batch_size, input_dim).
+        İlk katmanda bu değere ihtiyaç olmadığı için hesaplanmaz ve None döner.
+        """
+        if self.last_input is None or self.z is None:
+            raise RuntimeError(f"'{self.name}' için backward çağrılmadan önce forward çalıştırılmalıdır.")
+
+        A_prev = self.last_input if self.last_input.ndim == 2 else self.last_input.reshape(1, -1)
+        dA = dA if dA.ndim == 2 else dA.reshape(1, -1)
+        z = self.z if self.z.ndim == 2 else self.z.reshape(1, -1)
+        a = self.layer_activation if self.layer_activation.ndim == 2 else self.layer_activation.reshape(1, -1)
+        rows = A_prev.shape[0]
 
-        # Sonuçları NumPy dizisine çevir
-        self.layer_activation = np.array(activations)
+        # dZ = dA * g'(Z)  (softmax için Jacobian-vektör çarpımı)
+        if wrt_z:
+            dZ = dA
+        else:
+            dZ = Activation.backward(self.activation_function, z, a, dA,
+                                     out=self._buffer('dZ', rows, self.num_neurons))
+
+        if self.dW is None:
+            self.dW = np.zeros(self.weights.shape, dtype=self.compute_dtype)
+            self.db = np.zeros(self.biases.shape, dtype=self.compute_dtype)
+            self._allocated_bytes += self.dW.nbytes + self.db.nbytes
+
+        # dW = A_prev^T . dZ,  db = sum(dZ)
+        np.matmul(A_prev.T, dZ, out=self.dW)
+        np.sum(dZ, axis=0, out=self.db)
+
+        if self.is_first_layer:
+            return None
+        # dA_prev = dZ . W^T
+        return np.matmul(dZ, self.weights.T, out=self._buffer('dA_prev', rows, self.input_dim))
+
+    def _buffer(self, name: str, rows: int, cols: int) -> np.ndarray:
+        """
+        (rows, cols) shape'inde, hesaplama tipinde yeniden kullanılabilir bir dizi döndürür. Buffer sadece
+        daha fazla satır gerektiğinde veya sütun sayısı/dtype değiştiğinde yeniden ayrılır;
+        daha küçük batch'ler (örn. epoch'un son batch'i) mevcut buffer'ın ilk satırlarını kullanır.
+        """
+        buffer = self._buffers.get(name)
+        if (buffer is None or buffer.shape[0] < rows or buffer.shape[1] != cols
+                or buffer.dtype != self.compute_dtype):
+            buffer = np.empty((rows, cols), dtype=self.compute_dtype)
+            self._buffers[name] = buffer
+            self._allocated_bytes += buffer.nbytes
+        return buffer[:rows]
 
-        return self.layer_activation
+    def parameters(self):
+        """Optimizer'ların güncelleyeceği (parametre, gradyan) çiftleri."""
+        return [(self.weights, self.dW), (self.biases, self.db)]
 
     def __str__(self):
         """Katman hakkında bilgi veren string temsili."""
         layer_type = " (Output)" if self.is_output_layer else (" (First Hidden)" if self.is_first_layer else "")
         return (f"Layer(Name: {self.name}{layer_type}, Neurons: {self.num_neurons}, "
                 f"Input Dim: {self.input_dim}, "
-                f"Activation: {self.activation_function.__name__})")
+                f"Activation: {self.activation_function.__name__}, dtype: {self.dtype})")
 
     def get_weights(self) -> np.ndarray:
         """Katmanın ağırlık matrisini döndürür (shape: input_dim, num_neurons)."""
-        # Her nöronun ağırlık vektörünü sütun olarak birleştir
-        return np.array([neuron.weights for neuron in self.neurons]).T
+        return self.weights.copy()
 
     def get_biases(self) -> np.ndarray:
         """Katmanın bias vektörünü döndürür (shape: 1, num_neurons)."""
-        # Her nöronun bias'ını birleştir
-        return np.array([[neuron.bias for neuron in self.neurons]])
\ No newline at end of file
+        return self.biases.reshape(1, -1).copy()
@@ -2,12 +2,40 @@
 
 import numpy as np
 import logging
-from typing import Optional # Gerekirse kullanılabilir
+import threading
+from typing import Optional, Tuple # Gerekirse kullanılabilir
 
-# Eğer bu dosya ayrı çalıştırılırsa veya başka yerden import edilirse diye
-# temel loglama yapılandırmasının ayarlandığından emin olalım.
-# Ana uygulama dosyanızda (örn: app.py) zaten yapıyorsanız bu tekrar gerekmeyebilir.
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Loglama yapılandırması (basicConfig) ana uygulamaya (örn: app.py) bırakılır.
+# Logger modül seviyesinde bir kez alınır, debug mesajları sadece DEBUG açıkken formatlanır.
+logger = logging.getLogger(__name__)
+
+# value_and_grad fonksiyonlarının ara sonuçları için thread başına yeniden kullanılan buffer'lar.
+# Eğitim eşzamanlı thread'lerde çalışabildiği için (JobManager, sweep) buffer'lar paylaşılmaz.
+_scratch_local = threading.local()
+
+
+def _scratch(name: str, shape, dtype) -> np.ndarray:
+    """
+    Verilen shape/dtype'ta geçici bir dizi döndürür. Altta yatan düz buffer sadece
+    daha büyük bir boyut gerektiğinde yeniden ayrılır (epoch'un son, küçük batch'i eskisini kullanır).
+    """
+    buffers = getattr(_scratch_local, "buffers", None)
+    if buffers is None:
+        buffers = _scratch_local.buffers = {}
+    size = int(np.prod(shape))
+    buffer = buffers.get(name)
+    if buffer is None or buffer.size < size or buffer.dtype != dtype:
+        buffer = np.empty(size, dtype=dtype)
+        buffers[name] = buffer
+    return buffer[:size].reshape(shape)
+
+
+def _grad_buffer(y_pred: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+    if out is None:
+        return np.empty(y_pred.shape, dtype=np.result_type(y_pred.dtype, np.float16))
+    if out.shape != y_pred.shape:
+        raise ValueError(f"out shape'i {y_pred.shape} olmalıdır, gelen: {out.shape}.")
+    return out
 
 class Loss:
     """
@@ -23,7 +51,7 @@ class Loss:
             epsilon (float): Özellikle logaritmik kayıplarda sayısal kararlılığı
                              korumak için kullanılan küçük bir değer (örn. log(0) önlemek için).
         """
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.logger.debug("Loss class initialized.")
         # Epsilon'u sınıf içinde saklamak yerine doğrudan metotlara parametre olarak
         # vermek daha iyi olabilir, ancak buradaki yapıya uyalım.
@@ -45,22 +73,24 @@ class Loss:
         Returns:
             float: Hesaplanan ortalama kare hata değeri.
         """
-        logger = logging.getLogger(__name__) # Statik metot içinde logger'ı al
+        debug = logger.isEnabledFor(logging.DEBUG)
         m = y_true.shape[0] # Örnek sayısı
         if m == 0:
             logger.warning("MSE: Hesaplama için sıfır örnek alındı.")
             return 0.0
 
-        logger.debug(f"MSE calculating with y_pred shape {y_pred.shape} and y_true shape {y_true.shape}")
+        if debug:
+            logger.debug("MSE calculating with y_pred shape %s and y_true shape %s", y_pred.shape, y_true.shape)
         if y_pred.shape != y_true.shape:
-             logger.warning(f"MSE: y_pred shape {y_pred.shape} and y_true shape {y_true.shape} differ.")
+             logger.warning("MSE: y_pred shape %s and y_true shape %s differ.", y_pred.shape, y_true.shape)
              # Hata vermek yerine uyarı verip devam etmeyi deneyebilir veya hata fırlatabiliriz.
              # Şimdilik devam edelim, numpy broadcasting belki halleder ama riskli.
              # raise ValueError("y_pred ve y_true şekilleri farklı olamaz.")
 
         cost = np.sum(np.square(y_pred - y_true)) / (2 * m)
         cost = float(np.squeeze(cost)) # Skaler değere dönüştürmeyi garanti et
-        logger.debug(f"MSE calculated: {cost}")
+        if debug:
+            logger.debug("MSE calculated: %s", cost)
         return cost
 
     @staticmethod
@@ -81,31 +111,252 @@ class Loss:
         Returns:
             float: Hesaplanan ikili çapraz entropi değeri.
         """
-        logger = logging.getLogger(__name__) # Statik metot içinde logger'ı al
+        debug = logger.isEnabledFor(logging.DEBUG)
         m = y_true.shape[0]
         if m == 0:
             logger.warning("BCE: Hesaplama için sıfır örnek alındı.")
             return 0.0
 
-        logger.debug(f"BCE calculating with y_pred shape {y_pred.shape}, y_true shape {y_true.shape}, epsilon {epsilon}")
+        if debug:
+            logger.debug("BCE calculating with y_pred shape %s, y_true shape %s, epsilon %s", y_pred.shape, y_true.shape, epsilon)
         if y_pred.shape != y_true.shape:
-             logger.warning(f"BCE: y_pred shape {y_pred.shape} and y_true shape {y_true.shape} differ.")
+             logger.warning("BCE: y_pred shape %s and y_true shape %s differ.", y_pred.shape, y_true.shape)
              # raise ValueError("y_pred ve y_true şekilleri farklı olamaz.")
 
         # Sayısal kararlılık için y_pred'i kırp
         y_pred_clipped = np.clip(y_pred, epsilon, 1 - epsilon)
-        logger.debug(f"BCE: y_pred clipped to range [{epsilon}, {1 - epsilon}]")
+        if debug:
+            logger.debug("BCE: y_pred clipped to range [%s, %s]", epsilon, 1 - epsilon)
 
         # Kaybı hesapla
         term1 = y_true * np.log(y_pred_clipped)
         term2 = (1 - y_true) * np.log(1 - y_pred_clipped)
         cost = -np.sum(term1 + term2) / m
         cost = float(np.squeeze(cost)) # Skaler değere dönüştürmeyi garanti et
-        logger.debug(f"BCE calculated: {cost}")
+        if debug:
+            logger.debug("BCE calculated: %s", cost)
         return cost
 
+    @staticmethod
+    def mean_squared_error_derivative(y_pred: np.ndarray, y_true: np.ndarray) -> np.ndarray:
+        """
+        MSE kaybının tahminlere göre türevi (geri yayılımın başlangıç gradyanı).
+
+        Formül: dL/dy_pred = (y_pred - y_true) / m
+
+        Returns:
+            np.ndarray: y_pred ile aynı shape'te gradyan.
+        """
+        m = y_true.shape[0]
+        return (y_pred - y_true) / m
+
+    @staticmethod
+    def binary_crossentropy_derivative(y_pred: np.ndarray, y_true: np.ndarray, epsilon: float = 1e-15) -> np.ndarray:
+        """
+        BCE kaybının tahminlere göre türevi.
+
+        Formül: dL/dy_pred = (y_pred - y_true) / (y_pred * (1 - y_pred)) / m
+
+        Returns:
+            np.ndarray: y_pred ile aynı shape'te gradyan.
+        """
+        m = y_true.shape[0]
+        y_pred_clipped = np.clip(y_pred, epsilon, 1 - epsilon)
+        return (y_pred_clipped - y_true) / (y_pred_clipped * (1 - y_pred_clipped)) / m
+
+    @staticmethod
+    def categorical_crossentropy(y_pred: np.ndarray, y_true: np.ndarray, epsilon: float = 1e-15) -> float:
+        """
+        Kategorik Çapraz Entropi kaybı (softmax çıktılı çok sınıflı sınıflandırma).
+
+        Formül: -(1 / m) * sum(y_true * log(y_pred))
+
+        Args:
+            y_pred (np.ndarray): Sınıf olasılıkları, shape (m, n_classes).
+            y_true (np.ndarray): One-hot (veya satır toplamı 1 olan) hedefler, shape (m, n_classes).
+        """
+        m = y_true.shape[0]
+        if m == 0:
+            logger.warning("CCE: Hesaplama için sıfır örnek alındı.")
+            return 0.0
+        log_p = np.log(np.clip(y_pred, epsilon, 1.0))
+        return float(-np.vdot(y_true, log_p) / m)
+
+    @staticmethod
+    def categorical_crossentropy_derivative(y_pred: np.ndarray, y_true: np.ndarray, epsilon: float = 1e-15) -> np.ndarray:
+        """
+        CCE kaybının olasılıklara göre türevi: dL/dy_pred = -y_true / y_pred / m.
+        Softmax çıktı katmanıyla eğitimde bunun yerine softmax_crossentropy_value_and_grad kullanılır.
+        """
+        m = y_true.shape[0]
+        return -y_true / np.clip(y_pred, epsilon, 1.0) / m
+
+    # --- Birleştirilmiş (fused) kayıp + gradyan fonksiyonları ---
+    #
+    # Eğitim adımında kayıp ve tahminlere göre gradyan aynı ara sonuçlardan tek geçişte
+    # hesaplanır. Gradyan out'a yazılır (verilmezse yeni dizi ayrılır); diğer ara diziler
+    # thread başına yeniden kullanılan buffer'lardadır, kararlı durumda batch boyutuyla
+    # orantılı yeni dizi ayrılmaz. Hepsi (cost, grad) döndürür.
+
+    @staticmethod
+    def mean_squared_error_value_and_grad(y_pred: np.ndarray, y_true: np.ndarray,
+                                          out: Optional[np.ndarray] = None) -> Tuple[float, np.ndarray]:
+        """MSE kaybı ve dL/dy_pred = (y_pred - y_true) / m."""
+        m = y_true.shape[0]
+        grad = np.subtract(y_pred, y_true, out=_grad_buffer(y_pred, out))
+        flat = grad.reshape(-1)
+        cost = float(np.dot(flat, flat)) / (2 * m)
+        grad /= m
+        return cost, grad
+
+    @staticmethod
+    def binary_crossentropy_value_and_grad(y_pred: np.ndarray, y_true: np.ndarray,
+                                           out: Optional[np.ndarray] = None,
+                                           epsilon: float = 1e-15) -> Tuple[float, np.ndarray]:
+        """BCE kaybı ve dL/dy_pred = (p - y) / (p * (1 - p)) / m, p kırpılmış tahmin."""
+        m = y_true.shape[0]
+        p = np.clip(y_pred, epsilon, 1 - epsilon, out=_grad_buffer(y_pred, out))
+        log_1mp = _scratch("bce_log_1mp", p.shape, p.dtype)
+        work = _scratch("bce_work", p.shape, p.dtype)
+
+        # sum(y*log(p) + (1-y)*log(1-p)) = sum(log(1-p)) + sum(y * (log(p) - log(1-p)))
+        np.subtract(1, p, out=log_1mp)
+        np.log(log_1mp, out=log_1mp)
+        np.log(p, out=work)
+        work -= log_1mp
+        cost = -(float(np.sum(log_1mp)) + float(np.vdot(y_true, work))) / m
+
+        np.subtract(1, p, out=work)
+        work *= p
+        p -= y_true
+        p /= work
+        p /= m
+        return cost, p
+
+    @staticmethod
+    def softmax_crossentropy_value_and_grad(z: np.ndarray, y_true: np.ndarray,
+                                            out: Optional[np.ndarray] = None) -> Tuple[float, np.ndarray]:
+        """
+        Softmax + kategorik çapraz entropi, logit'ler (z) üzerinden birleştirilmiş.
+
+        log(softmax(z)) = z - logsumexp(z) olduğu için olasılıkların logaritması alınmaz ve
+        kırpmaya gerek kalmaz. Gradyan doğrudan logit'lere göredir:
+            dL/dz = (softmax(z) * sum(y) - y) / m   (one-hot y için softmax(z) - y)
+        Bu gradyan softmax'in Jacobian'ından geçirilmeden çıktı katmanına dZ olarak verilir.
+        """
+        m = y_true.shape[0]
+        grad = _grad_buffer(z, out)
+        row_shape = z.shape[:-1] + (1,)
+        z_max = np.max(z, axis=-1, keepdims=True, out=_scratch("smce_max", row_shape, grad.dtype))
+        np.subtract(z, z_max, out=grad)
+        np.exp(grad, out=grad)
+        sum_exp = np.sum(grad, axis=-1, keepdims=True, out=_scratch("smce_sum", row_shape, grad.dtype))
+        y_sum = np.sum(y_true, axis=-1, keepdims=True, out=_scratch("smce_y_sum", row_shape, grad.dtype))
+        # logsumexp(z) = z_max + log(sum(exp(z - z_max)))
+        log_sum_exp = np.log(sum_exp, out=_scratch("smce_lse", row_shape, grad.dtype))
+        log_sum_exp += z_max
+        cost = (float(np.vdot(y_sum, log_sum_exp)) - float(np.vdot(y_true, z))) / m
+
+        grad /= sum_exp
+        grad *= y_sum
+        grad -= y_true
+        grad /= m
+        return cost, grad
+
+    @staticmethod
+    def sigmoid_crossentropy_value_and_grad(z: np.ndarray, y_true: np.ndarray,
+                                            out: Optional[np.ndarray] = None) -> Tuple[float, np.ndarray]:
+        """
+        Sigmoid + ikili çapraz entropi, logit'ler (z) üzerinden birleştirilmiş.
+
+        Kayıp sayısal olarak kararlı formdan hesaplanır:
+            -(y*log(sigmoid(z)) + (1-y)*log(1-sigmoid(z))) = max(z, 0) - y*z + log(1 + exp(-|z|))
+        Gradyan: dL/dz = (sigmoid(z) - y) / m.
+        """
+        m = y_true.shape[0]
+        grad = _grad_buffer(z, out)
+        work = _scratch("sigmoid_ce_work", z.shape, grad.dtype)
+
+        np.abs(z, out=work)
+        np.negative(work, out=work)
+        np.exp(work, out=work)
+        np.log1p(work, out=work)
+        cost = float(np.sum(work)) + float(np.sum(np.maximum(z, 0, out=grad))) - float(np.vdot(y_true, z))
+        cost /= m
+
+        # sigmoid(z) = 0.5 * (1 + tanh(z / 2)), Activation.sigmoid ile aynı kararlı form
+        np.multiply(z, 0.5, out=grad)
+        np.tanh(grad, out=grad)
+        grad += 1
+        grad *= 0.5
+        grad -= y_true
+        grad /= m
+        return cost, grad
+
+    @staticmethod
+    def value_and_grad(name: str, output_activation=None):
+        """
+        İsmi verilen kaybın birleştirilmiş (cost, grad) fonksiyonunu döndürür: (func, wrt_logits).
+
+        output_activation verilirse ve kayıp bu aktivasyonla birleştirilebiliyorsa
+        (softmax + categorical_crossentropy, sigmoid + binary_crossentropy) logit'ler
+        üzerinden çalışan fonksiyon ve wrt_logits=True döner; func bu durumda çıktı
+        katmanının z'si ile çağrılır ve dönen gradyan doğrudan dZ'dir.
+        """
+        from .Activation import Activation
+
+        canonical = Loss._canonical_name(name)
+        if output_activation is Activation.softmax and canonical == 'categorical_crossentropy':
+            return Loss.softmax_crossentropy_value_and_grad, True
+        if output_activation is Activation.sigmoid and canonical == 'binary_crossentropy':
+            return Loss.sigmoid_crossentropy_value_and_grad, True
+
+        fused = {
+            'mean_squared_error': Loss.mean_squared_error_value_and_grad,
+            'binary_crossentropy': Loss.binary_crossentropy_value_and_grad,
+        }.get(canonical)
+        if fused is None:
+            loss_func, derivative = Loss.get(canonical)
+
+            def fused(y_pred, y_true, out=None):
+                grad = derivative(y_pred, y_true)
+                if out is not None:
+                    out[...] = grad
+                    grad = out
+                return loss_func(y_pred, y_true), grad
+        return fused, False
+
+    @staticmethod
+    def _canonical_name(name: str) -> str:
+        aliases = {
+            'mse': 'mean_squared_error',
+            'mean_squared_error': 'mean_squared_error',
+            'binary_crossentropy': 'binary_crossentropy',
+            'bce': 'binary_crossentropy',
+            'categorical_crossentropy': 'categorical_crossentropy',
+            'cce': 'categorical_crossentropy',
+        }
+        canonical = aliases.get(name.lower())
+        if canonical is None:
+            raise ValueError(f"Geçersiz veya desteklenmeyen kayıp fonksiyonu: {name}")
+        return canonical
+
+    @staticmethod
+    def get(name: str):
+        """
+        İsmi verilen kayıp fonksiyonunu ve türevini (loss_func, derivative_func) olarak döndürür.
+        Frontend'deki isimler kullanılır: "mse", "binary_crossentropy", "categorical_crossentropy".
+        """
+        losses = {
+            'mean_squared_error': (Loss.mean_squared_error, Loss.mean_squared_error_derivative),
+            'binary_crossentropy': (Loss.binary_crossentropy, Loss.binary_crossentropy_derivative),
+            'categorical_crossentropy': (Loss.categorical_crossentropy, Loss.categorical_crossentropy_derivative),
+        }
+        return losses[Loss._canonical_name(name)]
+
 # --- Örnek Kullanım ---
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     loss_calculator = Loss() # Sınıfı başlat (logger için)
 
     # --- MSE Örneği ---
@@ -133,4 +384,12 @@ if __name__ == '__main__':
     print(f"Y Predicted (Edge): {y_pred_edge}")
     print(f"Y True (Edge): {y_true_edge}")
     bce_value_edge = Loss.binary_crossentropy(y_pred_edge, y_true_edge)
-    print(f"Calculated BCE (Edge): {bce_value_edge:.6f}") # NaN olmamalı
\ No newline at end of file
+    print(f"Calculated BCE (Edge): {bce_value_edge:.6f}") # NaN olmamalı
+    # --- Birleştirilmiş kayıp + gradyan örneği ---
+    print("\n--- Fused value_and_grad Example ---")
+    bce_fused, bce_grad = Loss.binary_crossentropy_value_and_grad(y_pred_bce.reshape(-1, 1), y_true_bce.reshape(-1, 1))
+    print(f"BCE value_and_grad: {bce_fused:.6f}, grad: {bce_grad.ravel()}")
+    logits = np.array([[2.0, 1.0, 0.1], [0.5, 2.5, -1.0]])
+    one_hot = np.array([[1, 0, 0], [0, 1, 0]], dtype=float)
+    cce_fused, cce_grad = Loss.softmax_crossentropy_value_and_grad(logits, one_hot)
+    print(f"Softmax + CCE (log-sum-exp): {cce_fused:.6f}, grad:\n{cce_grad}")
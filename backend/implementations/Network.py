@@ -1,13 +1,29 @@
 import numpy as np
-from typing import List, Callable, Optional
-from .Layer import Layer
+from typing import List, Callable, Optional, Union, Dict, Iterable, Iterator, Tuple
+from .Layer import Layer, resolve_dtype, compute_dtype_for
+from .Loss import Loss
+from .Optimizer import Optimizer
 
 
 class NeuralNetwork:
 
     # Burada yapay sinir ağı bulunacak. 
 
-    def __init__(self, input_dim: int, name: Optional[str] = "NeuralNetwork"):
+    # Hata toleransları (float64 referansa göre, çıktı büyüklüğüne oranla), bkz. check_precision
+    PRECISION_TOLERANCES = {
+        np.dtype(np.float64): 1e-12,
+        np.dtype(np.float32): 1e-4,
+        np.dtype(np.float16): 1e-2,
+    }
+
+    def __init__(self, input_dim: int, name: Optional[str] = "NeuralNetwork", dtype=np.float32):
+        """
+        input_dim: Girdi özelliği sayısı.
+        name: Ağ için isteğe bağlı isim.
+        dtype: Ağırlık, bias, aktivasyon ve gradyanların veri tipi. float32 varsayılandır.
+               float16 sadece depolamadır (bellek yarıya iner): matris çarpımları, aktivasyonlar
+               ve gradyanlar float32'de hesaplanır. float64 referans/hassas hesaplama içindir.
+        """
 
         if input_dim <= 0:
             raise ValueError("Girdi boyutu pozitif olmalıdır.")
@@ -15,6 +31,22 @@ class NeuralNetwork:
         self.input_dim = input_dim
         self.layers: List[Layer] = []
         self.name = name
+        self.dtype = resolve_dtype(dtype)
+        # Katman eklendiğinde/çıkarıldığında artar (bkz. version)
+        self._structure_version = 0
+
+    @property
+    def version(self) -> tuple:
+        """
+        Ağın yapısı veya herhangi bir katmanın ağırlıkları değiştiğinde değişen değer.
+        Ağırlıklardan türetilen sonuçları (örn. tahmin önbelleği) geçersiz kılmak için karşılaştırılır.
+        """
+        return (self._structure_version,) + tuple(layer.version for layer in self.layers)
+
+    @property
+    def compute_dtype(self) -> np.dtype:
+        """Hesaplamaların yapıldığı veri tipi (float16 depolamada float32)."""
+        return compute_dtype_for(self.dtype)
 
     def add_layer(self, num_neurons: int,
                   activation_func: Callable[[np.ndarray], np.ndarray],
@@ -35,8 +67,25 @@ class NeuralNetwork:
             num_neurons=num_neurons,
             input_dim=layer_input_dim,
             activation_func=activation_func,
-            name=name
+            name=name,
+            dtype=self.dtype
         )
+        self._append_layer(new_layer)
+
+        print(f"Added layer: {new_layer}")
+
+    def _append_layer(self, new_layer: Layer):
+        """Hazır bir katmanı ağın sonuna ekler ve ilk/son katman bayraklarını günceller."""
+        layer_input_dim = self.input_dim if not self.layers else self.layers[-1].num_neurons
+        if new_layer.input_dim != layer_input_dim:
+            raise ValueError(
+                f"'{new_layer.name}' katmanının girdi boyutu ({new_layer.input_dim}) "
+                f"önceki katmanın çıktısıyla ({layer_input_dim}) eşleşmiyor."
+            )
+        if new_layer.dtype != self.dtype:
+            raise ValueError(
+                f"'{new_layer.name}' katmanının veri tipi ({new_layer.dtype}) ağın tipiyle ({self.dtype}) aynı olmalıdır."
+            )
 
         # Bayrakları ayarla
         if not self.layers:
@@ -49,47 +98,451 @@ class NeuralNetwork:
         # Yeni katmanı son katman olarak işaretle ve listeye ekle
         new_layer.is_output_layer = True
         self.layers.append(new_layer)
+        self._structure_version += 1
 
-        print(f"Added layer: {new_layer}")
+    # --- Yerinde düzenleme ---
+    # Aşağıdaki metodlar ağı baştan kurmadan tek bir katmanı değiştirir. Sadece etkilenen
+    # ağırlık matrisleri yeniden ayrılır: düzenlenen katman ve (girdi boyutu değiştiyse)
+    # sonraki katmanın girdi satırları. Diğer katmanların eğitilmiş ağırlıklarına dokunulmaz.
+    # Sonraki katmanın yeni girdi satırları sıfırla başlar, yani bir katmanı genişletmek ağın
+    # çıktısını değiştirmez. Yapı version'ı artar (tahmin önbellekleri geçersiz olur); açık
+    # InferencePlan'lar yeniden oluşturulmalıdır. Optimizer durumu shape değişince
+    # kendiliğinden sıfırlanır (bkz. Optimizer._state_for).
+
+    def insert_layer(self, index: int, num_neurons: int,
+                     activation_func: Callable[[np.ndarray], np.ndarray],
+                     name: Optional[str] = None) -> Layer:
+        """
+        index konumuna yeni bir katman ekler (index == len(layers) sona ekler; negatif indeksler
+        list.insert'teki gibi sondan sayılır, -1 son katmanın önüne ekler). Sonraki katmanın
+        girdi boyutu yeni katmanın nöron sayısına göre kırpılır/genişletilir.
+        """
+        if not -len(self.layers) <= index <= len(self.layers):
+            raise ValueError(f"Geçersiz katman indeksi: {index} "
+                             f"({-len(self.layers)}-{len(self.layers)} arası olmalıdır).")
+        if index < 0:
+            index += len(self.layers)
+        input_dim = self.input_dim if index == 0 else self.layers[index - 1].num_neurons
+        new_layer = Layer(num_neurons=num_neurons, input_dim=input_dim, activation_func=activation_func,
+                          name=name, dtype=self.dtype)
+        self.layers.insert(index, new_layer)
+        if index + 1 < len(self.layers):
+            self.layers[index + 1].resize(input_dim=num_neurons)
+        self._structure_changed()
+        return new_layer
+
+    def remove_layer(self, index: int) -> Layer:
+        """
+        index'teki katmanı çıkarır ve döndürür. Sonraki katman artık çıkarılan katmanın
+        girdisini alır; girdi boyutu buna göre kırpılır/genişletilir.
+        """
+        index = self._layer_index(index)
+        if len(self.layers) == 1:
+            raise ValueError("Ağın tek katmanı çıkarılamaz.")
+        removed = self.layers.pop(index)
+        if index < len(self.layers):
+            self.layers[index].resize(input_dim=removed.input_dim)
+        removed.is_first_layer = removed.is_output_layer = False
+        self._structure_changed()
+        return removed
+
+    def resize_layer(self, index: int, num_neurons: int) -> Layer:
+        """index'teki katmanın nöron sayısını değiştirir (bkz. Layer.resize)."""
+        index = self._layer_index(index)
+        layer = self.layers[index]
+        if num_neurons != layer.num_neurons:
+            layer.resize(num_neurons=num_neurons)
+            if index + 1 < len(self.layers):
+                self.layers[index + 1].resize(input_dim=num_neurons)
+            self._structure_changed()
+        return layer
+
+    def set_layer_activation(self, index: int, activation_func: Callable[[np.ndarray], np.ndarray]) -> Layer:
+        """index'teki katmanın aktivasyon fonksiyonunu değiştirir; ağırlıklar korunur."""
+        index = self._layer_index(index)
+        layer = self.layers[index]
+        if activation_func is not layer.activation_function:
+            layer.activation_function = activation_func
+            # Nöron view'ları ve saklanan aktivasyonlar eski fonksiyona aitti
+            layer._neurons = None
+            layer.reset_state()
+            self._structure_changed()
+        return layer
+
+    def _layer_index(self, index: int) -> int:
+        """Negatif indeksleri de kabul eder (-1 son katman)."""
+        if not -len(self.layers) <= index < len(self.layers):
+            raise ValueError(f"Geçersiz katman indeksi: {index} (ağda {len(self.layers)} katman var).")
+        return index % len(self.layers)
 
+    def _structure_changed(self):
+        """Katman listesi değiştikten sonra ilk/son katman bayraklarını ve yapı version'ını günceller."""
+        for i, layer in enumerate(self.layers):
+            layer.is_first_layer = i == 0
+            layer.is_output_layer = i == len(self.layers) - 1
+        self._structure_version += 1
 
-    def forward(self, X: np.ndarray) -> np.ndarray:
+
+    def forward(self, X: np.ndarray, cache: bool = True, reuse_buffers: bool = False) -> np.ndarray:
         """
         Ağ üzerinden ileri yayılımı gerçekleştirir.
 
         Args:
-            X (np.ndarray): Ağın girdi verisi. Shape (input_dim,) olmalıdır
-                             (tek örnek için).
+            X (np.ndarray): Ağın girdi verisi. Tek örnek için shape (input_dim,),
+                             mini-batch için shape (batch_size, input_dim).
+            cache (bool): Katmanlar geri yayılım için ara değerleri saklasın mı.
+            reuse_buffers (bool): Katmanlar önceden ayrılmış buffer'ları kullansın mı
+                                  (eğitim döngüsü için; bkz. Layer.forward).
 
         Returns:
-            np.ndarray: Ağın son katmanının çıktısı (tahmin). Shape (output_dim,).
+            np.ndarray: Ağın son katmanının çıktısı (tahmin).
+                        Shape (output_dim,) veya (batch_size, output_dim).
         """
         if not self.layers:
             raise RuntimeError("Ağa henüz hiçbir katman eklenmedi.")
 
-        if X.shape[0] != self.input_dim:
+        if X.ndim not in (1, 2) or X.shape[-1] != self.input_dim:
             raise ValueError(
-                f"Ağ girdisinin boyutu ({X.shape[0]}) beklenen boyutla "
+                f"Ağ girdisinin boyutu ({X.shape[-1] if X.ndim else 0}) beklenen boyutla "
                 f"({self.input_dim}) eşleşmiyor."
             )
 
         # Katmanlar üzerinden veriyi sırayla geçir
         current_output = X
         for layer in self.layers:
-            current_output = layer.forward(current_output)
+            current_output = layer.forward(current_output, cache=cache, reuse_buffers=reuse_buffers)
 
         # Son katmanın çıktısını döndür
         return current_output
 
+    def backward(self, dA: np.ndarray, wrt_logits: bool = False):
+        """
+        Kaybın ağ çıktısına göre gradyanını (dA) son katmandan ilk katmana doğru yayar.
+        Her katmanın dW/db gradyanları katmanın kendi buffer'larına yazılır.
+        forward() ile aynı batch üzerinde çağrılmalıdır.
+
+        wrt_logits True ise dA çıktı katmanının z'sine göre gradyandır (aktivasyonla
+        birleştirilmiş kayıplar, bkz. Loss.value_and_grad).
+        """
+        dA = self.layers[-1].backward(dA, wrt_z=wrt_logits)
+        for layer in reversed(self.layers[:-1]):
+            dA = layer.backward(dA)
+
+    def _forward_backward(self, X_batch: np.ndarray, y_batch: np.ndarray, loss_fn: Callable,
+                          wrt_logits: bool, grad_scale: float = 1.0) -> float:
+        """
+        Tek bir eğitim batch'i için forward, birleştirilmiş kayıp/gradyan ve backward.
+        loss_fn, wrt_logits Loss.value_and_grad'den gelir. Batch kaybını döndürür.
+        """
+        y_pred = self.forward(X_batch, reuse_buffers=True)
+        y_batch = y_batch.astype(self.compute_dtype, copy=False)
+        output = self.layers[-1]
+        grad_out = output._buffer('loss_grad', y_pred.shape[0], output.num_neurons)
+        cost, grad = loss_fn(output.z if wrt_logits else y_pred, y_batch, out=grad_out)
+        if grad_scale != 1.0:
+            grad *= grad_scale
+        self.backward(grad, wrt_logits=wrt_logits)
+        return cost
+
+    def compute_gradients(self, X_batch: np.ndarray, y_batch: np.ndarray,
+                          loss: Union[str, Callable] = "mse") -> float:
+        """
+        Tek bir batch için fit'in yaptığı forward + kayıp + backward adımı; parametreler
+        güncellenmez. Gradyanlar katmanların dW / db buffer'larında kalır (örn. bir
+        Optimizer.step ile uygulanabilir veya Profiler ile ölçülebilir).
+
+        Args:
+            X_batch (np.ndarray): shape (n, input_dim).
+            y_batch (np.ndarray): shape (n, output_dim) veya tek çıktılı ağ için (n,).
+            loss (str | Callable): fit'teki gibi kayıp ismi veya Loss fonksiyonu.
+
+        Returns:
+        Batch kaybı (batch ortalaması).
+        """
+        if not self.layers:
+            raise RuntimeError("Ağa henüz hiçbir katman eklenmedi.")
+        if X_batch.ndim != 2 or X_batch.shape[1] != self.input_dim:
+            raise ValueError(f"X_batch shape (n, {self.input_dim}) olmalıdır, gelen: {X_batch.shape}.")
+        if y_batch.ndim == 1:
+            y_batch = y_batch.reshape(-1, 1)
+        if y_batch.shape[0] != X_batch.shape[0]:
+            raise ValueError(f"X_batch ({X_batch.shape[0]}) ve y_batch ({y_batch.shape[0]}) örnek sayıları eşleşmiyor.")
+        loss_name = loss if isinstance(loss, str) else loss.__name__
+        loss_fn, wrt_logits = Loss.value_and_grad(loss_name, self.layers[-1].activation_function)
+        return self._forward_backward(X_batch, y_batch, loss_fn, wrt_logits)
+
+    def fit(self, X: Union[np.ndarray, Iterable[Tuple[np.ndarray, np.ndarray]]],
+            y: Optional[np.ndarray] = None,
+            loss: Union[str, Callable] = "mse",
+            optimizer: Union[str, Optimizer] = "sgd",
+            batch_size: int = 32,
+            epochs: int = 10,
+            learning_rate: float = 0.01,
+            shuffle: bool = True,
+            on_epoch_end: Optional[Callable[[int, float], None]] = None,
+            verbose: bool = False,
+            workers: int = 1) -> Dict[str, List[float]]:
+        """
+        Ağı mini-batch gradyan inişiyle eğitir.
+
+        Args:
+            X (np.ndarray | Iterable): Eğitim verisi, shape (m, input_dim). y verilmezse
+                                       her epoch'ta baştan iterate edilen (X_batch, y_batch)
+                                       kaynağı olarak kullanılır (örn. StreamingDataLoader);
+                                       bu durumda batch_size ve shuffle loader'a aittir.
+            y (np.ndarray): Hedef değerler. Shape (m, output_dim) veya tek çıktılı ağ için (m,).
+            loss (str | Callable): Kayıp fonksiyonu ismi ("mse", "binary_crossentropy",
+                                   "categorical_crossentropy") veya Loss sınıfındaki bir kayıp fonksiyonu.
+                                   Çıktı aktivasyonu softmax/sigmoid ise çapraz entropi kayıpları
+                                   logit'ler üzerinden birleştirilmiş olarak hesaplanır.
+            optimizer (str | Optimizer): "sgd", "momentum", "adam" ya da bir Optimizer nesnesi.
+            batch_size (int): Mini-batch boyutu. m'den büyükse tüm veri tek batch olur.
+            epochs (int): Veri üzerinden kaç kez geçileceği.
+            learning_rate (float): optimizer isim olarak verildiğinde kullanılacak öğrenme oranı.
+            shuffle (bool): Her epoch başında örneklerin sırası karıştırılsın mı.
+            on_epoch_end (Callable): Her epoch sonunda (epoch, epoch_loss) ile çağrılır.
+                                     False döndürürse eğitim o epoch'ta durdurulur (erken durdurma).
+            verbose (bool): Her epoch'un kaybını yazdır.
+            workers (int): 1'den büyükse her mini-batch bu kadar process'e bölünür ve
+                           gradyanlar paylaşımlı bellekte toplanır (bkz. DataParallelTrainer).
+
+        Returns:
+            Dict[str, List[float]]: Epoch başına ortalama kayıp: {"loss": [...]}.
+        """
+        if not self.layers:
+            raise RuntimeError("Ağa henüz hiçbir katman eklenmedi.")
+        if batch_size <= 0 or epochs <= 0:
+            raise ValueError("batch_size ve epochs pozitif olmalıdır.")
+        if y is None:
+            if isinstance(X, np.ndarray):
+                raise ValueError("X bir dizi olarak verildiğinde y de verilmelidir.")
+            batches = lambda: iter(X)
+        else:
+            if X.ndim != 2 or X.shape[1] != self.input_dim:
+                raise ValueError(
+                    f"Eğitim verisi shape (m, {self.input_dim}) olmalıdır, gelen: {X.shape}."
+                )
+            if y.ndim == 1:
+                y = y.reshape(-1, 1)
+            if y.shape[0] != X.shape[0]:
+                raise ValueError(f"X ({X.shape[0]}) ve y ({y.shape[0]}) örnek sayıları eşleşmiyor.")
+            # Veri bir kez hesaplama tipine çevrilir, batch'ler tekrar çevrilmez
+            X = X.astype(self.compute_dtype, copy=False)
+            y = y.astype(self.compute_dtype, copy=False)
+            batches = lambda: self._iterate_batches(X, y, batch_size, shuffle)
+
+        loss_name = loss if isinstance(loss, str) else loss.__name__
+        loss_fn, wrt_logits = Loss.value_and_grad(loss_name, self.layers[-1].activation_function)
+        if isinstance(optimizer, str):
+            optimizer = Optimizer.create(optimizer, learning_rate=learning_rate)
+
+        trainer = None
+        if workers > 1:
+            from .Parallel import DataParallelTrainer
+            trainer = DataParallelTrainer(self, num_workers=workers, loss=loss_name)
+
+        history: Dict[str, List[float]] = {"loss": []}
+
+        try:
+            for epoch in range(epochs):
+                epoch_loss = 0.0
+                m = 0
+
+                for X_batch, y_batch in batches():
+                    if y_batch.ndim == 1:
+                        y_batch = y_batch.reshape(-1, 1)
+                    if trainer is not None:
+                        batch_loss = trainer.step(X_batch, y_batch, optimizer)
+                    else:
+                        batch_loss = self._forward_backward(X_batch, y_batch, loss_fn, wrt_logits)
+                        optimizer.step(self.layers)
+                    # Batch kaybı batch ortalaması olduğu için örnek sayısıyla ağırlıklandırılır
+                    epoch_loss += batch_loss * X_batch.shape[0]
+                    m += X_batch.shape[0]
+
+                if m == 0:
+                    raise ValueError("Eğitim verisi boş.")
+                epoch_loss /= m
+                history["loss"].append(epoch_loss)
+                if verbose:
+                    print(f"Epoch {epoch + 1}/{epochs} - loss: {epoch_loss:.6f}")
+                if on_epoch_end is not None and on_epoch_end(epoch, epoch_loss) is False:
+                    break
+        finally:
+            if trainer is not None:
+                trainer.close()
+
+        return history
+
+    @staticmethod
+    def _iterate_batches(X: np.ndarray, y: np.ndarray, batch_size: int,
+                         shuffle: bool) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Bellekteki X, y dizilerinden (isteğe bağlı karıştırılmış) mini-batch'ler üretir."""
+        m = X.shape[0]
+        order = np.random.permutation(m) if shuffle else None
+        for start in range(0, m, batch_size):
+            if order is not None:
+                batch_idx = order[start:start + batch_size]
+                yield X[batch_idx], y[batch_idx]
+            else:
+                yield X[start:start + batch_size], y[start:start + batch_size]
+
     def predict(self, X: np.ndarray) -> np.ndarray:
-        """ İleri yayılım için bir alias (takma ad). """
-        return self.forward(X)
+        """
+        İleri yayılım için bir alias (takma ad). Ara değerleri katmanlarda saklamaz,
+        bu yüzden aynı ağ üzerinde farklı thread'lerden güvenle çağrılabilir.
+        """
+        return self.forward(X, cache=False)
+
+    def inference_plan(self, batch_size: int):
+        """
+        Sabit batch boyutunda tekrar tekrar tahmin için buffer'ları önceden ayrılmış
+        bir InferencePlan döndürür (bkz. InferencePlan).
+        """
+        from .InferencePlan import InferencePlan
+        return InferencePlan(self, batch_size)
+
+    def compile(self, fold_linear: bool = True):
+        """
+        Sadece tahmin için düz bir (weights, bias, aktivasyon çekirdeği) planına derlenmiş
+        bir CompiledNetwork döndürür; ağ değiştikçe plan kendini yeniden derler (bkz. Compilation).
+        """
+        from .Compilation import CompiledNetwork
+        return CompiledNetwork(self, fold_linear=fold_linear)
+
+    def profile(self):
+        """
+        Katman başına süre, FLOP ve bellek toplayan bir Profiler döndürür; with bloğu
+        içinde çalışan forward/backward çağrıları ölçülür (bkz. Profiler).
+        """
+        from .Profiler import Profiler
+        return Profiler(self)
+
+    def quantize(self):
+        """
+        Ağırlıkları nöron başına ölçekle int8'e çevrilmiş, sadece tahmin yapan bir kopya
+        döndürür (bkz. Quantization.QuantizedNetwork). Orijinal ağ değişmez.
+        """
+        from .Quantization import quantize
+        return quantize(self)
+
+    def save(self, path: str):
+        """Ağı tek bir ikili dosyaya kaydeder (bkz. Serialization.save_network)."""
+        from .Serialization import save_network
+        save_network(self, path)
+
+    @classmethod
+    def load(cls, path: str, mmap_mode: Optional[str] = "c") -> "NeuralNetwork":
+        """
+        save() ile kaydedilmiş ağı yükler. Varsayılan olarak ağırlıklar np.memmap ile
+        açılır, yani dosya okunmaz; sayfalar ilk erişimde diskten (veya diğer
+        process'lerle paylaşılan page cache'ten) gelir. mmap_mode seçenekleri için
+        bkz. Serialization.load_network.
+        """
+        from .Serialization import load_network
+        return load_network(path, mmap_mode=mmap_mode)
+
+    def astype(self, dtype) -> "NeuralNetwork":
+        """
+        Ağın tüm parametrelerini verilen tipe çevirir (yerinde, self döner). Örn. float32
+        eğitilmiş bir modeli tahmin sunucularına float16 olarak dağıtmak için.
+        Eğitim buffer'ları ve gradyanlar bırakılır, gerektiğinde yeni tipte tekrar ayrılır.
+        """
+        dtype = resolve_dtype(dtype)
+        for layer in self.layers:
+            layer.set_parameters(layer.weights.astype(dtype), layer.biases.astype(dtype))
+            layer.reset_state()
+        self.dtype = dtype
+        return self
+
+    def check_precision(self, X: np.ndarray, tolerance: Optional[float] = None,
+                        reference: Optional["NeuralNetwork"] = None, y: Optional[np.ndarray] = None,
+                        loss: str = "mse") -> Dict[str, float]:
+        """
+        Ağın tahminlerini float64 bir referansla karşılaştırır.
+
+        reference verilmezse aynı ağırlıkların float64 kopyası kullanılır (sadece hesaplama
+        hassasiyeti ölçülür). Düşük hassasiyete çevrilmiş bir modelin depolama kaybını da
+        ölçmek için orijinal float64 model reference olarak verilir:
+            low = model.shallow_copy().astype("float16")
+            low.check_precision(X, reference=model, y=y)
+        Hata, referans çıktının en büyük mutlak değerine oranlanır. y verilirse iki ağın
+        X, y üzerindeki kaybı (loss) da karşılaştırılır; kayıp hatası referans kayba oranlanır.
+        tolerance verilmezse ağın tipi için PRECISION_TOLERANCES kullanılır ve hem tahmin hem
+        kayıp hatası için uygulanır.
+
+        Returns:
+            {"dtype", "max_abs_error", "max_rel_error", "tolerance", "within_tolerance"}
+            y verilirse ek olarak {"loss", "reference_loss", "loss_abs_error", "loss_rel_error"}
+        """
+        if tolerance is None:
+            tolerance = self.PRECISION_TOLERANCES[self.dtype]
+        if reference is None:
+            reference = self._float64_copy()
+        expected = reference.predict(np.asarray(X, dtype=np.float64)).astype(np.float64)
+        actual = self.predict(X).astype(np.float64)
+        max_abs_error = float(np.max(np.abs(actual - expected)))
+        scale = max(float(np.max(np.abs(expected))), np.finfo(np.float64).tiny)
+        max_rel_error = max_abs_error / scale
+        result = {
+            "dtype": str(self.dtype),
+            "max_abs_error": max_abs_error,
+            "max_rel_error": max_rel_error,
+            "tolerance": tolerance,
+            "within_tolerance": max_rel_error <= tolerance,
+        }
+        if y is not None:
+            loss_fn, _ = Loss.get(loss)
+            y = np.asarray(y, dtype=np.float64).reshape(expected.shape)
+            reference_loss = float(loss_fn(expected, y))
+            actual_loss = float(loss_fn(actual, y))
+            loss_abs_error = abs(actual_loss - reference_loss)
+            loss_rel_error = loss_abs_error / max(abs(reference_loss), np.finfo(np.float64).tiny)
+            result.update(loss=actual_loss, reference_loss=reference_loss,
+                          loss_abs_error=loss_abs_error, loss_rel_error=loss_rel_error)
+            result["within_tolerance"] = result["within_tolerance"] and loss_rel_error <= tolerance
+        return result
+
+    def shallow_copy(self) -> "NeuralNetwork":
+        """
+        Ağırlık ve bias dizilerini kopyalamadan paylaşan ayrı bir ağ. Eğitim durumu (ara
+        değerler, gradyanlar, buffer'lar, hook'lar) ayrıdır; örn. çalışan bir modeli
+        etkilemeden profillemek için. Kopyada optimizer adımı atılırsa ağırlıklar ortak değişir.
+        """
+        copy = NeuralNetwork(input_dim=self.input_dim, name=self.name, dtype=self.dtype)
+        for layer in self.layers:
+            copy._append_layer(Layer(layer.num_neurons, layer.input_dim, layer.activation_function, layer.name,
+                                     weights=layer.weights, biases=layer.biases))
+        # Kopya düzenlenip orijinalin yerine konursa version'ı geriye gitmemeli
+        copy._structure_version = self._structure_version
+        return copy
+
+    def _float64_copy(self) -> "NeuralNetwork":
+        """Aynı ağırlıkların float64 kopyası (check_precision'ın varsayılan referansı)."""
+        reference = NeuralNetwork(input_dim=self.input_dim, name=f"{self.name}_float64", dtype=np.float64)
+        for layer in self.layers:
+            reference._append_layer(Layer(layer.num_neurons, layer.input_dim, layer.activation_function, layer.name,
+                                          weights=layer.weights.astype(np.float64),
+                                          biases=layer.biases.astype(np.float64)))
+        return reference
+
+    @property
+    def nbytes(self) -> int:
+        """Ağın parametre ve gradyan dizilerinin bellekte kapladığı toplam byte."""
+        total = 0
+        for layer in self.layers:
+            total += layer.weights.nbytes + layer.biases.nbytes
+            if layer.dW is not None:
+                total += layer.dW.nbytes + layer.db.nbytes
+            total += sum(buffer.nbytes for buffer in layer._buffers.values())
+        return total
 
     def summary(self):
         """ Ağın yapısını özetler. """
         print("-" * 50)
         print(f"Network Summary: {self.name}")
         print(f"Input Dimension: {self.input_dim}")
+        print(f"dtype: {self.dtype}" + (f" (compute: {self.compute_dtype})" if self.compute_dtype != self.dtype else ""))
         print("-" * 50)
         if not self.layers:
             print("No layers added yet.")
@@ -111,14 +564,16 @@ class NeuralNetwork:
 
 # --- Örnek Kullanım ---
 if __name__ == '__main__':
+    from .Activation import Activation
+
     # 4 özellikli bir girdi bekleyen ağ oluşturalım
     my_network = NeuralNetwork(input_dim=4)
 
     # Katmanları ekleyelim
-    my_network.add_layer(num_neurons=5, activation_func=relu, name="Hidden1")
-    my_network.add_layer(num_neurons=3, activation_func=relu, name="Hidden2")
+    my_network.add_layer(num_neurons=5, activation_func=Activation.relu, name="Hidden1")
+    my_network.add_layer(num_neurons=3, activation_func=Activation.relu, name="Hidden2")
     # Çıkış katmanı genellikle farklı bir aktivasyon kullanır (örn. sınıflandırma için sigmoid/softmax)
-    my_network.add_layer(num_neurons=1, activation_func=sigmoid, name="Output")
+    my_network.add_layer(num_neurons=1, activation_func=Activation.sigmoid, name="Output")
 
     # Ağın özetini yazdır
     my_network.summary()
@@ -130,4 +585,16 @@ if __name__ == '__main__':
     # İleri yayılımı çalıştırıp sonucu alalım
     prediction = my_network.predict(input_data)
 
-    print(f"\nNetwork Prediction (shape {prediction.shape}):\n{prediction}")
\ No newline at end of file
+    print(f"\nNetwork Prediction (shape {prediction.shape}):\n{prediction}")
+
+    # Mini-batch: 8 örnek tek seferde (shape: (8, 4) -> (8, 1))
+    batch_data = np.random.rand(8, 4)
+    batch_prediction = my_network.predict(batch_data)
+    print(f"\nBatch Prediction (shape {batch_prediction.shape}):\n{batch_prediction}")
+
+    # Basit bir ikili sınıflandırma verisiyle eğitim
+    X_train = np.random.rand(256, 4)
+    y_train = (X_train.sum(axis=1) > 2).astype(float)
+    history = my_network.fit(X_train, y_train, loss="binary_crossentropy", optimizer="adam",
+                             batch_size=32, epochs=20, learning_rate=0.01, verbose=True)
+    print(f"\nFinal loss: {history['loss'][-1]:.6f}")
\ No newline at end of file
@@ -1,39 +1,64 @@
 import numpy as np
 import logging
-from typing import Callable, Optional 
+from typing import Optional
 
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 class Neuron:
 
-    def __init__(self, input_dim: int, activation_func):
-
-        self.logger = logging.getLogger(__name__)
-        self.logger.debug(f"Initializing Neuron with input_dim={input_dim}")
+    def __init__(self, input_dim: int, activation_func,
+                 weights: Optional[np.ndarray] = None,
+                 bias: Optional[np.ndarray] = None,
+                 dtype=np.float32):
+        """
+        dtype: weights/bias verilmediğinde oluşturulacak dizilerin veri tipi.
+        weights ve bias verilirse nöron kendi dizisini oluşturmaz, Layer'ın
+        ağırlık matrisindeki ilgili sütuna ve bias vektöründeki ilgili elemana
+        bakan bir görünüm (view) olarak çalışır. Böylece nöron üzerinden yapılan
+        değişiklikler doğrudan katmana yansır.
+        """
+
+        self.logger = logger
+        self.logger.debug("Initializing Neuron with input_dim=%d", input_dim)
 
         self.input_dim = input_dim
         self.activation_function = activation_func
 
-        self.weights: np.ndarray = np.random.randn(input_dim) * 0.01
-        self.bias: float = 0.0
+        self.weights: np.ndarray = (weights if weights is not None
+                                    else (np.random.randn(input_dim) * 0.01).astype(dtype))
+        # bias tek elemanlı bir dizi olarak tutulur ki katmanın bias vektörüne view olabilsin
+        self._bias: np.ndarray = bias if bias is not None else np.zeros(1, dtype=dtype)
 
         self.z: Optional[float] = None         
         self.activation: Optional[float] = None
 
-    def forward(self, inputs: np.ndarray) -> float:
-        self.logger.debug(f"Forward pass called with inputs: {inputs}")
+    @property
+    def bias(self) -> float:
+        return float(self._bias[0])
+
+    @bias.setter
+    def bias(self, value: float):
+        self._bias[0] = value
 
-        if inputs.shape[0] != self.input_dim:
-            raise ValueError(f"Girdi boyutu ({inputs.shape[0]}) beklenen boyutla ({self.input_dim}) eşleşmiyor.")
+    def forward(self, inputs: np.ndarray):
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("Forward pass called with inputs: %s", inputs)
+
+        if inputs.ndim not in (1, 2) or inputs.shape[-1] != self.input_dim:
+            raise ValueError(f"Girdi boyutu ({inputs.shape[-1] if inputs.ndim else 0}) beklenen boyutla ({self.input_dim}) eşleşmiyor.")
 
         # 1. Lineer hesaplama: z = sum(w_i * x_i) + b = w . x + b
-        # inputs shape (input_dim,), self.weights shape (input_dim,)
-        self.z = np.dot(self.weights, inputs) + self.bias
+        # inputs shape (input_dim,) veya (batch_size, input_dim), self.weights shape (input_dim,)
+        # Batch için z shape (batch_size,) olur.
+        self.z = np.dot(inputs, self.weights) + self.bias
 
         # 2. Aktivasyon fonksiyonunu uygula: a = g(z)
-        self.activation = self.activation_function(self.z)
+        # Tek örnekte z skalerdir; aktivasyonlar 0 boyutlu dizi döndürebilir, skalere çevrilir
+        self.activation = np.asarray(self.activation_function(self.z))[()]
 
-        self.logger.debug(f"Linear output (z): {self.z}, Activation output: {self.activation}")
+        if debug:
+            self.logger.debug("Linear output (z): %s, Activation output: %s", self.z, self.activation)
 
         return self.activation
 
@@ -46,8 +71,11 @@ class Neuron:
 
 # --- Örnek Kullanım (Test Amaçlı) ---
 if __name__ == '__main__':
+    from .Activation import Activation
+
+    logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     # 3 girdisi olan ve ReLU aktivasyonu kullanan bir nöron oluşturalım
-    neuron1 = Neuron(input_dim=3, activation_func=relu)
+    neuron1 = Neuron(input_dim=3, activation_func=Activation.relu)
     print(f"Oluşturulan Nöron 1: {neuron1}")
 
     # Rastgele bir girdi vektörü oluşturalım (shape: (3,))
@@ -65,7 +93,7 @@ if __name__ == '__main__':
     print("-" * 20)
 
     # 2 girdisi olan ve Sigmoid aktivasyonu kullanan bir nöron
-    neuron2 = Neuron(input_dim=2, activation_func=sigmoid)
+    neuron2 = Neuron(input_dim=2, activation_func=Activation.sigmoid)
     print(f"Oluşturulan Nöron 2: {neuron2}")
     input_vector2 = np.array([-1.0, 2.0])
     print(f"Girdi Vektörü: {input_vector2}")
@@ -0,0 +1,130 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+from typing import Dict, List, Tuple
+
+from .Layer import Layer
+
+
+class Optimizer(ABC):
+    """
+    Optimizer'lar için temel sınıf.
+
+    step() her çağrıldığında katmanların weights/biases dizilerini, backward() ile
+    hesaplanmış dW/db gradyanlarını kullanarak yerinde (in-place) günceller.
+    Ağırlık dizileri hiçbir zaman yeniden oluşturulmaz; ara sonuçlar için her
+    parametreye bir kez ayrılan yardımcı (scratch) buffer'lar tekrar kullanılır.
+    Alt sınıflar _update'i tanımlamak zorundadır; tanımlamayan sınıf oluşturulamaz.
+    """
+
+    def __init__(self, learning_rate: float = 0.01):
+        if learning_rate <= 0:
+            raise ValueError("Öğrenme oranı pozitif olmalıdır.")
+        self.learning_rate = learning_rate
+        # (layer, parametre_indeksi) -> o parametreye ait durum buffer'ları
+        self.state: Dict[Tuple[Layer, int], Dict[str, np.ndarray]] = {}
+
+    def _state_for(self, layer: Layer, index: int, param: np.ndarray, grad: np.ndarray,
+                   names: Tuple[str, ...]) -> Dict[str, np.ndarray]:
+        """
+        Parametre için durum buffer'larını ilk kullanımda sıfır olarak oluşturur.
+        Buffer'lar gradyanın (hesaplama) tipindedir; float16 depolanan parametrelerde
+        moment/hız birikimi float32'de yapılır ve sadece son güncelleme float16'ya yazılır.
+        """
+        state = self.state.get((layer, index))
+        if state is None or state[names[0]].shape != param.shape:
+            state = {name: np.zeros(param.shape, dtype=grad.dtype) for name in names}
+            self.state[(layer, index)] = state
+        return state
+
+    def step(self, layers: List[Layer]):
+        for layer in layers:
+            for index, (param, grad) in enumerate(layer.parameters()):
+                self._update(layer, index, param, grad)
+            layer.mark_updated()
+
+    @abstractmethod
+    def _update(self, layer: Layer, index: int, param: np.ndarray, grad: np.ndarray):
+        """Tek bir parametreyi (param) gradyanıyla (grad) yerinde günceller."""
+
+    @staticmethod
+    def create(name: str, learning_rate: float = 0.01, **kwargs) -> "Optimizer":
+        """İsmi verilen optimizer'ı oluşturur ("sgd", "momentum", "adam")."""
+        optimizers = {
+            'sgd': SGD,
+            'momentum': Momentum,
+            'adam': Adam,
+        }
+        optimizer_cls = optimizers.get(name.lower())
+        if optimizer_cls is None:
+            raise ValueError(f"Geçersiz veya desteklenmeyen optimizer: {name}")
+        return optimizer_cls(learning_rate=learning_rate, **kwargs)
+
+
+class SGD(Optimizer):
+    """ w = w - lr * dW """
+
+    def _update(self, layer, index, param, grad):
+        state = self._state_for(layer, index, param, grad, ('scratch',))
+        scratch = state['scratch']
+        np.multiply(grad, self.learning_rate, out=scratch)
+        param -= scratch
+
+
+class Momentum(Optimizer):
+    """
+    v = beta * v - lr * dW
+    w = w + v
+    """
+
+    def __init__(self, learning_rate: float = 0.01, beta: float = 0.9):
+        super().__init__(learning_rate)
+        self.beta = beta
+
+    def _update(self, layer, index, param, grad):
+        state = self._state_for(layer, index, param, grad, ('velocity', 'scratch'))
+        velocity, scratch = state['velocity'], state['scratch']
+        velocity *= self.beta
+        np.multiply(grad, self.learning_rate, out=scratch)
+        velocity -= scratch
+        param += velocity
+
+
+class Adam(Optimizer):
+    """
+    m = beta1 * m + (1 - beta1) * dW
+    v = beta2 * v + (1 - beta2) * dW^2
+    w = w - lr_t * m / (sqrt(v) + epsilon),  lr_t = lr * sqrt(1 - beta2^t) / (1 - beta1^t)
+    """
+
+    def __init__(self, learning_rate: float = 0.001, beta1: float = 0.9,
+                 beta2: float = 0.999, epsilon: float = 1e-8):
+        super().__init__(learning_rate)
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.epsilon = epsilon
+        self.t = 0
+
+    def step(self, layers):
+        self.t += 1
+        super().step(layers)
+
+    def _update(self, layer, index, param, grad):
+        state = self._state_for(layer, index, param, grad, ('m', 'v', 'scratch'))
+        m, v, scratch = state['m'], state['v'], state['scratch']
+
+        m *= self.beta1
+        np.multiply(grad, 1 - self.beta1, out=scratch)
+        m += scratch
+
+        v *= self.beta2
+        np.multiply(grad, grad, out=scratch)
+        scratch *= 1 - self.beta2
+        v += scratch
+
+        lr_t = self.learning_rate * np.sqrt(1 - self.beta2 ** self.t) / (1 - self.beta1 ** self.t)
+        np.sqrt(v, out=scratch)
+        scratch += self.epsilon
+        np.divide(m, scratch, out=scratch)
+        scratch *= lr_t
+        param -= scratch
@@ -0,0 +1,324 @@
+import logging
+import multiprocessing as mp
+import traceback
+import numpy as np
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+from .Activation import Activation
+from .Layer import Layer, compute_dtype_for
+from .Loss import Loss
+from .Network import NeuralNetwork
+from .Optimizer import Optimizer
+
+logger = logging.getLogger(__name__)
+
+# Ağın yapısı worker'lara bu formatta gönderilir: (isim, nöron sayısı, girdi boyutu, aktivasyon ismi)
+LayerSpec = Tuple[str, int, int, str]
+
+
+def _param_views(buffer: np.ndarray, specs: List[LayerSpec]) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """Düz bir buffer'ı katman sırasıyla (weights, biases) view'larına böler."""
+    views = []
+    offset = 0
+    for _, num_neurons, input_dim, _ in specs:
+        W = buffer[offset:offset + input_dim * num_neurons].reshape(input_dim, num_neurons)
+        offset += W.size
+        b = buffer[offset:offset + num_neurons]
+        offset += num_neurons
+        views.append((W, b))
+    return views
+
+
+def _param_count(specs: List[LayerSpec]) -> int:
+    return sum(input_dim * num_neurons + num_neurons for _, num_neurons, input_dim, _ in specs)
+
+
+class _SharedArray:
+    """SharedMemory bloğu ve üzerindeki ndarray view'ı."""
+
+    def __init__(self, shape, dtype, name: Optional[str] = None):
+        dtype = np.dtype(dtype)
+        size = max(1, int(np.prod(shape)) * dtype.itemsize)
+        self.shm = shared_memory.SharedMemory(name=name, create=name is None, size=size if name is None else 0)
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf)
+        self.shape = tuple(shape)
+        self.dtype = dtype
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def close(self, unlink: bool = False):
+        # ndarray view'ı bırakılmadan buffer kapatılamaz
+        self.array = None
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+def _worker_step(network: NeuralNetwork, X: np.ndarray, y: np.ndarray, total_rows: int,
+                 loss_fn, wrt_logits: bool) -> float:
+    """Bir shard için forward/backward. Gradyanlar katmanların dW/db (paylaşımlı slot) view'larına yazılır."""
+    # Gradyan shard ortalamasına göre; tüm batch'in ortalamasına ölçeklenir,
+    # böylece slotların toplamı tek process'teki batch gradyanına eşit olur
+    batch_loss = network._forward_backward(X, y, loss_fn, wrt_logits, grad_scale=X.shape[0] / total_rows)
+    # İlk katman paylaşımlı girdi buffer'ına bakan view'ı tutmasın (buffer değişebilir)
+    network.layers[0].last_input = None
+    return float(batch_loss) * X.shape[0]
+
+
+def _worker_main(conn, specs: List[LayerSpec], dtype, param_name: str, grad_name: str,
+                 num_workers: int, slot: int, loss_name: str):
+    """
+    Worker process'in döngüsü. Ağın bir kopyasını ağırlıkları paylaşımlı bellekte
+    olacak şekilde kurar; her "step" komutunda kendi shard'ı için forward/backward
+    yapıp gradyanları kendi gradyan slotuna yazar.
+    """
+    count = _param_count(specs)
+    compute_dtype = compute_dtype_for(dtype)
+    params = _SharedArray((count,), dtype, name=param_name)
+    grads = _SharedArray((num_workers, count), compute_dtype, name=grad_name)
+    inputs_X = inputs_y = None
+
+    network = NeuralNetwork(input_dim=specs[0][2], name=f"worker_{slot}", dtype=dtype)
+    for (name, num_neurons, input_dim, activation), (W, b), (dW, db) in zip(
+            specs, _param_views(params.array, specs), _param_views(grads.array[slot], specs)):
+        layer = Layer(num_neurons, input_dim, Activation.get(activation), name, weights=W, biases=b)
+        # backward gradyanları doğrudan paylaşımlı slota yazar (out=self.dW)
+        layer.dW, layer.db = dW, db
+        network._append_layer(layer)
+    loss_fn, wrt_logits = Loss.value_and_grad(loss_name, network.layers[-1].activation_function)
+
+    try:
+        while True:
+            message = conn.recv()
+            command = message[0]
+            if command == "close":
+                break
+            try:
+                if command == "inputs":
+                    _, x_name, x_shape, y_name, y_shape = message
+                    for shared in (inputs_X, inputs_y):
+                        if shared is not None:
+                            shared.close()
+                    inputs_X = _SharedArray(x_shape, compute_dtype, name=x_name)
+                    inputs_y = _SharedArray(y_shape, compute_dtype, name=y_name)
+                    conn.send(("ok", None))
+                elif command == "step":
+                    _, start, end, total_rows = message
+                    conn.send(("ok", _worker_step(network, inputs_X.array[start:end], inputs_y.array[start:end],
+                                                  total_rows, loss_fn, wrt_logits)))
+                else:
+                    raise ValueError(f"Bilinmeyen komut: {command}")
+            except Exception:
+                conn.send(("error", traceback.format_exc()))
+    finally:
+        # Paylaşımlı belleğe bakan view'lar bırakılmadan bloklar kapatılamaz
+        network = None
+        for shared in (params, grads, inputs_X, inputs_y):
+            if shared is not None:
+                shared.close()
+        conn.close()
+
+
+class DataParallelTrainer:
+    """
+    Mini-batch'leri process havuzuna bölerek (data-parallel) eğitim adımı yapar.
+
+    Ağın tüm parametreleri tek bir paylaşımlı bellek (SharedMemory) buffer'ına taşınır;
+    katmanların weights/biases dizileri bu buffer'ın view'ları olur. Her worker aynı
+    buffer'ı görür, bu yüzden optimizer'ın ana process'te yerinde yaptığı güncellemeler
+    worker'lara kopyalama olmadan yansır.
+
+    Her adımda:
+      1. Batch paylaşımlı girdi buffer'ına yazılır ve satırlar worker'lara bölünür.
+      2. Her worker kendi shard'ı için forward/backward yapar ve gradyanları
+         paylaşımlı gradyan bloğundaki kendi slotuna yazar.
+      3. Ana process slotları toplar (all-reduce) ve katmanların dW/db'sine yazar.
+      4. optimizer.step(network.layers) tek process'teki gibi çalışır.
+
+    Kullanım:
+        with DataParallelTrainer(network, num_workers=8, loss="mse") as trainer:
+            for X_batch, y_batch in batches:
+                trainer.step(X_batch, y_batch, optimizer)
+
+    veya doğrudan network.fit(X, y, workers=8).
+
+    Notlar:
+      - Her worker kendi BLAS thread'lerini de kullanır; çekirdek sayısı kadar worker
+        çalıştırırken OMP_NUM_THREADS=1 (veya OPENBLAS_NUM_THREADS=1) ile başlatın.
+      - Worker'lar ağı aktivasyon isimlerinden yeniden kurar; aktivasyonlar
+        Activation.get ile bulunabilen fonksiyonlar olmalıdır.
+      - Eğitim sürerken ağın yapısı değiştirilmemelidir. close() parametreleri normal
+        dizilere geri kopyalar.
+    """
+
+    def __init__(self, network, num_workers: Optional[int] = None, loss: str = "mse"):
+        if not network.layers:
+            raise RuntimeError("Ağa henüz hiçbir katman eklenmedi.")
+        num_workers = num_workers or mp.cpu_count()
+        if num_workers <= 0:
+            raise ValueError("num_workers pozitif olmalıdır.")
+        Loss.get(loss)
+
+        self.network = network
+        self.num_workers = num_workers
+        self.specs: List[LayerSpec] = []
+        for layer in network.layers:
+            activation = layer.activation_function.__name__
+            if Activation.get(activation) is not layer.activation_function:
+                raise ValueError(f"'{layer.name}' katmanının aktivasyonu worker'larda kurulamaz: {activation}")
+            self.specs.append((layer.name, layer.num_neurons, layer.input_dim, activation))
+        # Parametreler ağın depolama tipinde, gradyan ve girdiler hesaplama tipinde paylaşılır
+        self.dtype = network.dtype
+        self.compute_dtype = network.compute_dtype
+        count = _param_count(self.specs)
+
+        # Parametreler paylaşımlı belleğe kopyalanır ve katmanlar bu view'ları kullanır
+        self._params = _SharedArray((count,), self.dtype)
+        self._grads = _SharedArray((num_workers, count), self.compute_dtype)
+        self._grad_sum = np.zeros(count, dtype=self.compute_dtype)
+        for layer, (W, b), (dW, db) in zip(network.layers, _param_views(self._params.array, self.specs),
+                                           _param_views(self._grad_sum, self.specs)):
+            W[...] = layer.weights
+            b[...] = layer.biases
+            layer.set_parameters(W, b)
+            layer.dW, layer.db = dW, db
+
+        self._inputs_X: Optional[_SharedArray] = None
+        self._inputs_y: Optional[_SharedArray] = None
+        self._connections = []
+        self._processes = []
+        context = mp.get_context()
+        for slot in range(num_workers):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(
+                target=_worker_main,
+                args=(child_conn, self.specs, self.dtype, self._params.name, self._grads.name,
+                      num_workers, slot, loss),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._connections.append(parent_conn)
+            self._processes.append(process)
+        logger.info("Started %d data-parallel workers for '%s'.", num_workers, network.name)
+
+    def _ensure_inputs(self, rows: int, output_dim: int):
+        """Girdi buffer'ı yetmiyorsa daha büyüğünü ayırır ve worker'lara bildirir."""
+        if self._inputs_X is not None and self._inputs_X.shape[0] >= rows:
+            return
+        old = (self._inputs_X, self._inputs_y)
+        self._inputs_X = _SharedArray((rows, self.network.input_dim), self.compute_dtype)
+        self._inputs_y = _SharedArray((rows, output_dim), self.compute_dtype)
+        self._broadcast(("inputs", self._inputs_X.name, self._inputs_X.shape,
+                         self._inputs_y.name, self._inputs_y.shape))
+        for shared in old:
+            if shared is not None:
+                shared.close(unlink=True)
+
+    def _broadcast(self, message):
+        for conn in self._connections:
+            conn.send(message)
+        for conn in self._connections:
+            self._receive(conn)
+
+    @staticmethod
+    def _receive(conn):
+        status, value = conn.recv()
+        if status == "error":
+            raise RuntimeError(f"Data-parallel worker'da hata:\n{value}")
+        return value
+
+    def step(self, X_batch: np.ndarray, y_batch: np.ndarray, optimizer: Optimizer) -> float:
+        """
+        Bir mini-batch için paralel forward/backward ve optimizer adımı.
+
+        Returns:
+            float: Batch'in ortalama kaybı (tek process'teki fit ile aynı).
+        """
+        if self._connections is None:
+            raise RuntimeError("Trainer kapatıldı.")
+        if y_batch.ndim == 1:
+            y_batch = y_batch.reshape(-1, 1)
+        rows = X_batch.shape[0]
+        self._ensure_inputs(rows, y_batch.shape[1])
+        self._inputs_X.array[:rows] = X_batch
+        self._inputs_y.array[:rows] = y_batch
+
+        # Satırlar worker'lara olabildiğince eşit bölünür; batch worker sayısından
+        # küçükse sadece ilk 'active' worker çalışır
+        active = min(self.num_workers, rows)
+        bounds = np.linspace(0, rows, active + 1).astype(int)
+        for slot in range(active):
+            self._connections[slot].send(("step", int(bounds[slot]), int(bounds[slot + 1]), rows))
+        total_loss = 0.0
+        for slot in range(active):
+            total_loss += self._receive(self._connections[slot])
+
+        # All-reduce: slotların toplamı katmanların dW/db view'larına yazılır
+        np.sum(self._grads.array[:active], axis=0, out=self._grad_sum)
+        optimizer.step(self.network.layers)
+        return total_loss / rows
+
+    def close(self):
+        """Worker'ları durdurur, parametreleri normal dizilere geri kopyalar ve paylaşımlı belleği bırakır."""
+        if self._connections is None:
+            return
+        for conn in self._connections:
+            try:
+                conn.send(("close",))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for conn in self._connections:
+            conn.close()
+        self._connections = None
+
+        for layer in self.network.layers:
+            layer.set_parameters(layer.weights.copy(), layer.biases.copy())
+        for shared in (self._params, self._grads, self._inputs_X, self._inputs_y):
+            if shared is not None:
+                shared.close(unlink=True)
+        logger.info("Stopped data-parallel workers for '%s'.", self.network.name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+# --- Örnek Kullanım (Test Amaçlı) ---
+if __name__ == '__main__':
+    import time
+
+    np.random.seed(0)
+    X = np.random.rand(20000, 64)
+    y = (X.sum(axis=1, keepdims=True) > 32).astype(float)
+
+    def build():
+        np.random.seed(1)
+        network = NeuralNetwork(input_dim=64, name="ParallelExample")
+        network.add_layer(num_neurons=256, activation_func=Activation.relu)
+        network.add_layer(num_neurons=256, activation_func=Activation.relu)
+        network.add_layer(num_neurons=1, activation_func=Activation.sigmoid)
+        return network
+
+    for workers in (1, 2, 4):
+        network = build()
+        start = time.perf_counter()
+        history = network.fit(X, y, loss="binary_crossentropy", optimizer="adam", batch_size=1024,
+                              epochs=3, learning_rate=0.001, shuffle=False, workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"workers={workers}: {3 * X.shape[0] / elapsed:,.0f} samples/s, final loss {history['loss'][-1]:.6f}")
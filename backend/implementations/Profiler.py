@@ -0,0 +1,156 @@
+import threading
+import numpy as np
+from typing import Any, Dict, List, Tuple
+
+from .Activation import Activation
+from .Network import NeuralNetwork
+
+
+def estimate_flops(layer, phase: str, rows: int) -> int:
+    """
+    Katmanın bir çağrısı için kayan nokta işlem sayısı tahmini.
+      forward:  Z = X . W (2*m*n*k) + bias (m*k) + aktivasyon (~m*k)
+      backward: aktivasyon türevi (~m*k) + dW = X^T . dZ (2*m*n*k) + db (m*k)
+                + dA_prev = dZ . W^T (2*m*n*k, ilk katmanda hesaplanmaz)
+    Aktivasyonların maliyeti (exp, tanh) eleman başına bir işlem sayılır.
+    """
+    n, k = layer.input_dim, layer.num_neurons
+    matmul = 2 * rows * n * k
+    elementwise = rows * k
+    if phase == "forward":
+        return matmul + 2 * elementwise
+    return matmul * (1 if layer.is_first_layer else 2) + 2 * elementwise
+
+
+class Profiler:
+    """
+    Ağın katmanlarına geçici hook'lar ekleyip katman başına çalışma maliyetini toplar.
+
+        with network.profile() as profiler:
+            network.predict(X)
+        profiler.summary()
+
+    Her katman ve faz (forward/backward) için çağrı sayısı, toplam/ortalama/en büyük süre,
+    tahmini FLOP (ve GFLOP/s), katmanın ayırdığı bellek ve son çıktı shape'i tutulur.
+    Hook'lar sadece profiler açıkken takılıdır; kapalıyken katmanlara ek maliyet yoktur.
+    Eşzamanlı tahminlerden gelen çağrılar da toplanır (thread-safe).
+    """
+
+    def __init__(self, network: NeuralNetwork):
+        if not network.layers:
+            raise RuntimeError("Ağa henüz hiçbir katman eklenmedi.")
+        self.network = network
+        self._stats: Dict[Tuple[int, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._attached: List = []
+
+    def start(self):
+        if self._attached:
+            return self
+        for layer in self.network.layers:
+            layer.add_hook(self._record)
+            self._attached.append(layer)
+        return self
+
+    def stop(self):
+        for layer in self._attached:
+            layer.remove_hook(self._record)
+        self._attached = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def _record(self, layer, phase: str, rows: int, output_shape, seconds: float, allocated_bytes: int):
+        index = next((i for i, l in enumerate(self._attached) if l is layer), -1)
+        flops = estimate_flops(layer, phase, rows)
+        with self._lock:
+            stats = self._stats.get((index, phase))
+            if stats is None:
+                stats = self._stats[(index, phase)] = {
+                    "calls": 0, "rows": 0, "seconds": 0.0, "max_seconds": 0.0, "flops": 0, "allocated_bytes": 0,
+                }
+            stats["calls"] += 1
+            stats["rows"] += rows
+            stats["seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+            stats["flops"] += flops
+            stats["allocated_bytes"] += allocated_bytes
+            stats["output_shape"] = list(output_shape) if output_shape is not None else None
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Katman/faz başına satırlar (toplam süreye göre büyükten küçüğe) ve toplamlar.
+        share: satırın tüm profillenen süre içindeki payı; bottleneck: en çok süre alan satır.
+        """
+        layers = self._attached or self.network.layers
+        with self._lock:
+            items = [(key, dict(stats)) for key, stats in self._stats.items()]
+        total_seconds = sum(stats["seconds"] for _, stats in items)
+
+        rows = []
+        for (index, phase), stats in items:
+            layer = layers[index] if 0 <= index < len(layers) else None
+            rows.append({
+                "layer": index,
+                "name": layer.name if layer is not None else None,
+                "phase": phase,
+                "shape": [layer.input_dim, layer.num_neurons] if layer is not None else None,
+                "activation": layer.activation_function.__name__ if layer is not None else None,
+                "calls": stats["calls"],
+                "rows": stats["rows"],
+                "seconds": stats["seconds"],
+                "mean_seconds": stats["seconds"] / stats["calls"],
+                "max_seconds": stats["max_seconds"],
+                "flops": stats["flops"],
+                "gflops_per_sec": stats["flops"] / stats["seconds"] / 1e9 if stats["seconds"] > 0 else None,
+                "allocated_bytes": stats["allocated_bytes"],
+                "output_shape": stats["output_shape"],
+                "share": stats["seconds"] / total_seconds if total_seconds > 0 else None,
+            })
+        rows.sort(key=lambda row: row["seconds"], reverse=True)
+        return {
+            "network": self.network.name,
+            "dtype": str(self.network.dtype),
+            "total_seconds": total_seconds,
+            "total_flops": sum(row["flops"] for row in rows),
+            "total_allocated_bytes": sum(row["allocated_bytes"] for row in rows),
+            "bottleneck": rows[0] if rows else None,
+            "layers": rows,
+        }
+
+    def summary(self):
+        report = self.report()
+        print("-" * 100)
+        print(f"Profile: {report['network']} ({report['dtype']}), total {report['total_seconds'] * 1e3:.3f} ms")
+        print("-" * 100)
+        print(f"{'layer':<24}{'phase':<10}{'calls':>7}{'mean ms':>11}{'share':>8}"
+              f"{'GFLOP/s':>10}{'alloc KiB':>12}  output")
+        for row in report["layers"]:
+            gflops = f"{row['gflops_per_sec']:.2f}" if row["gflops_per_sec"] is not None else "-"
+            share = f"{row['share']:.1%}" if row["share"] is not None else "-"
+            print(f"{str(row['name']):<24}{row['phase']:<10}{row['calls']:>7}{row['mean_seconds'] * 1e3:>11.3f}"
+                  f"{share:>8}{gflops:>10}{row['allocated_bytes'] / 1024:>12.1f}  {row['output_shape']}")
+        print("-" * 100)
+
+
+# --- Örnek Kullanım (Test Amaçlı) ---
+if __name__ == '__main__':
+    network = NeuralNetwork(input_dim=64, name="ProfileExample")
+    network.add_layer(num_neurons=1024, activation_func=Activation.relu)
+    network.add_layer(num_neurons=256, activation_func=Activation.tanh)
+    network.add_layer(num_neurons=10, activation_func=Activation.softmax)
+    X = np.random.rand(256, 64)
+    y = np.eye(10)[np.random.randint(0, 10, 256)]
+
+    with Profiler(network) as profiler:
+        for _ in range(20):
+            network.predict(X)
+            network.compute_gradients(X, y, loss="categorical_crossentropy")
+    profiler.summary()
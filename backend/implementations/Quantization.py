@@ -0,0 +1,261 @@
+import logging
+import numpy as np
+from typing import Any, Dict, List, Optional
+
+from .Activation import Activation
+from .Network import NeuralNetwork
+
+logger = logging.getLogger(__name__)
+
+INT8_MAX = 127
+# Bir katmanın int8 ağırlıkları hesaplama sırasında bu boyutu geçmeyen bloklar halinde
+# float32'ye açılır; böylece tahmin sırasındaki geçici bellek katman boyutundan bağımsızdır.
+DEQUANT_BLOCK_BYTES = 1 << 20
+# quantize(cache_bytes=...) verilirse float32 kopyası bu boyutu geçmeyen katmanların
+# ağırlıkları bir kez açılıp saklanır. Varsayılan 0: kopya kuantizasyonun bellek kazancını
+# geri aldığı için (küçük modellerde float32 ağdan bile büyük olur) sadece istenirse tutulur.
+DEQUANT_CACHE_BYTES = 0
+
+
+class QuantizedLayer:
+    """
+    Ağırlıkları int8 olarak tutulan, sadece tahmin için kullanılan katman.
+
+    Ağırlıklar nöron başına (satır başına) simetrik olarak kuantize edilir:
+        scale_j = max(|W[:, j]|) / 127,   W_q[j, :] = round(W[:, j] / scale_j)
+    W_q shape'i (num_neurons, input_dim) olarak tutulur; her satır bir nöronun
+    ağırlıklarıdır ve kendi ölçeğine sahiptir. Bias'lar float32 kalır.
+
+    İleri yayılımda ölçekler sadece katman çıktısında uygulanır (dequantize katman sınırında):
+        z = (X . W_q^T) * scale + b
+    NumPy int8 x float32 matris çarpımı yapamadığı için W_q her forward çağrısında en fazla
+    DEQUANT_BLOCK_BYTES'lık satır blokları halinde float32'ye çevrilir. Bu, ağırlıkları
+    her çağrıda tekrar okuyup dönüştürmek demektir; karşılığında bellekte sadece int8
+    ağırlıklar ve tek bir blok durur.
+
+    cache_bytes > 0 verilirse float32 kopyası bu boyutu geçmeyen katmanlarda dönüşüm her
+    çağrıda tekrarlanmaz: ölçekler katlanmış float32 ağırlıklar bir kez hesaplanıp saklanır
+    ve forward tek bir matris çarpımıdır. Bu gecikme için belleği geri vermektir; kopya
+    nbytes'a dahildir (model registry bütçesi, kuantizasyon raporu), parameter_nbytes'a değil.
+    """
+
+    def __init__(self, weights_q: np.ndarray, scales: np.ndarray, biases: np.ndarray,
+                 activation_func, name: str, cache_bytes: int = DEQUANT_CACHE_BYTES):
+        self.weights_q = weights_q
+        self.scales = scales
+        self.biases = biases
+        self.activation_function = activation_func
+        self.name = name
+        self.num_neurons, self.input_dim = weights_q.shape
+        self.dtype = np.dtype(np.int8)
+        self.compute_dtype = np.dtype(np.float32)
+        self.is_first_layer = False
+        self.is_output_layer = False
+        # Aynı anda tek bir bloğun float32 kopyası tutulur
+        self.block_rows = max(1, min(self.num_neurons, DEQUANT_BLOCK_BYTES // (4 * self.input_dim)))
+        # Küçük katmanlar için ölçekleri katlanmış float32 ağırlıklar, shape (input_dim, num_neurons)
+        self.cached_weights: Optional[np.ndarray] = None
+        if 4 * weights_q.size <= cache_bytes:
+            self.cached_weights = np.ascontiguousarray(self.dequantized_weights())
+
+    @classmethod
+    def from_layer(cls, layer, cache_bytes: int = DEQUANT_CACHE_BYTES) -> "QuantizedLayer":
+        W = np.asarray(layer.weights, dtype=np.float32)
+        max_abs = np.max(np.abs(W), axis=0)
+        # Tamamen sıfır olan nöronlarda ölçek 1 alınır (sıfıra bölmeyi önlemek için)
+        scales = np.where(max_abs > 0, max_abs / INT8_MAX, 1.0).astype(np.float32)
+        weights_q = np.rint(W.T / scales[:, None])
+        np.clip(weights_q, -INT8_MAX, INT8_MAX, out=weights_q)
+        return cls(np.ascontiguousarray(weights_q, dtype=np.int8), scales,
+                   np.asarray(layer.biases, dtype=np.float32).copy(), layer.activation_function, layer.name,
+                   cache_bytes=cache_bytes)
+
+    def dequantized_weights(self) -> np.ndarray:
+        """Karşılaştırma için float32 ağırlıklar, shape (input_dim, num_neurons)."""
+        return (self.weights_q.astype(np.float32) * self.scales[:, None]).T
+
+    def forward(self, inputs: np.ndarray) -> np.ndarray:
+        """inputs shape (batch_size, input_dim) -> aktivasyonlar (batch_size, num_neurons), float32."""
+        if inputs.ndim != 2 or inputs.shape[1] != self.input_dim:
+            raise ValueError(
+                f"'{self.name}' için girdi boyutu ({inputs.shape[-1] if inputs.ndim else 0}) "
+                f"beklenen boyutla ({self.input_dim}) eşleşmiyor."
+            )
+        if inputs.dtype != self.compute_dtype:
+            inputs = inputs.astype(self.compute_dtype)
+        rows = inputs.shape[0]
+        if self.cached_weights is not None:
+            z = inputs @ self.cached_weights
+            z += self.biases
+            return self._activate(z)
+        z = np.empty((rows, self.num_neurons), dtype=self.compute_dtype)
+        block = np.empty((min(self.block_rows, self.num_neurons), self.input_dim), dtype=self.compute_dtype)
+        partial = np.empty((rows, block.shape[0]), dtype=self.compute_dtype)
+        for start in range(0, self.num_neurons, self.block_rows):
+            end = min(start + self.block_rows, self.num_neurons)
+            n = end - start
+            np.copyto(block[:n], self.weights_q[start:end], casting='unsafe')
+            np.matmul(inputs, block[:n].T, out=partial[:, :n])
+            # Ölçekler blok çıktısını z'ye yazarken uygulanır
+            np.multiply(partial[:, :n], self.scales[start:end], out=z[:, start:end])
+        z += self.biases
+        return self._activate(z)
+
+    def _activate(self, z: np.ndarray) -> np.ndarray:
+        if Activation.is_inplace_safe(self.activation_function):
+            return self.activation_function(z, out=z)
+        return self.activation_function(z)
+
+    @property
+    def parameter_nbytes(self) -> int:
+        """Kuantize parametrelerin boyutu (int8 ağırlıklar, ölçekler, bias'lar)."""
+        return self.weights_q.nbytes + self.scales.nbytes + self.biases.nbytes
+
+    @property
+    def nbytes(self) -> int:
+        cached = self.cached_weights.nbytes if self.cached_weights is not None else 0
+        return self.parameter_nbytes + cached
+
+    def __str__(self):
+        layer_type = " (Output)" if self.is_output_layer else (" (First Hidden)" if self.is_first_layer else "")
+        return (f"QuantizedLayer(Name: {self.name}{layer_type}, Neurons: {self.num_neurons}, "
+                f"Input Dim: {self.input_dim}, "
+                f"Activation: {self.activation_function.__name__}, dtype: int8)")
+
+
+class QuantizedNetwork:
+    """
+    NeuralNetwork'ün int8 kuantize edilmiş, sadece tahmin yapan kopyası.
+
+    Ağırlıklar float32'ye göre 4, float64'e göre 8 kat daha az yer kaplar (nöron başına
+    bir float32 ölçek ve bias eklenir). predict NeuralNetwork.predict ile aynı arayüze
+    sahiptir, bu yüzden model registry'de ve /api/predict'te normal bir model gibi kullanılır.
+    Eğitilemez; eğitim orijinal ağ üzerinde yapılıp tekrar kuantize edilmelidir.
+
+    cache_bytes: float32 kopyası bu boyutu geçmeyen katmanlar açılmış ağırlıklarını saklar
+    (bkz. QuantizedLayer); varsayılan 0'da tüm katmanlar her çağrıda bloklar halinde açılır.
+    """
+
+    def __init__(self, network: NeuralNetwork, cache_bytes: int = DEQUANT_CACHE_BYTES):
+        if not network.layers:
+            raise RuntimeError("Ağa henüz hiçbir katman eklenmedi.")
+        self.name = f"{network.name}_int8"
+        self.input_dim = network.input_dim
+        self.dtype = np.dtype(np.int8)
+        # Kuantize ağ değiştirilemez, sürümü sabittir
+        self.version = (0,)
+        self.layers: List[QuantizedLayer] = [QuantizedLayer.from_layer(layer, cache_bytes)
+                                              for layer in network.layers]
+        self.layers[0].is_first_layer = True
+        self.layers[-1].is_output_layer = True
+        # Kaynak ağın parametre boyutu (rapor için)
+        self.source_nbytes = sum(layer.weights.nbytes + layer.biases.nbytes for layer in network.layers)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        single = X.ndim == 1
+        if single:
+            X = X.reshape(1, -1)
+        if X.ndim != 2 or X.shape[1] != self.input_dim:
+            raise ValueError(
+                f"Ağ girdisinin boyutu ({X.shape[-1] if X.ndim else 0}) beklenen boyutla "
+                f"({self.input_dim}) eşleşmiyor."
+            )
+        current = X
+        for layer in self.layers:
+            current = layer.forward(current)
+        return current[0] if single else current
+
+    @property
+    def parameter_nbytes(self) -> int:
+        return sum(layer.parameter_nbytes for layer in self.layers)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(layer.nbytes for layer in self.layers)
+
+    def summary(self):
+        print("-" * 50)
+        print(f"Quantized Network Summary: {self.name}")
+        print(f"Input Dimension: {self.input_dim}")
+        print("-" * 50)
+        for i, layer in enumerate(self.layers):
+            print(f"  {i}: {layer}")
+        print("-" * 50)
+        print(f"Memory: {self.nbytes} bytes (float: {self.source_nbytes} bytes, "
+              f"{self.source_nbytes / self.nbytes:.1f}x smaller), "
+              f"{self.nbytes - self.parameter_nbytes} bytes of cached float32 weights")
+        print("-" * 50)
+
+
+def quantize(network: NeuralNetwork, cache_bytes: int = DEQUANT_CACHE_BYTES) -> QuantizedNetwork:
+    """Ağın int8 kuantize edilmiş tahmin kopyasını oluşturur (orijinal ağ değişmez)."""
+    return QuantizedNetwork(network, cache_bytes)
+
+
+def quantization_report(network: NeuralNetwork, quantized: QuantizedNetwork, X: np.ndarray,
+                        y: Optional[np.ndarray] = None) -> Dict[str, Any]:
+    """
+    Kuantize ağın doğruluğunu orijinal (float) ağla karşılaştırır.
+
+    Returns:
+        max_abs_error / mean_abs_error: Çıktılar arasındaki fark.
+        max_rel_error: max_abs_error'un float çıktının en büyük mutlak değerine oranı.
+        prediction_agreement: Sınıf tahminlerinin aynı olduğu satır oranı (çok çıktılıda argmax,
+                              tek çıktılıda 0.5 eşiği; çıktı aktivasyonu sigmoid/softmax değilse None).
+        float_accuracy / quantized_accuracy: y verilirse ve sınıflandırma ise doğruluk.
+        float_nbytes / quantized_nbytes / compression: Bellekte kaplanan boyut; quantized_nbytes
+                                                       float32 kopyalarını da içerir.
+        quantized_parameter_nbytes: Sadece int8 ağırlıklar, ölçekler ve bias'lar.
+    """
+    expected = network.predict(X).astype(np.float64)
+    actual = quantized.predict(X).astype(np.float64)
+    if expected.ndim == 1:
+        expected, actual = expected.reshape(1, -1), actual.reshape(1, -1)
+    error = np.abs(actual - expected)
+    scale = max(float(np.max(np.abs(expected))), np.finfo(np.float64).tiny)
+    report: Dict[str, Any] = {
+        "num_rows": int(expected.shape[0]),
+        "max_abs_error": float(error.max()),
+        "mean_abs_error": float(error.mean()),
+        "max_rel_error": float(error.max()) / scale,
+        "prediction_agreement": None,
+        "float_accuracy": None,
+        "quantized_accuracy": None,
+        "float_nbytes": int(quantized.source_nbytes),
+        "quantized_nbytes": int(quantized.nbytes),
+        "quantized_parameter_nbytes": int(quantized.parameter_nbytes),
+        "compression": quantized.source_nbytes / quantized.nbytes,
+    }
+
+    output_activation = network.layers[-1].activation_function
+    if output_activation in (Activation.sigmoid, Activation.softmax):
+        def classes(outputs):
+            return outputs.argmax(axis=1) if outputs.shape[1] > 1 else (outputs[:, 0] > 0.5).astype(int)
+
+        expected_classes, actual_classes = classes(expected), classes(actual)
+        report["prediction_agreement"] = float(np.mean(expected_classes == actual_classes))
+        if y is not None:
+            y = np.asarray(y)
+            y_classes = y.argmax(axis=1) if y.ndim == 2 and y.shape[1] > 1 else (y.reshape(-1) > 0.5).astype(int)
+            report["float_accuracy"] = float(np.mean(expected_classes == y_classes))
+            report["quantized_accuracy"] = float(np.mean(actual_classes == y_classes))
+    return report
+
+
+# --- Örnek Kullanım (Test Amaçlı) ---
+if __name__ == '__main__':
+    np.random.seed(0)
+    X = np.random.rand(2000, 32)
+    labels = (X[:, :16].sum(axis=1) > X[:, 16:].sum(axis=1)).astype(int) + 2 * (X[:, 0] > 0.5)
+    y = np.eye(4)[labels]
+
+    network = NeuralNetwork(input_dim=32, name="QuantizeExample")
+    network.add_layer(num_neurons=256, activation_func=Activation.relu)
+    network.add_layer(num_neurons=128, activation_func=Activation.relu)
+    network.add_layer(num_neurons=4, activation_func=Activation.softmax)
+    network.fit(X, y, loss="categorical_crossentropy", optimizer="adam", epochs=10, learning_rate=0.005)
+
+    quantized = quantize(network)
+    quantized.summary()
+    for key, value in quantization_report(network, quantized, X, y).items():
+        print(f"{key}: {value}")
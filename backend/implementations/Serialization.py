@@ -0,0 +1,141 @@
+import json
+import os
+import struct
+import numpy as np
+from typing import Optional
+
+from .Activation import Activation
+from .Layer import Layer
+from .Network import NeuralNetwork
+
+# Dosya formatı (tek dosya, header + düz buffer):
+#
+#   [0:8)    MAGIC
+#   [8:16)   header uzunluğu (little-endian uint64)
+#   [16:..)  JSON header (utf-8)
+#   padding  veri bölümü ALIGNMENT'a hizalanır
+#   data     tüm katmanların weights ve biases dizileri, her biri ALIGNMENT'a hizalı,
+#            C-order ham byte olarak arka arkaya
+#
+# Header ağın yapısını (input_dim, isim, katmanlar, aktivasyon isimleri) ve her
+# dizinin veri bölümündeki offset/dtype/shape bilgisini tutar. Yükleme sırasında
+# veri bölümü tek bir np.memmap ile açılır ve diziler bunun üzerindeki view'lar
+# olur; dosya boyutundan bağımsız olarak sabit sürede yüklenir ve aynı dosyayı
+# açan process'ler aynı sayfaları paylaşır.
+
+MAGIC = b"DNNGv1\x00\x00"
+ALIGNMENT = 64
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def save_network(network: NeuralNetwork, path: str):
+    """Ağın yapısını ve tüm parametrelerini tek bir dosyaya yazar."""
+    if not network.layers:
+        raise ValueError("Katmanı olmayan bir ağ kaydedilemez.")
+
+    arrays = []
+    layers_meta = []
+    offset = 0
+    for layer in network.layers:
+        meta = {
+            "name": layer.name,
+            "num_neurons": layer.num_neurons,
+            "input_dim": layer.input_dim,
+            "activation": layer.activation_function.__name__,
+        }
+        for key, array in (("weights", layer.weights), ("biases", layer.biases)):
+            array = np.ascontiguousarray(array)
+            offset = _align(offset)
+            meta[key] = {"offset": offset, "dtype": array.dtype.str, "shape": list(array.shape)}
+            arrays.append((offset, array))
+            offset += array.nbytes
+        layers_meta.append(meta)
+
+    header = {
+        "name": network.name,
+        "input_dim": network.input_dim,
+        "dtype": str(network.dtype),
+        "layers": layers_meta,
+    }
+    header_bytes = json.dumps(header).encode("utf-8")
+    data_start = _align(len(MAGIC) + 8 + len(header_bytes))
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header_bytes)))
+        f.write(header_bytes)
+        for array_offset, array in arrays:
+            f.seek(data_start + array_offset)
+            f.write(array.tobytes())
+        # Son dizi boyutu sıfırsa bile dosya veri bölümünün sonuna kadar uzansın
+        f.truncate(data_start + offset)
+
+
+def _array_end(meta: dict) -> int:
+    """Dizinin veri bölümündeki bitiş offset'i."""
+    return meta["offset"] + np.dtype(meta["dtype"]).itemsize * int(np.prod(meta["shape"]))
+
+
+def read_header(path: str) -> dict:
+    """Sadece header'ı okur (parametrelere dokunmadan modelin yapısını incelemek için)."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"'{path}' geçerli bir ağ dosyası değil.")
+        length = f.read(8)
+        header_bytes = f.read(struct.unpack("<Q", length)[0]) if len(length) == 8 else b""
+    try:
+        header = json.loads(header_bytes.decode("utf-8"))
+    except ValueError:
+        # Kesik dosyada header yarım kalır (JSONDecodeError ve UnicodeDecodeError ValueError'dır)
+        raise ValueError(f"'{path}' dosyasının header'ı okunamadı (dosya kesik veya bozuk).") from None
+    header["data_start"] = _align(len(MAGIC) + 8 + len(header_bytes))
+    return header
+
+
+def load_network(path: str, mmap_mode: Optional[str] = "c") -> NeuralNetwork:
+    """
+    save_network ile yazılmış ağı yükler.
+
+    mmap_mode:
+        "c"  (varsayılan) copy-on-write memmap. Sayfalar process'ler arasında paylaşılır,
+             eğitim gibi yazma işlemleri sadece o process'in kopyasını değiştirir.
+        "r"  salt okunur memmap. Sadece tahmin yapan servis worker'ları için.
+        "r+" dosyaya geri yazan memmap (eğitimle güncellenen ağırlıklar dosyaya yansır).
+        None dosyayı belleğe okur (memmap kullanılmaz).
+    """
+    header = read_header(path)
+    data_start = header["data_start"]
+    data_size = os.path.getsize(path) - data_start
+    expected_size = max((_array_end(meta[key]) for meta in header["layers"] for key in ("weights", "biases")),
+                        default=0)
+    if data_size < expected_size:
+        raise ValueError(f"'{path}' eksik: veri bölümü {max(data_size, 0)} byte, beklenen {expected_size} byte.")
+
+    if mmap_mode is None:
+        with open(path, "rb") as f:
+            f.seek(data_start)
+            buffer = np.frombuffer(bytearray(f.read()), dtype=np.uint8)
+    else:
+        buffer = np.memmap(path, dtype=np.uint8, mode=mmap_mode, offset=data_start)
+
+    def view(meta):
+        start = meta["offset"]
+        return buffer[start:_array_end(meta)].view(np.dtype(meta["dtype"])).reshape(tuple(meta["shape"]))
+
+    # Eski dosyalarda dtype alanı yok; ağın tipi ilk katmanın ağırlık tipinden alınır
+    dtype = header.get("dtype") or header["layers"][0]["weights"]["dtype"]
+    network = NeuralNetwork(input_dim=header["input_dim"], name=header["name"], dtype=dtype)
+    for meta in header["layers"]:
+        layer = Layer(
+            num_neurons=meta["num_neurons"],
+            input_dim=meta["input_dim"],
+            activation_func=Activation.get(meta["activation"]),
+            name=meta["name"],
+            weights=view(meta["weights"]),
+            biases=view(meta["biases"]),
+        )
+        network._append_layer(layer)
+    return network
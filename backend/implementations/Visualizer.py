@@ -1,230 +1,235 @@
 # backend/Visualizer.py
 
-import matplotlib.pyplot as plt
+import io
 import numpy as np
-from typing import List, Tuple, Dict, Optional
-
-# NeuralNetwork sınıfını import etmemiz gerekiyor (dosya yolunu kontrol et)
-# Aktivasyon fonksiyonları sadece örnek kullanım için gerekebilir.
-try:
-    from backend.NeuralNetwork import NeuralNetwork
-    # Örnek kullanım için gerekebilir:
-    # from backend.Activation import Activation
-except ImportError:
-    print("Warning: Could not import NeuralNetwork from backend.NeuralNetwork.")
-    # Bu, dosyanın tek başına test edilmesini zorlaştırabilir
-    # ama ana uygulama içinde çalışmasını engellemez.
-    NeuralNetwork = None # Placeholder
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import EllipseCollection, LineCollection
+from matplotlib.figure import Figure
+from typing import List, Optional
+
+from .Network import NeuralNetwork
+
 
 class Visualizer:
     """
     Bir NeuralNetwork nesnesini katman katman görselleştirmek için bir sınıf.
+
+    Çizim boyutu ağ boyutundan bağımsızdır: tüm bağlantılar tek bir LineCollection,
+    tüm nöronlar tek bir EllipseCollection olarak eklenir (bağlantı veya nöron başına
+    ax.plot / plt.Circle çağrısı yapılmaz). max_neurons_per_layer'dan büyük katmanların
+    sadece baştaki ve sondaki nöronları çizilir, aradakiler "... N more" olarak özetlenir;
+    böylece 784-512-256-10 gibi bir ağ da bir saniyenin altında çizilir.
     """
 
-    def __init__(self, network: NeuralNetwork):
+    def __init__(self, network: NeuralNetwork, max_neurons_per_layer: int = 16,
+                 color_by_weight: bool = False):
         """
         Görselleştiriciyi başlatır.
 
         Args:
             network (NeuralNetwork): Görselleştirilecek NeuralNetwork nesnesi.
+            max_neurons_per_layer (int): Bir katmanda çizilecek en fazla nöron sayısı;
+                                         daha büyük katmanlar özetlenir.
+            color_by_weight (bool): True ise bağlantılar ağırlığa göre renklendirilir
+                                    (renk işareti, koyuluk büyüklüğü gösterir).
 
         Raises:
             TypeError: Eğer girdi bir NeuralNetwork nesnesi değilse.
             ValueError: Eğer ağın görselleştirme için yeterli yapısı yoksa (örn. katman yoksa).
         """
-        if NeuralNetwork is None:
-             raise ImportError("NeuralNetwork class could not be imported. Cannot initialize Visualizer.")
-
         if not isinstance(network, NeuralNetwork):
             raise TypeError("Input must be an instance of NeuralNetwork.")
         if not network.layers:
             raise ValueError("Cannot visualize a network with no processing layers.")
+        if max_neurons_per_layer < 2:
+            raise ValueError("max_neurons_per_layer must be at least 2.")
 
-        # --- Katman Boyutlarını Ağ Nesnesinden Çıkar ---
-        # İlk eleman ağın girdi boyutu
-        self.layer_sizes: List[int] = [network.input_dim]
-        # Sonraki elemanlar her katmandaki nöron sayıları
-        self.layer_sizes.extend([layer.num_neurons for layer in network.layers])
-        # --- Bitti ---
-
+        # İlk eleman ağın girdi boyutu, sonraki elemanlar her katmandaki nöron sayıları
+        self.layer_sizes: List[int] = [network.input_dim] + [layer.num_neurons for layer in network.layers]
         self.num_layers = len(self.layer_sizes) # Toplam katman sayısı (girdi dahil)
         self.network_name = network.name # Ağın ismini al (başlık için)
+        self.network = network
+        self.max_neurons_per_layer = max_neurons_per_layer
+        self.color_by_weight = color_by_weight
 
         # Çizim parametreleri
         self.neuron_radius = 0.3
         self.layer_spacing = 3.0 # Katmanlar arası yatay boşluk
         self.neuron_spacing = 0.8 # Nöronlar arası dikey boşluk
+        # Bu sayıdan az nöron çiziliyorsa nöronlara a_i^(l) etiketleri yazılır
+        self.max_labeled_neurons = 60
 
-        # Nöron pozisyonlarını hesapla (burada veya draw içinde yapılabilir)
-        self.neuron_positions = self._calculate_positions()
-
-
-    def _calculate_positions(self) -> Dict[Tuple[int, int], Tuple[float, float]]:
-        """Her nöronun (x, y) koordinatlarını hesaplar."""
-        positions = {}
-        if not self.layer_sizes:
-            return positions
-
-        max_neurons_in_layer = max(self.layer_sizes) if self.layer_sizes else 0
-        if max_neurons_in_layer == 0:
-            return positions # Boş ağ veya katman boyutu hatası
+        self.shown_indices, self.neuron_y, self.gap_y = self._calculate_positions()
 
-        vertical_span = (max_neurons_in_layer - 1) * self.neuron_spacing
+    def _calculate_positions(self):
+        """
+        Her katman için çizilecek nöronların indekslerini ve y koordinatlarını hesaplar.
+        Özetlenen katmanlarda ortada "... N more" yazısı için bir boşluk (gap_y) bırakılır.
+        """
+        shown_indices, neuron_y, gap_y = [], [], []
+        slots = [min(size, self.max_neurons_per_layer + 1) for size in self.layer_sizes]
+        vertical_span = (max(slots) - 1) * self.neuron_spacing
+
+        for size, num_slots in zip(self.layer_sizes, slots):
+            # Nöronları dikey olarak ortala
+            y_start = (vertical_span - (num_slots - 1) * self.neuron_spacing) / 2
+            slot_y = y_start + np.arange(num_slots) * self.neuron_spacing
+            if size <= self.max_neurons_per_layer:
+                shown_indices.append(np.arange(size))
+                neuron_y.append(slot_y)
+                gap_y.append(None)
+            else:
+                head = self.max_neurons_per_layer // 2
+                tail = self.max_neurons_per_layer - head
+                shown_indices.append(np.concatenate((np.arange(head), np.arange(size - tail, size))))
+                neuron_y.append(np.concatenate((slot_y[:head], slot_y[head + 1:])))
+                gap_y.append(slot_y[head])
+        return shown_indices, neuron_y, gap_y
+
+    def _edges(self):
+        """Tüm bağlantıların (E, 2, 2) segment dizisi ve (renklendirme açıksa) ağırlıkları."""
+        segments, weights = [], []
+        for layer_idx in range(self.num_layers - 1):
+            x0, x1 = layer_idx * self.layer_spacing, (layer_idx + 1) * self.layer_spacing
+            y0, y1 = self.neuron_y[layer_idx], self.neuron_y[layer_idx + 1]
+            pairs = np.empty((y0.size, y1.size, 2, 2))
+            pairs[:, :, 0, 0] = x0
+            pairs[:, :, 0, 1] = y0[:, None]
+            pairs[:, :, 1, 0] = x1
+            pairs[:, :, 1, 1] = y1[None, :]
+            segments.append(pairs.reshape(-1, 2, 2))
+            if self.color_by_weight:
+                W = self.network.layers[layer_idx].weights
+                rows, cols = self.shown_indices[layer_idx], self.shown_indices[layer_idx + 1]
+                weights.append(np.asarray(W[np.ix_(rows, cols)], dtype=np.float64).reshape(-1))
+        return np.concatenate(segments), (np.concatenate(weights) if weights else None)
+
+    def _draw_on(self, ax, title: str):
+        """Ağı verilen eksene çizer (draw ve başsız dışa aktarma için ortak)."""
+        ax.axis('off') # Eksenleri kapat
+        last = self.num_layers - 1
+        top_y = max(y.max() for y in self.neuron_y)
+        label_y_pos = top_y + self.neuron_radius * 3.5
 
-        for layer_idx, num_neurons in enumerate(self.layer_sizes):
+        # --- Katman Etiketleri ---
+        ax.text(0, label_y_pos, "Input\nLayer",
+                ha='center', va='center', fontsize=14, color='green', fontweight='bold')
+        if self.num_layers > 2: # Girdi + en az 1 gizli + çıktı varsa
+            hidden_center_x = (1 + (last - 1)) / 2 * self.layer_spacing
+            ax.text(hidden_center_x, label_y_pos, "Hidden Layers",
+                    ha='center', va='center', fontsize=14, color='blue', fontweight='bold')
+        ax.text(last * self.layer_spacing, label_y_pos, "Output\nLayer",
+                ha='center', va='center', fontsize=14, color='red', fontweight='bold')
+
+        # --- Bağlantılar: tek LineCollection ---
+        segments, weights = self._edges()
+        linewidth = 1.0 if len(segments) < 500 else 0.4
+        if weights is not None:
+            limit = float(np.max(np.abs(weights))) or 1.0
+            edges = LineCollection(segments, cmap='coolwarm', linewidths=linewidth, zorder=1)
+            edges.set_array(weights)
+            edges.set_clim(-limit, limit)
+            # Büyük ağırlıklar daha opak çizilir
+            colors = edges.to_rgba(weights)
+            colors[:, 3] = 0.15 + 0.85 * np.abs(weights) / limit
+            edges.set_array(None)
+            edges.set_color(colors)
+        else:
+            edges = LineCollection(segments, colors='darkblue', alpha=0.6 if len(segments) < 500 else 0.25,
+                                   linewidths=linewidth, zorder=1)
+        ax.add_collection(edges)
+
+        # --- Nöronlar: tek EllipseCollection ---
+        offsets = np.concatenate([np.column_stack((np.full(y.size, i * self.layer_spacing), y))
+                                  for i, y in enumerate(self.neuron_y)])
+        layer_of = np.concatenate([np.full(y.size, i) for i, y in enumerate(self.neuron_y)])
+        face = np.where(layer_of == 0, 'lightgreen', np.where(layer_of == last, 'lightcoral', 'lightblue'))
+        edge = np.where(layer_of == 0, 'darkgreen', np.where(layer_of == last, 'darkred', 'darkblue'))
+        diameter = 2 * self.neuron_radius
+        neurons = EllipseCollection(np.full(len(offsets), diameter), np.full(len(offsets), diameter),
+                                    np.zeros(len(offsets)), units='xy', offsets=offsets,
+                                    offset_transform=ax.transData, facecolors=face, edgecolors=edge,
+                                    linewidths=1.5, zorder=2)
+        ax.add_collection(neurons)
+
+        # Nöron etiketleri (sadece küçük çizimlerde; LaTeX etiketleri yavaştır)
+        if len(offsets) <= self.max_labeled_neurons:
+            for layer_idx, (indices, ys) in enumerate(zip(self.shown_indices, self.neuron_y)):
+                x = layer_idx * self.layer_spacing
+                for neuron_idx, y in zip(indices, ys):
+                    ax.text(x, y, rf'$a_{{{neuron_idx + 1}}}^{{({layer_idx})}}$',
+                            ha='center', va='center', fontsize=10, color='black', zorder=3)
+
+        # Özetlenen katmanlar ve katman boyutları
+        bottom_y = min(y.min() for y in self.neuron_y) - self.neuron_radius * 2.5
+        for layer_idx, (size, indices, gap) in enumerate(zip(self.layer_sizes, self.shown_indices, self.gap_y)):
             x = layer_idx * self.layer_spacing
-            # Nöronları dikey olarak ortalamak için başlangıç y'sini hesapla
-            current_vertical_span = (num_neurons - 1) * self.neuron_spacing
-            # vertical_span sıfırsa (tek nöronlu katmanlar), y_start da sıfır olmalı
-            y_start = (vertical_span - current_vertical_span) / 2 if vertical_span > 0 else 0
+            if gap is not None:
+                ax.text(x, gap, f"... {size - indices.size} more", ha='center', va='center', fontsize=9,
+                        color='dimgray', zorder=3,
+                        bbox=dict(boxstyle='round,pad=0.2', facecolor='white', edgecolor='none'))
+            ax.text(x, bottom_y, str(size), ha='center', va='center', fontsize=10, color='dimgray')
+
+        ax.set_xlim(-self.layer_spacing / 2, last * self.layer_spacing + self.layer_spacing / 2)
+        ax.set_ylim(bottom_y - self.neuron_radius * 2, label_y_pos + self.neuron_radius * 3)
+        ax.set_aspect('equal', adjustable='box')
+        ax.set_title(title, fontsize=16, y=1.02)
+
+    def _figsize(self):
+        height = max(y.max() for y in self.neuron_y) - min(y.min() for y in self.neuron_y)
+        fig_height = (height + self.neuron_radius * 10) * 0.8
+        fig_width = ((self.num_layers - 1) * self.layer_spacing + self.layer_spacing) * 0.8
+        return max(fig_width, 6), max(fig_height, 4)
 
-            for neuron_idx in range(num_neurons):
-                y = y_start + neuron_idx * self.neuron_spacing
-                positions[(layer_idx, neuron_idx)] = (x, y)
-        return positions
+    def render(self, format: str = "svg", title: Optional[str] = None, dpi: int = 100) -> bytes:
+        """
+        Çizimi ekran gerektirmeden (Agg) SVG veya PNG byte'ları olarak döndürür.
+        pyplot kullanılmaz, bu yüzden sunucu thread'lerinden çağrılabilir.
+        """
+        if format not in ("svg", "png"):
+            raise ValueError(f"Desteklenmeyen format: {format} (svg veya png olmalı).")
+        if title is None:
+            title = f"{self.network_name} Visualization"
+        fig = Figure(figsize=self._figsize())
+        FigureCanvasAgg(fig)
+        self._draw_on(fig.add_subplot(), title)
+        fig.tight_layout(pad=2.0)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=format, dpi=dpi)
+        return buffer.getvalue()
 
     def draw(self, title: Optional[str] = None):
-        """Sinir ağını çizer."""
-        if not self.neuron_positions:
-             print("Cannot draw: No neuron positions calculated (empty or invalid network structure?).")
-             return
+        """Sinir ağını çizer (ekran gerekir; sunucuda render kullanılmalı)."""
+        import matplotlib.pyplot as plt
 
         if title is None:
             title = f"{self.network_name} Visualization" # Ağ ismini varsayılan başlık yap
-
-        # --- Figür ve Eksen Hazırlığı ---
-        # Daha dinamik figsize hesaplaması
-        max_y = max(pos[1] for pos in self.neuron_positions.values()) if self.neuron_positions else 0
-        min_y = min(pos[1] for pos in self.neuron_positions.values()) if self.neuron_positions else 0
-        max_x = max(pos[0] for pos in self.neuron_positions.values()) if self.neuron_positions else 0
-
-        # Etiketler için ekstra alan bırak
-        fig_height = (max_y - min_y + self.neuron_radius * 4 + self.neuron_spacing) * 0.8
-        fig_width = (max_x + self.neuron_radius * 2 + self.layer_spacing) * 0.8
-        # Minimum boyutlar belirle
-        fig_height = max(fig_height, 4)
-        fig_width = max(fig_width, 6)
-
-        fig, ax = plt.subplots(figsize=(fig_width, fig_height))
-        ax.axis('off') # Eksenleri kapat
-
-        # --- Katman Etiketleri ---
-        layer_labels = ["Input\nLayer", "Hidden Layers", "Output\nLayer"]
-        label_colors = ['green', 'blue', 'red']
-
-        # Etiket Y pozisyonu (en üst nöronun biraz üstü)
-        label_y_pos = max_y + self.neuron_radius * 2.5
-
-        # Input Label
-        input_x_pos = self.neuron_positions.get((0, 0), (0,0))[0] # İlk katman x'i
-        ax.text(input_x_pos, label_y_pos, layer_labels[0],
-                ha='center', va='center', fontsize=14, color=label_colors[0], fontweight='bold')
-
-        # Hidden Label(s) - Sadece 2'den fazla işlem katmanı varsa
-        # self.num_layers girdi dahil toplam katman sayısıdır.
-        # Yani 1 girdi + N işlem katmanı = N+1 self.num_layers
-        # Gizli katmanlar 1'den başlayıp self.num_layers - 2'ye kadar gider.
-        if self.num_layers > 2: # Girdi + en az 1 gizli + çıktı varsa
-             hidden_start_x = self.neuron_positions.get((1, 0), (0,0))[0]
-             hidden_end_x = self.neuron_positions.get((self.num_layers - 2, 0), (0,0))[0]
-             hidden_center_x = hidden_start_x + (hidden_end_x - hidden_start_x) / 2
-             ax.text(hidden_center_x, label_y_pos, layer_labels[1],
-                     ha='center', va='center', fontsize=14, color=label_colors[1], fontweight='bold')
-
-        # Output Label
-        output_layer_idx = self.num_layers - 1
-        output_x_pos = self.neuron_positions.get((output_layer_idx, 0), (0,0))[0]
-        ax.text(output_x_pos, label_y_pos, layer_labels[2],
-                ha='center', va='center', fontsize=14, color=label_colors[2], fontweight='bold')
-
-
-        # --- Bağlantıları Çiz ---
-        # self.num_layers girdi dahil toplam katman sayısıdır.
-        if self.num_layers > 1:
-            for layer_idx in range(self.num_layers - 1): # 0'dan başlar, sondan bir öncekine kadar
-                for neuron_idx_curr in range(self.layer_sizes[layer_idx]):
-                    for neuron_idx_next in range(self.layer_sizes[layer_idx + 1]):
-                        pos_curr = self.neuron_positions[(layer_idx, neuron_idx_curr)]
-                        pos_next = self.neuron_positions[(layer_idx + 1, neuron_idx_next)]
-
-                        ax.plot([pos_curr[0], pos_next[0]], [pos_curr[1], pos_next[1]],
-                                color='darkblue', alpha=0.6, zorder=1)
-
-
-        # --- Nöronları Çiz ---
-        for layer_idx in range(self.num_layers):
-            for neuron_idx in range(self.layer_sizes[layer_idx]):
-                x, y = self.neuron_positions[(layer_idx, neuron_idx)]
-
-                # Katmana göre renk belirle (0: girdi, son: çıktı, arası: gizli)
-                if layer_idx == 0:
-                    color = 'lightgreen'
-                    edge_color = 'darkgreen'
-                elif layer_idx == self.num_layers - 1:
-                    color = 'lightcoral'
-                    edge_color = 'darkred'
-                else:
-                    color = 'lightblue'
-                    edge_color = 'darkblue'
-
-                circle = plt.Circle((x, y), radius=self.neuron_radius,
-                                    facecolor=color, edgecolor=edge_color,
-                                    linewidth=1.5, zorder=2)
-                ax.add_patch(circle)
-
-                # Nöron etiketini ekle (LaTeX formatında: a_{neuron_index}^{(layer_index)})
-                label = rf'$a_{{{neuron_idx + 1}}}^{{({layer_idx})}}$'
-                ax.text(x, y, label, ha='center', va='center', fontsize=10, color='black', zorder=3)
-
-        ax.set_aspect('equal', adjustable='box')
-        plt.title(title, fontsize=16, y=1.05) # Başlığı biraz yukarı al
-        plt.tight_layout(pad=2.0)
+        fig, ax = plt.subplots(figsize=self._figsize())
+        self._draw_on(ax, title)
+        fig.tight_layout(pad=2.0)
         plt.show()
 
 
 # --- Örnek Kullanım ---
 if __name__ == '__main__':
-    # Bu bloğun çalışması için NeuralNetwork ve Activation'ın import edilebilmesi lazım
-    if NeuralNetwork:
-        # backend.Activation'dan import varsayımıyla
-        try:
-             # Aktivasyon fonksiyonlarını import et
-             from backend.Activation import Activation
-        except ImportError:
-             print("Warning: Could not import Activation class for example.")
-             # Örnek kullanım için placeholder fonksiyonlar tanımlayalım
-             class Activation:
-                 @staticmethod
-                 def relu(z): return np.maximum(0, z)
-                 @staticmethod
-                 def linear(z): return z
-                 @staticmethod
-                 def sigmoid(z): return 1 / (1 + np.exp(-z))
-
-        print("--- Visualizer Example ---")
-        # 1. Ağ Nesnesini Oluştur
-        # Paylaşılan görseldeki yapı: [4, 5, 5, 5, 3]
-        nn_vis_example = NeuralNetwork(input_dim=4, name="Deep Network Example")
-        nn_vis_example.add_layer(num_neurons=5, activation_func=Activation.relu)
-        nn_vis_example.add_layer(num_neurons=5, activation_func=Activation.relu)
-        nn_vis_example.add_layer(num_neurons=5, activation_func=Activation.relu)
-        nn_vis_example.add_layer(num_neurons=3, activation_func=Activation.linear) # Örnek: Lineer çıktı
-
-        nn_vis_example.summary()
-
-        # 2. Visualizer Nesnesini Oluştur (Ağ nesnesini vererek)
-        visualizer_instance = Visualizer(network=nn_vis_example)
-
-        # 3. Görseli Çizdir
-        visualizer_instance.draw() # Varsayılan başlık ağın ismini kullanır
-
-        print("\n--- Simple Network Example ---")
-        simple_net = NeuralNetwork(input_dim=2, name="Simple MLP")
-        simple_net.add_layer(num_neurons=3, activation_func=Activation.sigmoid)
-        simple_net.add_layer(num_neurons=1, activation_func=Activation.sigmoid)
-        simple_net.summary()
-        simple_vis = Visualizer(simple_net)
-        simple_vis.draw(title="Simple Network Structure")
-
-    else:
-        print("Could not run Visualizer example because NeuralNetwork class was not imported.")
\ No newline at end of file
+    import time
+
+    from .Activation import Activation
+
+    print("--- Visualizer Example ---")
+    # Paylaşılan görseldeki yapı: [4, 5, 5, 5, 3]
+    nn_vis_example = NeuralNetwork(input_dim=4, name="Deep Network Example")
+    nn_vis_example.add_layer(num_neurons=5, activation_func=Activation.relu)
+    nn_vis_example.add_layer(num_neurons=5, activation_func=Activation.relu)
+    nn_vis_example.add_layer(num_neurons=5, activation_func=Activation.relu)
+    nn_vis_example.add_layer(num_neurons=3, activation_func=Activation.linear) # Örnek: Lineer çıktı
+    Visualizer(network=nn_vis_example).draw() # Varsayılan başlık ağın ismini kullanır
+
+    # Büyük bir ağ: katmanlar özetlenir, bağlantılar ağırlığa göre renklendirilir
+    mnist = NeuralNetwork(input_dim=784, name="MNIST MLP")
+    mnist.add_layer(num_neurons=512, activation_func=Activation.relu)
+    mnist.add_layer(num_neurons=256, activation_func=Activation.relu)
+    mnist.add_layer(num_neurons=10, activation_func=Activation.softmax)
+    start = time.perf_counter()
+    png = Visualizer(mnist, color_by_weight=True).render("png", title="784-512-256-10")
+    print(f"784-512-256-10 rendered in {time.perf_counter() - start:.3f} s ({len(png)} bytes PNG)")
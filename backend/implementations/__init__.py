@@ -0,0 +1,73 @@
+"""
+Sinir ağı kütüphanesi.
+
+Paketin kendisi hiçbir alt modülü import etmez: isimler ilk erişildiklerinde (PEP 562
+__getattr__) yüklenir. Böylece örn. sadece tahmin yapan bir servis matplotlib
+(Visualizer), multiprocessing (Parallel) veya eğitim yardımcılarını hiç yüklemez.
+
+    from implementations import NeuralNetwork      # sadece Network ve bağımlılıkları yüklenir
+    import implementations; implementations.Visualizer   # matplotlib burada yüklenir
+"""
+
+import importlib
+import sys
+import types
+
+# isim -> tanımlandığı alt modül
+_LAZY_ATTRIBUTES = {
+    "Activation": "Activation",
+    "Layer": "Layer",
+    "Loss": "Loss",
+    "NeuralNetwork": "Network",
+    "Neuron": "Neuron",
+    "Optimizer": "Optimizer",
+    "StreamingDataLoader": "DataLoader",
+    "InferencePlan": "InferencePlan",
+    "CompiledNetwork": "Compilation",
+    "DataParallelTrainer": "Parallel",
+    "Profiler": "Profiler",
+    "QuantizedNetwork": "Quantization",
+    "quantize": "Quantization",
+    "save_network": "Serialization",
+    "load_network": "Serialization",
+    "Visualizer": "Visualizer",
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    importlib.import_module(f"{__name__}.{module_name}")
+    # Alt modülün import'u ismi zaten bağlamış olabilir (bkz. _Package.__setattr__)
+    value = globals().get(name)
+    if value is None or isinstance(value, types.ModuleType):
+        value = getattr(sys.modules[f"{__name__}.{module_name}"], name)
+        # Sonraki erişimler __getattr__'a uğramaz
+        globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _Package(types.ModuleType):
+    """
+    Bazı sınıflar tanımlandıkları alt modülle aynı isimdedir (Layer, Activation, Loss...).
+    Python bir alt modülü import ettiğinde onu paketin aynı isimli özelliği yapar; bu
+    olmasaydı `from implementations import Layer` import sırasına göre bazen modülü, bazen
+    sınıfı döndürürdü. Bu yüzden böyle bir alt modül bağlanırken yerine sınıfı konur.
+    Alt modüllere her zaman `from implementations.Layer import ...` ile erişilir.
+    """
+
+    def __setattr__(self, name, value):
+        if (isinstance(value, types.ModuleType) and _LAZY_ATTRIBUTES.get(name) == name
+                and value.__name__ == f"{__name__}.{name}" and hasattr(value, name)):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
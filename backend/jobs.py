@@ -0,0 +1,129 @@
+# jobs.py
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+
+class Job:
+    """
+    Arka planda çalışan tek bir iş (örn. eğitim). İlerleme bilgisi (epoch, loss geçmişi)
+    iş çalışırken güncellenir; status endpoint'i ve stream bu nesneyi okur.
+    """
+
+    def __init__(self, kind: str, total_epochs: int = 0, metadata: Optional[Dict[str, Any]] = None,
+                 model: Any = None):
+        self.job_id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = "queued"  # queued -> running -> completed | failed
+        self.total_epochs = total_epochs
+        self.epoch = 0
+        self.history: List[float] = []
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.metadata = metadata or {}
+        self.model = model  # İşin üzerinde çalıştığı model (varsa)
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        # İlerleme değiştikçe bekleyen stream'leri uyandırmak için
+        self._condition = threading.Condition()
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("completed", "failed")
+
+    def report_epoch(self, epoch: int, loss: float):
+        """fit() içindeki on_epoch_end callback'i tarafından çağrılır."""
+        with self._condition:
+            self.epoch = epoch + 1
+            self.history.append(float(loss))
+            self._condition.notify_all()
+
+    def _set_status(self, status: str, error: Optional[str] = None):
+        with self._condition:
+            self.status = status
+            self.error = error
+            if self.done:
+                self.finished_at = time.time()
+            self._condition.notify_all()
+
+    def wait_for_update(self, seen_epochs: int, timeout: float = 15.0) -> bool:
+        """
+        seen_epochs'tan fazla epoch tamamlanana ya da iş bitene kadar bekler.
+        Zaman aşımında False döner (stream keep-alive göndermek için).
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: len(self.history) > seen_epochs or self.done, timeout=timeout
+            )
+
+    def to_dict(self, since: int = 0) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "job_id": self.job_id,
+                "kind": self.kind,
+                "status": self.status,
+                "epoch": self.epoch,
+                "total_epochs": self.total_epochs,
+                "history": {"loss": self.history[since:]},
+                "error": self.error,
+                # İşin dönüş değeri (örn. sweep leaderboard'u), sadece iş tamamlanınca
+                "result": self.result if self.status == "completed" else None,
+                "metadata": self.metadata,
+                "created_at": self.created_at,
+                "finished_at": self.finished_at,
+            }
+
+
+class JobManager:
+    """
+    İşleri bir thread havuzunda çalıştırır ve job_id ile erişim sağlar.
+
+    Eğitim Flask'ın istek thread'ini hiç bloklamaz: endpoint işi kuyruğa ekleyip
+    hemen job_id döner. NumPy matris çarpımları sırasında GIL bırakıldığı için
+    birden fazla model aynı anda eğitilirken sunucu cevap vermeye devam eder.
+    """
+
+    def __init__(self, max_workers: int = 4, max_finished_jobs: int = 100):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_finished_jobs = max_finished_jobs
+
+    def submit(self, job: Job, func: Callable[[Job], Any]) -> Job:
+        """func(job) arka planda çalıştırılır; dönüş değeri job.result olur."""
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._prune()
+        self._executor.submit(self._run, job, func)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def active_for(self, model: Any) -> List[Job]:
+        """Verilen model üzerinde çalışan veya sırada bekleyen işler."""
+        with self._lock:
+            return [job for job in self._jobs.values() if job.model is model and not job.done]
+
+    def _run(self, job: Job, func: Callable[[Job], Any]):
+        job._set_status("running")
+        try:
+            job.result = func(job)
+        except Exception as e:
+            job._set_status("failed", error=str(e))
+        else:
+            job._set_status("completed")
+
+    def _prune(self):
+        """En eski bitmiş işleri siler ki iş tablosu sınırsız büyümesin."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,136 @@
+# prediction_cache.py
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class PredictionCache:
+    """
+    Tek bir modelin tahminleri için satır bazlı LRU önbellek.
+
+    Anahtar, girdi satırının byte'larının (dtype ve uzunluk dahil) blake2b özetidir; değer
+    o satırın çıktısıdır. Önbellek modelin version değerini saklar: ağırlıklar veya yapı
+    değiştiğinde (eğitim adımı, set_parameters, katman ekleme) bir sonraki çağrıda tüm
+    kayıtlar silinir, bu yüzden eski ağırlıklarla hesaplanmış bir sonuç asla dönmez.
+
+    predict bir istekteki sadece önbellekte olmayan satırları tek bir ileri yayılımla
+    hesaplar; tamamı önbellekteyse ileri yayılım hiç yapılmaz. Thread-safe'dir; ileri
+    yayılım kilit dışında çalışır.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        if max_entries <= 0:
+            raise ValueError("max_entries pozitif olmalıdır.")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._version: Any = None
+        self._lock = threading.Lock()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(row: np.ndarray) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(row.dtype.str.encode())
+        digest.update(row.shape[0].to_bytes(8, "little"))
+        digest.update(row.tobytes())
+        return digest.digest()
+
+    def _check_version(self, version):
+        """self._lock tutulurken çağrılır."""
+        if version != self._version:
+            if self._entries:
+                self.invalidations += 1
+                logger.debug("Prediction cache invalidated (%d entries).", len(self._entries))
+            self._entries.clear()
+            self._nbytes = 0
+            self._version = version
+
+    def predict(self, network, X: np.ndarray,
+                predict_fn: Optional[Callable[[np.ndarray], np.ndarray]] = None) -> np.ndarray:
+        """
+        network.predict(X) ile aynı sonucu döndürür; X shape (m, input_dim) olmalıdır.
+        predict_fn verilirse önbellekte olmayan satırlar onunla hesaplanır (örn. MicroBatcher.predict).
+        """
+        X = np.ascontiguousarray(X)
+        keys = [self._key(row) for row in X]
+        version = network.version
+        cached: Dict[int, np.ndarray] = {}
+        with self._lock:
+            self._check_version(version)
+            for i, key in enumerate(keys):
+                output = self._entries.get(key)
+                if output is not None:
+                    self._entries.move_to_end(key)
+                    cached[i] = output
+            self.hits += len(cached)
+            self.misses += len(keys) - len(cached)
+
+        if len(cached) == len(keys):
+            return np.stack([cached[i] for i in range(len(keys))])
+
+        missing = [i for i in range(len(keys)) if i not in cached]
+        computed = (predict_fn or network.predict)(X[missing])
+        outputs = np.empty((len(keys), computed.shape[1]), dtype=computed.dtype)
+        outputs[missing] = computed
+        for i, output in cached.items():
+            outputs[i] = output
+
+        with self._lock:
+            # İleri yayılım sırasında ağırlıklar değiştiyse (eşzamanlı eğitim) sonuçlar saklanmaz
+            if network.version != version or self._version != version:
+                return outputs
+            for i in missing:
+                key = keys[i]
+                if key in self._entries:
+                    continue
+                row = outputs[i].copy()
+                self._entries[key] = row
+                self._nbytes += row.nbytes
+            while len(self._entries) > self.max_entries:
+                _, row = self._entries.popitem(last=False)
+                self._nbytes -= row.nbytes
+                self.evictions += 1
+        return outputs
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Saklanan çıktıların yaklaşık boyutu (anahtarlar hariç)."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "nbytes": self._nbytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else None,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+def create_cache(max_entries: Optional[int]) -> Optional[PredictionCache]:
+    """max_entries 0 veya None ise önbellek kapalıdır."""
+    return PredictionCache(max_entries) if max_entries else None
@@ -0,0 +1,171 @@
+# registry.py
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from implementations.Network import NeuralNetwork
+from implementations.Compilation import CompiledNetwork
+from batching import MicroBatcher, create_batcher
+from prediction_cache import PredictionCache, create_cache
+
+logger = logging.getLogger(__name__)
+
+
+class ModelEntry:
+    """Registry'deki tek bir model ve ona ait bilgiler."""
+
+    def __init__(self, model_id: str, network: NeuralNetwork, cache_size: int = 0,
+                 batch_max_rows: int = 0, batch_max_latency: float = 0.0):
+        self.model_id = model_id
+        self.network = network
+        # Tekrarlanan tahmin isteklerini ileri yayılım yapmadan cevaplar (cache_size=0: kapalı)
+        self.cache: Optional[PredictionCache] = create_cache(cache_size)
+        # Eşzamanlı tahmin isteklerini tek ileri yayılımda birleştirir (batch_max_latency=0: kapalı)
+        self.batcher: Optional[MicroBatcher] = create_batcher(self._network_predict, batch_max_rows, batch_max_latency)
+        # NeuralNetwork'ler için derlenmiş tahmin planı (ilk tahminde oluşturulur)
+        self._compiled: Optional[CompiledNetwork] = None
+        self.created_at = time.time()
+        self.last_used = self.created_at
+        # Modelin yapısını değiştiren işlemler (katman ekleme/çıkarma vb.) için.
+        # Tahminler bu kilidi almaz; NeuralNetwork.predict durum saklamadığından eşzamanlı çalışabilir.
+        self.lock = threading.RLock()
+
+    @property
+    def nbytes(self) -> int:
+        return (self.network.nbytes + (self.cache.nbytes if self.cache is not None else 0)
+                + (self._compiled.nbytes if self._compiled is not None else 0))
+
+    def _network_predict(self, X):
+        """
+        Modelin ileri yayılımı. NeuralNetwork'ler derlenmiş planla çalışır (bkz. NeuralNetwork.compile);
+        plan ağırlıklar değişince kendini, model düzenlenip ağ değiştirildiğinde registry yeniden derler.
+        """
+        network = self.network
+        if not isinstance(network, NeuralNetwork):
+            return network.predict(X)
+        compiled = self._compiled
+        if compiled is None or compiled.network is not network:
+            compiled = self._compiled = network.compile()
+        return compiled.predict(X)
+
+    def predict(self, X, use_cache: bool = True):
+        """Önce önbelleğe bakar, kalan satırları (varsa) micro-batcher üzerinden hesaplar."""
+        predict_fn = self.batcher.predict if self.batcher is not None else self._network_predict
+        if use_cache and self.cache is not None:
+            return self.cache.predict(self.network, X, predict_fn)
+        return predict_fn(X)
+
+    def to_dict(self) -> Dict[str, Any]:
+        network = self.network
+        return {
+            "model_id": self.model_id,
+            "name": network.name,
+            "input_dimension": network.input_dim,
+            "dtype": str(network.dtype),
+            "layers": [str(layer) for layer in network.layers],
+            "total_parameters": sum((l.input_dim * l.num_neurons) + l.num_neurons for l in network.layers),
+            "nbytes": self.nbytes,
+            "created_at": self.created_at,
+            "last_used": self.last_used,
+            "prediction_cache": self.cache.stats() if self.cache is not None else None,
+            "micro_batching": self.batcher.stats() if self.batcher is not None else None,
+        }
+
+
+class ModelRegistry:
+    """
+    model_id ile anahtarlanan, thread-safe ve LRU tahliyeli model deposu.
+
+    Kilit sadece sözlük işlemleri süresince tutulur; model üzerinde yapılan
+    tahmin/eğitim kilit dışında çalışır. max_models veya memory_budget_bytes
+    aşıldığında en uzun süredir kullanılmayan modeller çıkarılır.
+    """
+
+    def __init__(self, max_models: int = 1000, memory_budget_bytes: Optional[int] = None,
+                 prediction_cache_size: int = 0, batch_max_rows: int = 0, batch_max_latency: float = 0.0):
+        if max_models <= 0:
+            raise ValueError("max_models pozitif olmalıdır.")
+        self.max_models = max_models
+        self.memory_budget_bytes = memory_budget_bytes
+        # Her modelin tahmin önbelleğinin satır kapasitesi (0: önbellek yok)
+        self.prediction_cache_size = prediction_cache_size
+        # Tahmin micro-batching ayarları: batch başına en fazla satır ve en fazla bekleme (saniye)
+        self.batch_max_rows = batch_max_rows
+        self.batch_max_latency = batch_max_latency
+        self._entries: "OrderedDict[str, ModelEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._latest_id: Optional[str] = None
+
+    def add(self, network: NeuralNetwork, model_id: Optional[str] = None) -> str:
+        """Modeli ekler (aynı id varsa üzerine yazar) ve model_id'yi döndürür."""
+        model_id = model_id or uuid.uuid4().hex
+        entry = ModelEntry(model_id, network, self.prediction_cache_size,
+                           self.batch_max_rows, self.batch_max_latency)
+        with self._lock:
+            self._entries[model_id] = entry
+            self._entries.move_to_end(model_id)
+            self._latest_id = model_id
+            self._evict()
+        return model_id
+
+    def get_entry(self, model_id: Optional[str] = None) -> Optional[ModelEntry]:
+        """model_id verilmezse en son eklenen model döner. Erişim LRU sırasını günceller."""
+        with self._lock:
+            model_id = model_id or self._latest_id
+            entry = self._entries.get(model_id) if model_id else None
+            if entry is not None:
+                self._entries.move_to_end(model_id)
+                entry.last_used = time.time()
+            return entry
+
+    def get(self, model_id: Optional[str] = None) -> Optional[NeuralNetwork]:
+        entry = self.get_entry(model_id)
+        return entry.network if entry is not None else None
+
+    def remove(self, model_id: str) -> bool:
+        with self._lock:
+            entry = self._entries.pop(model_id, None)
+            if model_id == self._latest_id:
+                self._latest_id = next(reversed(self._entries), None)
+            return entry is not None
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            entries = list(self._entries.values())
+        return [entry.to_dict() for entry in entries]
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            entries = list(self._entries.values())
+        return sum(entry.nbytes for entry in entries)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, model_id: str) -> bool:
+        with self._lock:
+            return model_id in self._entries
+
+    def trim(self):
+        """Modellerin boyutu sonradan değiştiyse (örn. eğitimle gradyan buffer'ları eklendi) bütçeyi yeniden uygular."""
+        with self._lock:
+            self._evict()
+
+    def _evict(self):
+        """self._lock tutulurken çağrılır. En yeni model hiçbir zaman çıkarılmaz."""
+        while len(self._entries) > self.max_models:
+            self._evict_oldest()
+        if self.memory_budget_bytes is not None:
+            total = sum(entry.nbytes for entry in self._entries.values())
+            while total > self.memory_budget_bytes and len(self._entries) > 1:
+                total -= self._evict_oldest().nbytes
+
+    def _evict_oldest(self) -> ModelEntry:
+        model_id, entry = self._entries.popitem(last=False)
+        logger.info("Model evicted from registry: %s (%d bytes)", model_id, entry.nbytes)
+        return entry
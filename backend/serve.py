@@ -0,0 +1,188 @@
+# serve.py
+"""
+Üretim için tahmin sunucusu (pre-fork).
+
+app.run(debug=True) tek process'li geliştirme sunucusudur (reloader ve debugger açık).
+Bu giriş noktası:
+  - Dinlenen soketi ana process'te bir kez açar ve --workers kadar process fork eder;
+    çekirdek tüm worker'lar arasında bağlantıları dağıtır.
+  - app'i ve --models-dir'deki modelleri fork'tan ÖNCE, ana process'te bir kez yükler.
+    Modeller copy-on-write memmap ile açıldığından ağırlık sayfaları worker'lar arasında
+    (ve page cache ile) paylaşılır; worker başına tekrar okuma veya kopya yapılmaz.
+  - Her worker istekleri sınırlı bir thread havuzunda (--threads) işler. NumPy matris
+    çarpımları GIL'i bıraktığından tahminler thread'ler arasında paralel çalışır ve
+    micro-batcher eşzamanlı istekleri birleştirebilir.
+  - matplotlib veya eğitim için gereken ağır modüller import edilmez.
+
+Registry ve eğitim işleri her worker'da ayrıdır: bir worker'da oluşturulan/eğitilen model
+diğerlerinde görünmez. Bu mod önceden kaydedilmiş modelleri sunmak içindir; API üzerinden
+model oluşturup eğitmek için --workers 1 kullanılmalıdır.
+
+Kullanım (backend klasöründen):
+    python serve.py --models-dir models --workers 4 --port 5000
+"""
+
+import argparse
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.serving import BaseWSGIServer
+
+logger = logging.getLogger(__name__)
+
+# Bu süreden önce hata ile çıkan worker yeniden başlatılmaz (başlangıç hatası döngüsünü önler)
+MIN_WORKER_UPTIME = 1.0
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """
+    İstekleri bağlantı başına yeni thread açmak yerine sabit boyutlu bir thread havuzunda
+    işleyen WSGI sunucusu (werkzeug'un ThreadedWSGIServer'ı sınırsız thread açar).
+    """
+
+    multithread = True
+    daemon_threads = True
+
+    def __init__(self, host, port, app, threads: int = 16, **kwargs):
+        super().__init__(host, port, app, **kwargs)
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="http")
+
+    def process_request(self, request, client_address):
+        self.executor.submit(self._process_request_thread, request, client_address)
+
+    def _process_request_thread(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+
+def preload_models(registry, models_dir: str):
+    """models_dir'deki NeuralNetwork.save() dosyalarını dosya adıyla (uzantısız) registry'ye ekler."""
+    from implementations.Serialization import load_network, read_header
+
+    loaded = []
+    for file_name in sorted(os.listdir(models_dir)):
+        path = os.path.join(models_dir, file_name)
+        if not os.path.isfile(path):
+            continue
+        try:
+            read_header(path)
+        except ValueError:
+            logger.warning("Skipping '%s': not a saved network.", path)
+            continue
+        model_id = os.path.splitext(file_name)[0]
+        registry.add(load_network(path, mmap_mode="c"), model_id=model_id)
+        loaded.append(model_id)
+    logger.info("Preloaded %d models from %s: %s", len(loaded), models_dir, ", ".join(loaded))
+    return loaded
+
+
+def _run_worker(listener: socket.socket, app, host: str, threads: int):
+    server = PooledWSGIServer(host, listener.getsockname()[1], app, threads=threads, fd=listener.fileno())
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        server.executor.shutdown(wait=False)
+
+
+def serve(host: str, port: int, workers: int, threads: int, models_dir=None, backlog: int = 1024):
+    # app burada import edilir: argparse hataları ve --help Flask/NumPy yüklemeden döner
+    import app as app_module
+
+    if models_dir:
+        preload_models(app_module.model_registry, models_dir)
+
+    listener = socket.create_server((host, port), backlog=backlog, reuse_port=False)
+    listener.set_inheritable(True)
+    logger.info("Serving on http://%s:%d with %d workers x %d threads", host, listener.getsockname()[1],
+                workers, threads)
+
+    if workers <= 1 or not hasattr(os, "fork"):
+        _run_worker(listener, app_module.app, host, threads)
+        return
+
+    children = {}
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            status = 0
+            try:
+                _run_worker(listener, app_module.app, host, threads)
+            except SystemExit:
+                pass
+            except BaseException:
+                logger.exception("Worker %d failed.", os.getpid())
+                status = 1
+            finally:
+                os._exit(status)
+        children[pid] = time.monotonic()
+
+    stopping = []
+
+    def stop(signum, _frame):
+        stopping.append(signum)
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    for _ in range(workers):
+        spawn()
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        started = children.pop(pid, None)
+        if stopping or started is None:
+            continue
+        if status != 0 and time.monotonic() - started < MIN_WORKER_UPTIME:
+            # Başlar başlamaz çöken worker'ı sürekli yeniden başlatmak yerine sunucu durdurulur
+            logger.error("Worker %d failed during startup, shutting down.", pid)
+            stop(signal.SIGTERM, None)
+            continue
+        # Beklenmedik şekilde ölen worker yeniden başlatılır
+        logger.warning("Worker %d exited (status %d), restarting.", pid, status)
+        spawn()
+    listener.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-fork prediction server")
+    parser.add_argument("--host", default=os.environ.get("HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 5000)))
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("SERVE_WORKERS", os.cpu_count() or 1)),
+                        help="Fork edilecek process sayısı")
+    parser.add_argument("--threads", type=int, default=int(os.environ.get("SERVE_THREADS", 16)),
+                        help="Worker başına istek thread'i sayısı")
+    parser.add_argument("--models-dir", default=os.environ.get("MODEL_DIR"),
+                        help="Başlangıçta yüklenecek kayıtlı modellerin klasörü (model_id = dosya adı)")
+    parser.add_argument("--access-log", action="store_true", help="Her isteği logla (verimi düşürür)")
+    args = parser.parse_args(argv)
+
+    if not args.access_log:
+        logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    serve(args.host, args.port, args.workers, args.threads, args.models_dir)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
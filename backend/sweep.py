@@ -0,0 +1,208 @@
+# sweep.py
+
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from implementations.Loss import Loss
+
+logger = logging.getLogger(__name__)
+
+# Arama uzayındaki parametreler ve verilmezse kullanılan değerleri
+SWEEP_DEFAULTS = {
+    "layer_neurons": [[8, 1]],
+    "activation_function": ["relu"],
+    "learning_rate": [0.01],
+    "epochs": [10],
+    "optimizer": ["sgd"],
+    "batch_size": [32],
+}
+
+
+def expand_grid(space: Dict[str, List[Any]], max_trials: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Arama uzayındaki değer listelerinin kartezyen çarpımını konfigürasyon listesine çevirir.
+
+    space: {"layer_neurons": [[16, 1], [32, 16, 1]], "learning_rate": [0.1, 0.01], ...}
+           Tek bir değer verilen parametreler liste gibi davranır. Verilmeyenler SWEEP_DEFAULTS'tan gelir.
+    max_trials: Izgara bundan büyükse hata verilir (yanlışlıkla binlerce deneme başlatmamak için).
+    """
+    unknown = set(space) - set(SWEEP_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Bilinmeyen sweep parametreleri: {sorted(unknown)}")
+
+    keys = list(SWEEP_DEFAULTS)
+    values = []
+    for key in keys:
+        options = space.get(key, SWEEP_DEFAULTS[key])
+        # layer_neurons için tek bir liste ([8, 1]) tek bir seçenektir
+        if not isinstance(options, list) or (key == "layer_neurons" and options and not isinstance(options[0], list)):
+            options = [options]
+        if not options:
+            raise ValueError(f"'{key}' için en az bir değer verilmelidir.")
+        values.append(options)
+
+    total = int(np.prod([len(v) for v in values]))
+    if max_trials is not None and total > max_trials:
+        raise ValueError(f"Sweep {total} deneme içeriyor, izin verilen en fazla {max_trials}.")
+    return [dict(zip(keys, combination)) for combination in itertools.product(*values)]
+
+
+class MedianStoppingRule:
+    """
+    Kötü giden denemeleri erken durdurur.
+
+    Bir deneme grace_epochs'tan sonra, o ana kadarki en iyi doğrulama kaybı aynı
+    epoch'a ulaşmış diğer denemelerin (en az min_trials tanesi) o epoch'taki en iyi
+    kayıplarının medyanından kötüyse durdurulur. Thread-safe'dir.
+    """
+
+    def __init__(self, grace_epochs: int = 2, min_trials: int = 3):
+        self.grace_epochs = grace_epochs
+        self.min_trials = min_trials
+        self._best: Dict[int, List[float]] = {}  # trial_id -> epoch başına en iyi kayıp
+        self._lock = threading.Lock()
+
+    def should_stop(self, trial_id: int, epoch: int, loss: float) -> bool:
+        with self._lock:
+            best = self._best.setdefault(trial_id, [])
+            best.append(min(loss, best[-1]) if best else loss)
+            if epoch + 1 <= self.grace_epochs:
+                return False
+            others = [b[epoch] for t, b in self._best.items() if t != trial_id and len(b) > epoch]
+            if len(others) < self.min_trials:
+                return False
+            return best[epoch] > float(np.median(others))
+
+
+class Sweep:
+    """
+    Bir konfigürasyon listesinin her birini model_factory ile kurup eşzamanlı eğitir
+    ve doğrulama kaybına göre sıralı bir sonuç tablosu (leaderboard) üretir.
+
+    Denemeler max_workers thread'lik bir havuzda çalışır (JobManager ile aynı gerekçe:
+    NumPy matris çarpımları GIL'i bırakır). Veri bir kez eğitim/doğrulama olarak ayrılır
+    ve tüm denemeler aynı ayrımı kullanır. Her epoch sonunda doğrulama kaybı hesaplanır;
+    stopping_rule denemeyi durdurmaya karar verirse fit o epoch'ta biter.
+
+    model_factory(input_dim=..., layer_neurons=..., activation_names=..., network_name=...)
+    imzasına sahip olmalıdır (app.create_custom_model) ve hata durumunda None dönebilir.
+    """
+
+    def __init__(self, model_factory: Callable[..., Any], configs: List[Dict[str, Any]],
+                 X: np.ndarray, y: np.ndarray, loss: str = "mse", validation_split: float = 0.2,
+                 max_workers: int = 4, stopping_rule: Optional[MedianStoppingRule] = None,
+                 seed: Optional[int] = None):
+        if not configs:
+            raise ValueError("Sweep için en az bir konfigürasyon verilmelidir.")
+        if not 0 < validation_split < 1:
+            raise ValueError("validation_split 0 ile 1 arasında olmalıdır.")
+        if y.ndim == 1:
+            y = y.reshape(-1, 1)
+        if X.ndim != 2 or X.shape[0] != y.shape[0]:
+            raise ValueError("X shape (m, input_dim) olmalı ve y ile aynı sayıda örnek içermelidir.")
+        self.loss_func, _ = Loss.get(loss)
+        self.loss = loss
+        self.model_factory = model_factory
+        self.configs = configs
+        self.max_workers = max_workers
+        self.stopping_rule = stopping_rule if stopping_rule is not None else MedianStoppingRule()
+
+        order = np.random.default_rng(seed).permutation(X.shape[0])
+        num_val = max(1, int(round(X.shape[0] * validation_split)))
+        if num_val >= X.shape[0]:
+            raise ValueError("Eğitim için yeterli örnek yok.")
+        self.X_val, self.y_val = X[order[:num_val]], y[order[:num_val]]
+        self.X_train, self.y_train = X[order[num_val:]], y[order[num_val:]]
+        self.trials: List[Dict[str, Any]] = []
+
+    def run(self, on_trial_end: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        """Tüm denemeleri çalıştırır ve leaderboard'u döndürür."""
+        lock = threading.Lock()
+
+        def run_and_report(trial_id, config):
+            trial = self._run_trial(trial_id, config)
+            with lock:
+                self.trials.append(trial)
+            if on_trial_end is not None:
+                on_trial_end(trial)
+            return trial
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sweep") as executor:
+            futures = [executor.submit(run_and_report, i, config) for i, config in enumerate(self.configs)]
+            for future in futures:
+                future.result()
+        return self.leaderboard()
+
+    def _run_trial(self, trial_id: int, config: Dict[str, Any]) -> Dict[str, Any]:
+        trial = {
+            "trial_id": trial_id,
+            "config": config,
+            "status": "running",
+            "epochs_run": 0,
+            "val_loss": [],
+            "best_val_loss": None,
+            "train_loss": None,
+            "error": None,
+            "seconds": None,
+            "model": None,
+        }
+        start = time.perf_counter()
+        try:
+            network = self.model_factory(
+                input_dim=self.X_train.shape[1],
+                layer_neurons=config["layer_neurons"],
+                activation_names=config["activation_function"],
+                network_name=f"sweep_trial_{trial_id}",
+            )
+            if network is None:
+                raise ValueError("Model oluşturulamadı.")
+            output_dim = network.layers[-1].num_neurons
+            if output_dim != self.y_train.shape[1]:
+                raise ValueError(f"Çıktı katmanı {output_dim} nöronlu, hedefler {self.y_train.shape[1]} sütunlu.")
+
+            stopped = []
+
+            def on_epoch_end(epoch, train_loss):
+                val_loss = float(self.loss_func(network.predict(self.X_val), self.y_val))
+                trial["epochs_run"] = epoch + 1
+                trial["train_loss"] = float(train_loss)
+                trial["val_loss"].append(val_loss)
+                if self.stopping_rule.should_stop(trial_id, epoch, val_loss):
+                    stopped.append(epoch)
+                    return False
+                return True
+
+            network.fit(self.X_train, self.y_train, loss=self.loss, optimizer=config["optimizer"],
+                        batch_size=int(config["batch_size"]), epochs=int(config["epochs"]),
+                        learning_rate=float(config["learning_rate"]), on_epoch_end=on_epoch_end)
+            trial["status"] = "stopped" if stopped else "completed"
+            trial["model"] = network
+        except Exception as e:
+            logger.warning("Sweep trial %d failed: %s", trial_id, e)
+            trial["status"] = "failed"
+            trial["error"] = str(e)
+        finite = [loss for loss in trial["val_loss"] if np.isfinite(loss)]
+        trial["best_val_loss"] = min(finite) if finite else None
+        trial["seconds"] = time.perf_counter() - start
+        return trial
+
+    def leaderboard(self) -> List[Dict[str, Any]]:
+        """Denemeleri en iyi doğrulama kaybına göre sıralar; başarısız denemeler sona gelir."""
+        ranked = sorted(self.trials, key=lambda t: (t["best_val_loss"] is None,
+                                                    t["best_val_loss"] if t["best_val_loss"] is not None else 0.0,
+                                                    t["trial_id"]))
+        return [dict({k: v for k, v in trial.items() if k != "model"}, rank=rank + 1)
+                for rank, trial in enumerate(ranked)]
+
+    def best_model(self):
+        """En iyi denemenin eğitilmiş ağı (yoksa None)."""
+        candidates = [t for t in self.trials if t["model"] is not None and t["best_val_loss"] is not None]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda t: t["best_val_loss"])["model"]
@@ -0,0 +1,9 @@
+# tests/conftest.py
+# Testler backend klasöründeki modülleri (app, registry, implementations...) doğrudan import eder.
+
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
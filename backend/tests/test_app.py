@@ -0,0 +1,99 @@
+# tests/test_app.py
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from app import app
+
+TRAIN_BODY = {"layer_neurons": [4, 1], "activation_function": "relu", "epochs": 1}
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+@pytest.mark.parametrize("field, value", [
+    ("learning_rate", "abc"),
+    ("learning_rate", None),
+    ("epochs", "ten"),
+    ("epochs", [1]),
+    ("workers", "x"),
+    ("num_samples", "many"),
+    ("batch_size", "big"),
+])
+def test_train_rejects_non_numeric_parameters(client, field, value):
+    response = client.post("/api/train", json=dict(TRAIN_BODY, **{field: value}))
+    assert response.status_code == 400
+    assert field in response.get_data(as_text=True)
+
+
+def test_create_reports_model_without_training_note(client):
+    response = client.post("/api/create_network", json={"layer_neurons": [4, 1], "activation_function": "relu"})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert "not implemented" not in body["message"]
+    assert body["model_id"]
+
+
+def test_profile_with_backward_pass(client):
+    model_id = client.post("/api/create_network", json={"layer_neurons": [4, 1], "activation_function": "sigmoid",
+                                                         "input_dim": 3}).get_json()["model_id"]
+    response = client.post("/api/profile", json={"model_id": model_id, "backward": True,
+                                                 "loss_function": "binary_crossentropy", "repeats": 2})
+    assert response.status_code == 200
+    response = client.post("/api/profile", json={"model_id": model_id, "backward": True, "loss_function": "nope"})
+    assert response.status_code == 400
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    import app as app_module
+    monkeypatch.setattr(app_module, "DATA_DIR", str(tmp_path))
+    np.save(tmp_path / "data.npy", np.random.rand(200, 4))
+    return tmp_path
+
+
+def test_train_on_dataset_reads_data_only_in_the_job(client, data_dir, monkeypatch):
+    from implementations.DataLoader import StreamingDataLoader
+
+    reader_threads = []
+    original_iter = StreamingDataLoader.__iter__
+
+    def recording_iter(self):
+        reader_threads.append(threading.current_thread())
+        return original_iter(self)
+
+    monkeypatch.setattr(StreamingDataLoader, "__iter__", recording_iter)
+    response = client.post("/api/train", json=dict(TRAIN_BODY, dataset="data.npy"))
+    assert response.status_code == 202
+    assert threading.current_thread() not in reader_threads
+    job_id = response.get_json()["job_id"]
+    status = _wait_for_job(client, job_id)
+    assert status["status"] == "completed", status["error"]
+    assert reader_threads and threading.current_thread() not in reader_threads
+
+
+def test_empty_dataset_is_rejected(client, data_dir):
+    np.save(data_dir / "empty.npy", np.empty((0, 4)))
+    response = client.post("/api/train", json=dict(TRAIN_BODY, dataset="empty.npy"))
+    assert response.status_code == 400
+
+
+def test_shuffle_buffer_is_clamped(data_dir, monkeypatch):
+    import app as app_module
+    monkeypatch.setattr(app_module, "MAX_SHUFFLE_BUFFER", 64)
+    loader = app_module._dataset_loader({"dataset": "data.npy", "shuffle_buffer": 10 ** 9})
+    assert loader.shuffle_buffer == 64
+
+
+def _wait_for_job(client, job_id, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        status = client.get(f"/api/train/{job_id}").get_json()
+        if status["status"] in ("completed", "failed") or time.monotonic() > deadline:
+            return status
+        time.sleep(0.02)
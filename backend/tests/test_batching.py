@@ -0,0 +1,116 @@
+# tests/test_batching.py
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from batching import MicroBatcher
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError("koşul zamanında sağlanmadı")
+        time.sleep(0.001)
+
+
+def _run_threads(target, count):
+    results, errors = [None] * count, [None] * count
+
+    def run(i):
+        try:
+            results[i] = target(i)
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def _join(threads):
+    for thread in threads:
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+
+
+class _GatedPredict:
+    """İlk çağrı release edilene kadar bekler; böylece diğer istekler kuyrukta birikir."""
+
+    def __init__(self, fail_on_call=None):
+        self.calls = []
+        self.release = threading.Event()
+        self.fail_on_call = fail_on_call
+
+    def __call__(self, X):
+        self.calls.append(X.shape[0])
+        if len(self.calls) == 1:
+            assert self.release.wait(5)
+        if len(self.calls) == self.fail_on_call:
+            raise RuntimeError("predict failed")
+        return X * 2
+
+
+def test_concurrent_requests_get_their_own_rows():
+    predict = _GatedPredict()
+    batcher = MicroBatcher(predict, max_rows=64, max_latency=0.05)
+    rows = [np.full((1 + i % 3, 4), i, dtype=float) for i in range(16)]
+
+    threads, results, errors = _run_threads(lambda i: batcher.predict(rows[i]), len(rows))
+    _wait_until(lambda: batcher.stats()["requests"] == len(rows))
+    predict.release.set()
+    _join(threads)
+
+    assert errors == [None] * len(rows)
+    for X, result in zip(rows, results):
+        np.testing.assert_array_equal(result, X * 2)
+    stats = batcher.stats()
+    # İlk istek tek başına çalışır, bekleyen diğer istekler tek batch'te birleşir
+    assert stats["batches"] == len(predict.calls) == 2
+    assert stats["rows"] == sum(X.shape[0] for X in rows)
+
+
+def test_error_reaches_every_request_in_the_batch_and_next_batch_runs():
+    predict = _GatedPredict(fail_on_call=2)
+    batcher = MicroBatcher(predict, max_rows=64, max_latency=0.05)
+    first = threading.Thread(target=batcher.predict, args=(np.ones((1, 4)),))
+    first.start()
+    _wait_until(lambda: len(predict.calls) == 1)
+
+    threads, results, errors = _run_threads(lambda i: batcher.predict(np.full((1, 4), i, dtype=float)), 6)
+    _wait_until(lambda: batcher.stats()["requests"] == 7)
+    predict.release.set()
+    _join(threads + [first])
+
+    assert predict.calls[1] == 6
+    assert all(isinstance(error, RuntimeError) for error in errors)
+    assert results == [None] * 6
+    np.testing.assert_array_equal(batcher.predict(np.ones((2, 4))), np.full((2, 4), 2.0))
+
+
+def test_large_request_bypasses_the_queue():
+    predict = _GatedPredict()
+    batcher = MicroBatcher(predict, max_rows=8, max_latency=0.05)
+    blocked = threading.Thread(target=batcher.predict, args=(np.ones((1, 4)),))
+    blocked.start()
+    _wait_until(lambda: len(predict.calls) == 1)
+
+    # Lider predict_fn içinde beklerken max_rows satırlık istek kendi thread'inde çalışır
+    X = np.random.rand(8, 4)
+    np.testing.assert_array_equal(batcher.predict(X), X * 2)
+    assert predict.calls == [1, 8]
+
+    predict.release.set()
+    _join([blocked])
+    assert batcher.stats()["batches"] == 2
+
+
+def test_invalid_settings_are_rejected():
+    with pytest.raises(ValueError):
+        MicroBatcher(lambda X: X, max_rows=0)
+    with pytest.raises(ValueError):
+        MicroBatcher(lambda X: X, max_latency=-1)
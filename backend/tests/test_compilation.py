@@ -0,0 +1,85 @@
+# tests/test_compilation.py
+
+import numpy as np
+import pytest
+
+from implementations.Activation import Activation
+from implementations.Compilation import CompiledNetwork
+from implementations.Network import NeuralNetwork
+
+
+def _network(sizes, activations, input_dim=16):
+    np.random.seed(0)
+    network = NeuralNetwork(input_dim=input_dim, dtype="float64")
+    for size, activation in zip(sizes, activations):
+        network.add_layer(num_neurons=size, activation_func=activation)
+    return network
+
+
+def _assert_matches(compiled, network, rows=5):
+    X = np.random.rand(rows, network.input_dim)
+    np.testing.assert_allclose(compiled.predict(X), network.predict(X), rtol=1e-10, atol=1e-12)
+
+
+def test_linear_layer_is_folded_when_cheaper():
+    # 16 -> 32 (linear) -> 8: birleşik 16*8=128 çarpma, ayrı 16*32 + 32*8 = 768
+    network = _network([32, 8], [Activation.linear, Activation.relu])
+    compiled = CompiledNetwork(network)
+    assert len(compiled) == 1
+    weights, biases, _ = compiled.steps[0]
+    assert weights.shape == (16, 8) and biases.shape == (8,)
+    assert compiled.nbytes == weights.nbytes + biases.nbytes
+    _assert_matches(compiled, network)
+
+
+def test_bottleneck_is_not_folded():
+    # 64 -> 4 (linear) -> 64: birleşik 64*64=4096, ayrı 64*4 + 4*64 = 512
+    network = _network([4, 64], [Activation.linear, Activation.tanh], input_dim=64)
+    compiled = CompiledNetwork(network)
+    assert len(compiled) == 2
+    assert compiled.steps[0][2] is None
+    # Birleştirme yapılmadığında katmanların dizileri kopyalanmadan paylaşılır
+    assert compiled.nbytes == 0
+    _assert_matches(compiled, network)
+
+
+def test_fold_linear_can_be_disabled_and_trailing_linear_is_kept():
+    network = _network([32, 8, 3], [Activation.linear, Activation.relu, Activation.linear])
+    assert len(CompiledNetwork(network)) == 2
+    unfolded = CompiledNetwork(network, fold_linear=False)
+    assert len(unfolded) == 3
+    _assert_matches(unfolded, network)
+
+
+@pytest.mark.parametrize("change", [
+    lambda network: network.fit(np.random.rand(8, 16), np.random.rand(8, 1), epochs=1, batch_size=8),
+    lambda network: network.resize_layer(0, 40),
+    lambda network: network.set_layer_activation(0, Activation.relu),
+    lambda network: network.insert_layer(1, 6, Activation.tanh),
+], ids=["training_step", "resize_layer", "set_layer_activation", "insert_layer"])
+def test_plan_is_rebuilt_after_network_changes(change):
+    network = _network([32, 8, 1], [Activation.linear, Activation.relu, Activation.sigmoid])
+    compiled = network.compile()
+    _assert_matches(compiled, network)
+    steps = compiled.steps
+
+    change(network)
+    _assert_matches(compiled, network)
+    assert compiled.steps is not steps
+    assert compiled._version == network.version
+
+
+def test_plan_is_not_rebuilt_without_changes():
+    network = _network([32, 8], [Activation.relu, Activation.relu])
+    compiled = network.compile()
+    steps = compiled.steps
+    network.predict(np.random.rand(3, 16))
+    compiled.predict(np.random.rand(3, 16))
+    assert compiled.steps is steps
+
+
+def test_input_width_is_checked():
+    compiled = _network([4], [Activation.relu]).compile()
+    with pytest.raises(ValueError):
+        compiled.predict(np.random.rand(3, 5))
+    assert compiled.predict(np.random.rand(16)).shape == (4,)
@@ -0,0 +1,49 @@
+# tests/test_custom_activation.py
+"""out= almayan kullanıcı aktivasyonları (f(z)) tüm tahmin yollarında çalışmalıdır."""
+
+import numpy as np
+import pytest
+
+from implementations.Activation import Activation
+from implementations.Network import NeuralNetwork
+
+
+def softplus(z):
+    return np.log1p(np.exp(z))
+
+
+def _network():
+    np.random.seed(0)
+    network = NeuralNetwork(input_dim=6)
+    network.add_layer(num_neurons=8, activation_func=softplus)
+    network.add_layer(num_neurons=4, activation_func=lambda z: z * 0.5)
+    network.add_layer(num_neurons=1, activation_func=Activation.sigmoid)
+    return network
+
+
+def _reference(network, X):
+    for layer in network.layers:
+        X = layer.activation_function(X @ layer.weights + layer.biases)
+    return X
+
+
+def test_supports_out_only_for_builtin_activations():
+    assert Activation.supports_out(Activation.relu)
+    assert Activation.supports_out(Activation.gelu)
+    assert not Activation.supports_out(softplus)
+    assert not Activation.supports_out(lambda z: z)
+    assert not Activation.is_inplace_safe(softplus)
+
+
+@pytest.mark.parametrize("predict, tolerance", [
+    (lambda network, X: network.predict(X), 1e-5),
+    (lambda network, X: network.forward(X, reuse_buffers=True), 1e-5),
+    (lambda network, X: network.forward(X, cache=True), 1e-5),
+    (lambda network, X: network.compile().predict(X), 1e-5),
+    (lambda network, X: network.inference_plan(batch_size=16).predict(X), 1e-5),
+    (lambda network, X: network.quantize().predict(X), 5e-2),
+], ids=["predict", "reuse_buffers", "cache", "compiled", "inference_plan", "quantized"])
+def test_custom_activation_prediction_paths(predict, tolerance):
+    network = _network()
+    X = np.random.rand(10, 6).astype(network.compute_dtype)
+    np.testing.assert_allclose(predict(network, X), _reference(network, X), atol=tolerance)
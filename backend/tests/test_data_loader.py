@@ -0,0 +1,35 @@
+# tests/test_data_loader.py
+
+import numpy as np
+
+from implementations.DataLoader import StreamingDataLoader
+
+
+def test_csv_width_comes_from_first_line(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b,c,d\n\n1,2,3,4\n5,6,7,8\n")
+    loader = StreamingDataLoader.from_csv(str(path), skip_header=1, batch_size=2)
+    assert loader.num_features == 3
+    X, y = next(iter(loader))
+    assert X.shape == (2, 3) and y.shape == (2, 1)
+    assert StreamingDataLoader.from_csv(str(path), skip_header=1, target_columns=[0, 1]).num_features == 2
+
+
+def test_empty_csv_has_no_width(tmp_path):
+    path = tmp_path / "empty.csv"
+    path.write_text("header\n\n")
+    assert StreamingDataLoader.from_csv(str(path), skip_header=1).num_features is None
+
+
+def test_npy_width_comes_from_header(tmp_path):
+    path = tmp_path / "data.npy"
+    np.save(path, np.random.rand(50, 6))
+    loader = StreamingDataLoader.from_npy(str(path), batch_size=10)
+    assert loader.num_features == 5
+    assert next(iter(loader))[0].shape == (10, 5)
+    y_path = tmp_path / "y.npy"
+    np.save(y_path, np.random.rand(50, 2))
+    assert StreamingDataLoader.from_npy(str(path), y_path=str(y_path)).num_features == 6
+    empty = tmp_path / "empty.npy"
+    np.save(empty, np.empty((0, 6)))
+    assert StreamingDataLoader.from_npy(str(empty)).num_features is None
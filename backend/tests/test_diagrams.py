@@ -0,0 +1,35 @@
+# tests/test_diagrams.py
+
+import numpy as np
+
+from diagrams import DiagramCache
+from implementations.Activation import Activation
+from implementations.Network import NeuralNetwork
+
+
+def _network(seed):
+    np.random.seed(seed)
+    network = NeuralNetwork(input_dim=3)
+    network.add_layer(num_neurons=4, activation_func=Activation.relu)
+    network.add_layer(num_neurons=1, activation_func=Activation.sigmoid)
+    return network
+
+
+def test_structure_key_is_shared_between_models():
+    first, second = _network(0), _network(1)
+    assert DiagramCache.key(first, "svg", 16, False, "a") == DiagramCache.key(second, "svg", 16, False, "b")
+
+
+def test_weight_colored_key_differs_between_models_with_same_version():
+    first, second = _network(0), _network(1)
+    assert first.version == second.version
+    assert DiagramCache.key(first, "svg", 16, True, "a") != DiagramCache.key(second, "svg", 16, True, "b")
+    # model_id verilmezse ağ nesnesinin kimliği kullanılır
+    assert DiagramCache.key(first, "svg", 16, True) != DiagramCache.key(second, "svg", 16, True)
+
+
+def test_weight_colored_key_changes_when_weights_change():
+    network = _network(0)
+    before = DiagramCache.key(network, "svg", 16, True, "a")
+    network.layers[0].mark_updated()
+    assert DiagramCache.key(network, "svg", 16, True, "a") != before
@@ -0,0 +1,60 @@
+# tests/test_gradients.py
+
+import numpy as np
+import pytest
+
+from implementations.Activation import Activation
+from implementations.Network import NeuralNetwork
+from implementations.Optimizer import Optimizer
+
+
+def _network():
+    np.random.seed(0)
+    network = NeuralNetwork(input_dim=5, dtype="float64")
+    network.add_layer(num_neurons=6, activation_func=Activation.tanh)
+    network.add_layer(num_neurons=1, activation_func=Activation.sigmoid)
+    return network
+
+
+def test_compute_gradients_matches_one_fit_step():
+    X = np.random.rand(16, 5)
+    y = (X.sum(axis=1) > 2.5).astype(float)
+    stepped, fitted = _network(), _network()
+
+    loss = stepped.compute_gradients(X, y, loss="binary_crossentropy")
+    Optimizer.create("sgd", learning_rate=0.1).step(stepped.layers)
+    history = fitted.fit(X, y, loss="binary_crossentropy", optimizer="sgd", learning_rate=0.1,
+                         batch_size=16, epochs=1, shuffle=False)
+
+    assert loss == pytest.approx(history["loss"][0])
+    for a, b in zip(stepped.layers, fitted.layers):
+        np.testing.assert_allclose(a.weights, b.weights)
+        np.testing.assert_allclose(a.biases, b.biases)
+
+
+def test_compute_gradients_does_not_update_parameters():
+    network = _network()
+    before = [layer.weights.copy() for layer in network.layers]
+    network.compute_gradients(np.random.rand(4, 5), np.random.rand(4))
+    for layer, weights in zip(network.layers, before):
+        np.testing.assert_array_equal(layer.weights, weights)
+        assert np.any(layer.dW != 0)
+
+
+def test_compute_gradients_rejects_mismatched_batches():
+    network = _network()
+    with pytest.raises(ValueError):
+        network.compute_gradients(np.random.rand(4, 3), np.random.rand(4))
+    with pytest.raises(ValueError):
+        network.compute_gradients(np.random.rand(4, 5), np.random.rand(3))
+
+
+def test_optimizer_subclass_without_update_cannot_be_created():
+    class Incomplete(Optimizer):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+    with pytest.raises(TypeError):
+        Optimizer()
+    assert Optimizer.create("momentum", learning_rate=0.1).learning_rate == 0.1
@@ -0,0 +1,61 @@
+# tests/test_import_time.py
+"""
+Başlangıç süresi bütçesi: serving worker'ları soğuk başlangıçta app'i bir saniyenin çok altında
+import etmeli ve ağır opsiyonel bağımlılıkları (matplotlib, multiprocessing) yüklememelidir.
+Ölçüm temiz bir process'te yapılır; bütçe IMPORT_TIME_BUDGET ile değiştirilebilir (saniye).
+Ayrıntılı rapor için: python benchmarks/import_time.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import BACKEND_DIR
+
+IMPORT_TIME_BUDGET = float(os.environ.get('IMPORT_TIME_BUDGET', 1.0))
+FORBIDDEN_MODULES = ("matplotlib", "multiprocessing", "implementations.Visualizer", "implementations.Parallel")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def _import_in_fresh_process(module):
+    output = subprocess.run([sys.executable, "-c", _PROBE.format(module=module)], cwd=BACKEND_DIR,
+                            env=dict(os.environ, LOG_LEVEL="WARNING"),
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", ["app", "serve"])
+def test_import_within_budget(module):
+    # İlk çalıştırma .pyc'leri ısıtır; en iyi iki ölçümden küçüğü kullanılır
+    _import_in_fresh_process(module)
+    runs = [_import_in_fresh_process(module) for _ in range(2)]
+    seconds = min(run["seconds"] for run in runs)
+    assert seconds < IMPORT_TIME_BUDGET, f"import {module} took {seconds:.3f}s (budget {IMPORT_TIME_BUDGET}s)"
+
+
+@pytest.mark.parametrize("module", ["app", "serve", "implementations"])
+def test_import_does_not_load_heavy_modules(module):
+    modules = _import_in_fresh_process(module)["modules"]
+    loaded = [name for name in modules
+              if any(name == forbidden or name.startswith(forbidden + ".") for forbidden in FORBIDDEN_MODULES)]
+    assert not loaded, f"import {module} loaded {loaded}"
+
+
+def test_package_exports_classes_regardless_of_import_order():
+    # Alt modüller önce import edilse de paket isimleri sınıfları döndürmeli
+    code = ("from implementations.Network import NeuralNetwork\n"
+            "from implementations import Layer, Activation, Loss, Optimizer\n"
+            "print(all(isinstance(obj, type) for obj in (Layer, Activation, Loss, Optimizer)))")
+    output = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR,
+                            capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "True"
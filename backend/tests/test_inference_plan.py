@@ -0,0 +1,82 @@
+# tests/test_inference_plan.py
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from implementations.Activation import Activation
+from implementations.InferencePlan import InferencePlan
+from implementations.Network import NeuralNetwork
+
+# Kararlı durumda izin verilen tepe bellek (byte). NumPy ufunc çağrılarının birkaç yüz
+# byte'lık kendi nesneleri dışında hiçbir dizi ayrılmamalı; en küçük geçici dizi bile
+# (batch 256 x 128 float32 = 128 KiB, broadcast iterasyon buffer'ı ~34 KiB) bu sınırı aşar.
+STEADY_STATE_PEAK_BYTES = 4096
+
+
+def _network(activation, dtype=np.float32):
+    np.random.seed(0)
+    network = NeuralNetwork(input_dim=64, dtype=dtype)
+    network.add_layer(num_neurons=128, activation_func=activation)
+    network.add_layer(num_neurons=64, activation_func=Activation.relu)
+    network.add_layer(num_neurons=10, activation_func=activation)
+    for layer in network.layers:
+        layer.set_parameters(np.random.randn(*layer.weights.shape).astype(dtype) * 0.2,
+                             np.random.randn(layer.num_neurons).astype(dtype) * 0.1)
+    return network
+
+
+def _steady_state_peak(func, calls=20):
+    for _ in range(3):
+        func()
+    tracemalloc.start()
+    try:
+        for _ in range(calls):
+            func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+ACTIVATIONS = [Activation.relu, Activation.sigmoid, Activation.tanh, Activation.linear,
+               Activation.leaky_relu, Activation.gelu, Activation.softmax]
+
+
+@pytest.mark.parametrize("activation", ACTIVATIONS, ids=lambda f: f.__name__)
+@pytest.mark.parametrize("rows", [256, 100])
+def test_predict_does_not_allocate_in_steady_state(activation, rows):
+    network = _network(activation)
+    plan = InferencePlan(network, batch_size=256)
+    X = np.random.rand(rows, 64).astype(np.float32)
+    peak = _steady_state_peak(lambda: plan.predict(X))
+    assert peak < STEADY_STATE_PEAK_BYTES, f"{activation.__name__}: {peak} bytes allocated"
+
+
+@pytest.mark.parametrize("dtype", [np.float16, np.float64])
+def test_predict_with_converted_inputs_does_not_allocate(dtype):
+    network = _network(Activation.gelu, dtype=dtype)
+    plan = InferencePlan(network, batch_size=128)
+    X = np.random.rand(128, 64)  # float64 girdi float16 ağda planın girdi buffer'ına çevrilir
+    peak = _steady_state_peak(lambda: plan.predict(X))
+    assert peak < STEADY_STATE_PEAK_BYTES, f"{peak} bytes allocated"
+
+
+@pytest.mark.parametrize("activation", ACTIVATIONS, ids=lambda f: f.__name__)
+def test_predict_matches_network(activation):
+    network = _network(activation)
+    plan = InferencePlan(network, batch_size=32)
+    for rows in (32, 5, 70):
+        X = np.random.rand(rows, 64).astype(np.float32)
+        np.testing.assert_allclose(plan.predict(X), network.predict(X), rtol=1e-5, atol=1e-6)
+
+
+def test_plan_follows_parameter_updates():
+    network = _network(Activation.tanh)
+    plan = InferencePlan(network, batch_size=8)
+    X = np.random.rand(8, 64).astype(np.float32)
+    plan.predict(X)
+    layer = network.layers[0]
+    layer.biases += 1.0
+    layer.mark_updated()
+    np.testing.assert_allclose(plan.predict(X), network.predict(X), rtol=1e-5, atol=1e-6)
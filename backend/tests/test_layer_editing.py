@@ -0,0 +1,174 @@
+# tests/test_layer_editing.py
+
+import threading
+
+import numpy as np
+import pytest
+
+from implementations.Activation import Activation
+from implementations.Network import NeuralNetwork
+
+
+def _network(dtype="float64"):
+    np.random.seed(0)
+    network = NeuralNetwork(input_dim=4, dtype=dtype)
+    network.add_layer(num_neurons=6, activation_func=Activation.relu)
+    network.add_layer(num_neurons=5, activation_func=Activation.tanh)
+    network.add_layer(num_neurons=2, activation_func=Activation.sigmoid)
+    return network
+
+
+def _assert_consistent(network):
+    input_dim = network.input_dim
+    for i, layer in enumerate(network.layers):
+        assert layer.weights.shape == (input_dim, layer.num_neurons)
+        assert layer.biases.shape == (layer.num_neurons,)
+        assert layer.is_first_layer == (i == 0)
+        assert layer.is_output_layer == (i == len(network.layers) - 1)
+        input_dim = layer.num_neurons
+    assert network.predict(np.random.rand(3, network.input_dim)).shape == (3, network.layers[-1].num_neurons)
+
+
+@pytest.mark.parametrize("index", [0, 1, -1])
+def test_widening_a_layer_keeps_the_output(index):
+    network = _network()
+    X = np.random.rand(10, 4)
+    expected = network.predict(X)
+    network.resize_layer(index, network.layers[index].num_neurons + 3)
+    _assert_consistent(network)
+    if index == -1:
+        # Çıktı katmanı genişleyince mevcut çıktı sütunları korunur
+        np.testing.assert_allclose(network.predict(X)[:, :2], expected)
+    else:
+        np.testing.assert_allclose(network.predict(X), expected)
+
+
+def test_narrowing_keeps_shapes_consistent():
+    network = _network()
+    network.resize_layer(1, 2)
+    _assert_consistent(network)
+    assert network.layers[2].input_dim == 2
+
+
+@pytest.mark.parametrize("index, expected_sizes", [
+    (0, [3, 6, 5, 2]),
+    (-1, [6, 5, 3, 2]),
+    (3, [6, 5, 2, 3]),
+])
+def test_insert_layer(index, expected_sizes):
+    network = _network()
+    version = network.version
+    inserted = network.insert_layer(index, 3, Activation.relu)
+    assert [layer.num_neurons for layer in network.layers] == expected_sizes
+    assert inserted in network.layers
+    assert network.version != version
+    _assert_consistent(network)
+
+
+@pytest.mark.parametrize("index, expected_sizes", [(0, [5, 2]), (-1, [6, 5])])
+def test_remove_layer(index, expected_sizes):
+    network = _network()
+    removed = network.remove_layer(index)
+    assert [layer.num_neurons for layer in network.layers] == expected_sizes
+    assert not removed.is_first_layer and not removed.is_output_layer
+    _assert_consistent(network)
+
+
+def test_invalid_edits_raise():
+    network = _network()
+    with pytest.raises(ValueError):
+        network.insert_layer(4, 3, Activation.relu)
+    with pytest.raises(ValueError):
+        network.remove_layer(3)
+    with pytest.raises(ValueError):
+        network.resize_layer(0, 0)
+    single = NeuralNetwork(input_dim=2)
+    single.add_layer(num_neurons=1, activation_func=Activation.linear)
+    with pytest.raises(ValueError):
+        single.remove_layer(0)
+
+
+def test_set_layer_activation_keeps_weights():
+    network = _network()
+    weights = network.layers[1].weights.copy()
+    version = network.version
+    network.set_layer_activation(1, Activation.relu)
+    assert network.layers[1].activation_function is Activation.relu
+    np.testing.assert_array_equal(network.layers[1].weights, weights)
+    assert network.version != version
+
+
+def test_edited_network_can_still_be_trained():
+    network = _network()
+    network.fit(np.random.rand(16, 4), np.random.rand(16, 2), epochs=1, batch_size=8, optimizer="adam")
+    network.insert_layer(1, 7, Activation.relu)
+    network.resize_layer(0, 9)
+    history = network.fit(np.random.rand(16, 4), np.random.rand(16, 2), epochs=2, batch_size=8, optimizer="adam")
+    assert np.isfinite(history["loss"]).all()
+
+
+# --- Endpoint'ler ---
+
+@pytest.fixture
+def client():
+    from app import app
+    return app.test_client()
+
+
+def _create(client):
+    response = client.post("/api/create_network", json={"layer_neurons": [6, 5, 2], "activation_function": "relu",
+                                                         "input_dim": 4})
+    return response.get_json()["model_id"]
+
+
+def test_layer_endpoints(client):
+    model_id = _create(client)
+    response = client.post(f"/api/models/{model_id}/layers", json={"num_neurons": 3, "activation_function": "tanh",
+                                                                   "index": 0})
+    assert response.status_code == 200
+    response = client.patch(f"/api/models/{model_id}/layers/-1", json={"activation_function": "sigmoid"})
+    assert response.status_code == 200
+    response = client.delete(f"/api/models/{model_id}/layers/1")
+    assert response.status_code == 200
+    layers = response.get_json()["model"]["layers"]
+    assert len(layers) == 3 and "sigmoid" in layers[-1]
+
+
+@pytest.mark.parametrize("method, path, body", [
+    ("patch", "/layers/0", {"num_neurons": "many"}),
+    ("patch", "/layers/0", {"num_neurons": 0}),
+    ("patch", "/layers/0", {"activation_function": "swish"}),
+    ("patch", "/layers/0", {}),
+    ("patch", "/layers/9", {"num_neurons": 3}),
+    ("delete", "/layers/9", None),
+    ("post", "/layers", {"num_neurons": 3, "activation_function": "relu", "index": 9}),
+])
+def test_invalid_layer_edits_return_400(client, method, path, body):
+    model_id = _create(client)
+    response = getattr(client, method)(f"/api/models/{model_id}{path}", json=body)
+    assert response.status_code == 400
+
+
+def test_deleting_the_only_layer_returns_400(client):
+    response = client.post("/api/create_network", json={"layer_neurons": [1], "activation_function": "linear"})
+    model_id = response.get_json()["model_id"]
+    assert client.delete(f"/api/models/{model_id}/layers/0").status_code == 400
+
+
+def test_edits_during_training_return_409(client):
+    from app import job_manager, model_registry
+    from jobs import Job
+
+    model_id = _create(client)
+    network = model_registry.get_entry(model_id).network
+    release = threading.Event()
+    job = job_manager.submit(Job(kind="train", model=network), lambda job: release.wait(5))
+    try:
+        assert client.patch(f"/api/models/{model_id}/layers/0", json={"num_neurons": 3}).status_code == 409
+        assert client.delete(f"/api/models/{model_id}/layers/0").status_code == 409
+        assert model_registry.get_entry(model_id).network is network
+    finally:
+        release.set()
+    while not job.done:
+        job.wait_for_update(0, timeout=1)
+    assert client.delete(f"/api/models/{model_id}/layers/0").status_code == 200
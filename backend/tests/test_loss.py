@@ -0,0 +1,97 @@
+# tests/test_loss.py
+
+import numpy as np
+import pytest
+
+from implementations.Activation import Activation
+from implementations.Loss import Loss
+
+
+def _softmax(z):
+    e = np.exp(z - z.max(axis=-1, keepdims=True))
+    return e / e.sum(axis=-1, keepdims=True)
+
+
+def _sigmoid(z):
+    return 1 / (1 + np.exp(-z))
+
+
+def _data(kind, rows=6, cols=3, seed=0):
+    rng = np.random.default_rng(seed)
+    if kind == "mse":
+        return rng.normal(size=(rows, cols)), rng.normal(size=(rows, cols))
+    if kind == "bce":
+        return rng.uniform(0.05, 0.95, size=(rows, cols)), (rng.random((rows, cols)) > 0.5).astype(float)
+    if kind == "softmax_ce":
+        return rng.normal(size=(rows, cols)) * 3, np.eye(cols)[rng.integers(0, cols, rows)]
+    return rng.normal(size=(rows, cols)) * 3, (rng.random((rows, cols)) > 0.5).astype(float)
+
+
+# (isim, birleştirilmiş fonksiyon, girdiye göre birleştirilmemiş kayıp)
+CASES = [
+    ("mse", Loss.mean_squared_error_value_and_grad, Loss.mean_squared_error),
+    ("bce", Loss.binary_crossentropy_value_and_grad, Loss.binary_crossentropy),
+    ("softmax_ce", Loss.softmax_crossentropy_value_and_grad,
+     lambda z, y: Loss.categorical_crossentropy(_softmax(z), y)),
+    ("sigmoid_ce", Loss.sigmoid_crossentropy_value_and_grad,
+     lambda z, y: Loss.binary_crossentropy(_sigmoid(z), y)),
+]
+
+
+@pytest.mark.parametrize("kind, fused, reference", CASES, ids=[case[0] for case in CASES])
+def test_fused_matches_reference_cost_and_finite_differences(kind, fused, reference):
+    x, y = _data(kind)
+    cost, grad = fused(x, y)
+    assert cost == pytest.approx(reference(x, y), rel=1e-10)
+
+    # Merkezi fark: dL/dx_ij ~ (L(x + h) - L(x - h)) / 2h
+    h = 1e-6
+    numeric = np.empty_like(x)
+    for index in np.ndindex(x.shape):
+        step = np.zeros_like(x)
+        step[index] = h
+        numeric[index] = (reference(x + step, y) - reference(x - step, y)) / (2 * h)
+    np.testing.assert_allclose(grad, numeric, rtol=1e-5, atol=1e-8)
+
+
+@pytest.mark.parametrize("kind, fused, reference", CASES[:2], ids=["mse", "bce"])
+def test_fused_matches_derivative_functions(kind, fused, reference):
+    x, y = _data(kind)
+    derivative = Loss.get(kind)[1]
+    np.testing.assert_allclose(fused(x, y)[1], derivative(x, y), rtol=1e-12)
+
+
+@pytest.mark.parametrize("kind, fused, reference", CASES, ids=[case[0] for case in CASES])
+def test_reused_buffers_give_the_same_results(kind, fused, reference):
+    x, y = _data(kind, rows=6)
+    expected_cost, expected_grad = fused(x, y)
+    expected_grad = expected_grad.copy()
+
+    out = np.empty_like(x)
+    big_x, big_y = _data(kind, rows=32, seed=1)
+    for _ in range(3):
+        # Büyük bir batch thread'in ara buffer'larını büyütür; sonraki küçük batch onları yeniden kullanır
+        fused(big_x, big_y)
+        cost, grad = fused(x, y, out=out)
+        assert grad is out
+        assert cost == expected_cost
+        np.testing.assert_array_equal(grad, expected_grad)
+
+
+def test_out_shape_is_checked():
+    x, y = _data("mse")
+    with pytest.raises(ValueError):
+        Loss.mean_squared_error_value_and_grad(x, y, out=np.empty((1, 3)))
+
+
+def test_value_and_grad_selects_fused_logit_paths():
+    assert Loss.value_and_grad("cce", Activation.softmax) == (Loss.softmax_crossentropy_value_and_grad, True)
+    assert Loss.value_and_grad("bce", Activation.sigmoid) == (Loss.sigmoid_crossentropy_value_and_grad, True)
+    assert Loss.value_and_grad("mse", Activation.sigmoid) == (Loss.mean_squared_error_value_and_grad, False)
+    fused, wrt_logits = Loss.value_and_grad("cce", Activation.relu)
+    assert not wrt_logits
+    x, y = _data("bce")
+    y = np.eye(3)[np.arange(6) % 3]
+    cost, grad = fused(x, y, out=np.empty_like(x))
+    assert cost == pytest.approx(Loss.categorical_crossentropy(x, y))
+    np.testing.assert_allclose(grad, Loss.categorical_crossentropy_derivative(x, y))
@@ -0,0 +1,67 @@
+# tests/test_parallel.py
+
+import numpy as np
+import pytest
+
+from implementations.Activation import Activation
+from implementations.Network import NeuralNetwork
+from implementations.Optimizer import Optimizer
+from implementations.Parallel import DataParallelTrainer
+
+
+def _network():
+    np.random.seed(1)
+    network = NeuralNetwork(input_dim=8, name="ParallelTest", dtype="float64")
+    network.add_layer(num_neurons=16, activation_func=Activation.relu)
+    network.add_layer(num_neurons=1, activation_func=Activation.sigmoid)
+    return network
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.random((200, 8))
+    return X, (X.sum(axis=1, keepdims=True) > 4).astype(float)
+
+
+def test_two_workers_match_single_process(data):
+    X, y = data
+    kwargs = dict(loss="binary_crossentropy", optimizer="adam", batch_size=64, epochs=3,
+                  learning_rate=0.01, shuffle=False)
+    single, parallel = _network(), _network()
+    single_history = single.fit(X, y, workers=1, **kwargs)
+    parallel_history = parallel.fit(X, y, workers=2, **kwargs)
+
+    np.testing.assert_allclose(parallel_history["loss"], single_history["loss"], rtol=1e-10)
+    for a, b in zip(single.layers, parallel.layers):
+        np.testing.assert_allclose(b.weights, a.weights, rtol=1e-10, atol=1e-12)
+        np.testing.assert_allclose(b.biases, a.biases, rtol=1e-10, atol=1e-12)
+
+
+def test_network_is_usable_after_close(data):
+    X, y = data
+    network = _network()
+    optimizer = Optimizer.create("sgd", learning_rate=0.1)
+    with DataParallelTrainer(network, num_workers=2, loss="binary_crossentropy") as trainer:
+        # Batch worker sayısından küçük olsa da adım çalışır
+        trainer.step(X[:1], y[:1], optimizer)
+        loss = trainer.step(X[:64], y[:64], optimizer)
+    assert np.isfinite(loss)
+    with pytest.raises(RuntimeError):
+        trainer.step(X[:64], y[:64], optimizer)
+    trainer.close()
+
+    # Parametreler artık paylaşımlı belleğe bakmaz: yazılabilir, kendi belleğine sahip diziler
+    for layer in network.layers:
+        assert layer.weights.base is None and layer.weights.flags.writeable
+    expected = network.predict(X)
+    np.testing.assert_array_equal(network.compile().predict(X), expected)
+    history = network.fit(X, y, loss="binary_crossentropy", epochs=1, batch_size=64)
+    assert np.isfinite(history["loss"]).all()
+
+
+def test_rejects_activations_workers_cannot_rebuild():
+    network = NeuralNetwork(input_dim=2)
+    network.add_layer(num_neurons=1, activation_func=lambda z: z)
+    with pytest.raises(ValueError):
+        DataParallelTrainer(network, num_workers=2)
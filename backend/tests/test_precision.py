@@ -0,0 +1,74 @@
+# tests/test_precision.py
+"""
+Düşük hassasiyete çevrilen modellerin (astype) eğitilmiş float64 modele göre doğruluğu.
+Karşılaştırma orijinal float64 modelle yapılır, yani hem depolama yuvarlaması hem
+hesaplama hassasiyeti ölçülür.
+"""
+
+import contextlib
+import io
+
+import numpy as np
+import pytest
+
+from implementations.Activation import Activation
+from implementations.Network import NeuralNetwork
+
+# Tip başına izin verilen en büyük göreli hata (tahmin: çıktı ölçeğine, kayıp: referans kayba oranla)
+TOLERANCES = {
+    "float32": 1e-4,
+    "float16": 1e-2,
+}
+
+
+@pytest.fixture(scope="module")
+def trained_float64():
+    rng = np.random.default_rng(0)
+    X = rng.random((512, 8))
+    y = (X[:, :4].sum(axis=1, keepdims=True) > 2.0).astype(np.float64)
+    np.random.seed(0)
+    network = NeuralNetwork(input_dim=8, name="precision", dtype=np.float64)
+    with contextlib.redirect_stdout(io.StringIO()):
+        network.add_layer(num_neurons=32, activation_func=Activation.tanh)
+        network.add_layer(num_neurons=16, activation_func=Activation.relu)
+        network.add_layer(num_neurons=1, activation_func=Activation.sigmoid)
+        network.fit(X, y, loss="binary_crossentropy", optimizer="adam", learning_rate=0.01,
+                    batch_size=32, epochs=30)
+    return network, X, y
+
+
+@pytest.mark.parametrize("dtype", sorted(TOLERANCES))
+def test_converted_model_within_tolerance(trained_float64, dtype):
+    reference, X, y = trained_float64
+    converted = reference.shallow_copy().astype(dtype)
+    tolerance = TOLERANCES[dtype]
+
+    check = converted.check_precision(X, reference=reference, y=y, loss="binary_crossentropy")
+    assert check["max_rel_error"] <= tolerance, check
+    assert check["loss_rel_error"] <= tolerance, check
+    assert check["within_tolerance"]
+
+    # Aynı ölçüm doğrudan: tahminler ve kayıp
+    expected = reference.predict(X)
+    actual = converted.predict(X).astype(np.float64)
+    assert np.max(np.abs(actual - expected)) <= tolerance * np.max(np.abs(expected))
+
+
+def test_float16_storage_error_is_measured(trained_float64):
+    reference, X, y = trained_float64
+    converted = reference.shallow_copy().astype("float16")
+    against_original = converted.check_precision(X, reference=reference, y=y, loss="binary_crossentropy")
+    # Varsayılan referans float16 ağırlıkların float64 kopyasıdır: yuvarlama hatasını görmez
+    against_own_weights = converted.check_precision(X)
+    assert against_original["max_abs_error"] > 0
+    assert against_original["max_abs_error"] > 10 * against_own_weights["max_abs_error"]
+    # Sıkı bir tolerans depolama hatasını yakalamalı
+    assert not converted.check_precision(X, tolerance=1e-6, reference=reference)["within_tolerance"]
+
+
+def test_conversion_does_not_modify_reference(trained_float64):
+    reference, X, _ = trained_float64
+    before = reference.predict(X)
+    reference.shallow_copy().astype("float16")
+    assert reference.dtype == np.float64
+    np.testing.assert_array_equal(reference.predict(X), before)
@@ -0,0 +1,109 @@
+# tests/test_prediction_cache.py
+
+import numpy as np
+import pytest
+
+from implementations.Activation import Activation
+from implementations.Network import NeuralNetwork
+from prediction_cache import PredictionCache
+
+
+def _network():
+    np.random.seed(0)
+    network = NeuralNetwork(input_dim=3)
+    network.add_layer(num_neurons=5, activation_func=Activation.relu)
+    network.add_layer(num_neurons=1, activation_func=Activation.sigmoid)
+    return network
+
+
+class _CountingPredict:
+    def __init__(self, network):
+        self.network = network
+        self.rows = []
+
+    def __call__(self, X):
+        self.rows.append(X.shape[0])
+        return self.network.predict(X)
+
+
+def test_repeated_rows_are_hits():
+    network = _network()
+    cache = PredictionCache(max_entries=16)
+    predict = _CountingPredict(network)
+    X = np.random.rand(4, 3).astype(np.float32)
+
+    first = cache.predict(network, X, predict)
+    # İki satır önbellekte, sadece yeni satır hesaplanır
+    second = cache.predict(network, np.vstack([X[:2], np.ones((1, 3), np.float32)]), predict)
+    third = cache.predict(network, X, predict)
+
+    np.testing.assert_allclose(first, network.predict(X), atol=1e-6)
+    np.testing.assert_array_equal(second[:2], first[:2])
+    np.testing.assert_array_equal(third, first)
+    assert predict.rows == [4, 1]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (6, 5)
+    assert stats["entries"] == 5
+
+
+@pytest.mark.parametrize("change", [
+    lambda network: network.layers[0].mark_updated(),
+    lambda network: network.fit(np.random.rand(8, 3), np.random.rand(8), epochs=1, batch_size=8),
+    lambda network: network.resize_layer(0, 7),
+], ids=["mark_updated", "training_step", "resize_layer"])
+def test_network_changes_invalidate(change):
+    network = _network()
+    cache = PredictionCache(max_entries=16)
+    predict = _CountingPredict(network)
+    X = np.random.rand(3, 3).astype(np.float32)
+    cache.predict(network, X, predict)
+
+    change(network)
+    result = cache.predict(network, X, predict)
+
+    assert predict.rows == [3, 3]
+    assert cache.stats()["invalidations"] == 1
+    np.testing.assert_allclose(result, network.predict(X), atol=1e-6)
+
+
+def test_lru_eviction_at_max_entries():
+    network = _network()
+    cache = PredictionCache(max_entries=3)
+    predict = _CountingPredict(network)
+    rows = [np.full((1, 3), i, dtype=np.float32) for i in range(4)]
+    for row in rows[:3]:
+        cache.predict(network, row, predict)
+    # rows[0] kullanılınca en eski kayıt rows[1] olur
+    cache.predict(network, rows[0], predict)
+    cache.predict(network, rows[3], predict)
+
+    assert len(cache) == 3
+    assert cache.stats()["evictions"] == 1
+    predict.rows.clear()
+    cache.predict(network, rows[0], predict)
+    cache.predict(network, rows[1], predict)
+    assert predict.rows == [1]
+    assert cache.stats()["evictions"] == 2
+
+
+def test_layer_edit_through_endpoint_invalidates_model_cache():
+    from app import app, model_registry
+
+    client = app.test_client()
+    model_id = client.post("/api/create_network", json={"layer_neurons": [4, 1], "activation_function": "sigmoid",
+                                                         "input_dim": 3}).get_json()["model_id"]
+    body = {"model_id": model_id, "input_data": [[0.1, 0.2, 0.3]]}
+    before = client.post("/api/predict", json=body).get_json()["predictions"]
+    client.post("/api/predict", json=body)
+    entry = model_registry.get_entry(model_id)
+    assert entry.cache.stats()["hits"] == 1
+
+    # shallow_copy _structure_version'ı korur; düzenleme onu artırmalıdır
+    response = client.patch(f"/api/models/{model_id}/layers/0", json={"activation_function": "linear"})
+    assert response.status_code == 200
+    after = client.post("/api/predict", json=body).get_json()["predictions"]
+
+    stats = model_registry.get_entry(model_id).cache.stats()
+    assert stats["invalidations"] == 1
+    assert stats["hits"] == 1
+    assert after != before
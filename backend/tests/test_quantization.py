@@ -0,0 +1,54 @@
+# tests/test_quantization.py
+
+import numpy as np
+import pytest
+
+from implementations.Activation import Activation
+from implementations.Network import NeuralNetwork
+from implementations.Quantization import quantize, quantization_report
+
+
+def _network():
+    np.random.seed(0)
+    network = NeuralNetwork(input_dim=32)
+    network.add_layer(num_neurons=256, activation_func=Activation.relu)
+    network.add_layer(num_neurons=4, activation_func=Activation.softmax)
+    return network
+
+
+def test_cached_and_streamed_layers_agree():
+    network = _network()
+    X = np.random.rand(16, 32)
+    cached, streamed = quantize(network, cache_bytes=64 << 10), quantize(network)
+    assert all(layer.cached_weights is not None for layer in cached.layers)
+    assert all(layer.cached_weights is None for layer in streamed.layers)
+    np.testing.assert_allclose(cached.predict(X), streamed.predict(X), atol=1e-5)
+    np.testing.assert_allclose(cached.predict(X[0]), cached.predict(X)[0], atol=1e-6)
+
+
+def test_cache_is_bounded_per_layer_and_counted_in_nbytes():
+    network = _network()
+    # İlk katmanın float32 kopyası 32 KB, ikincisininki 4 KB
+    quantized = quantize(network, cache_bytes=16 << 10)
+    first, second = quantized.layers
+    assert first.cached_weights is None
+    assert second.cached_weights is not None
+    assert quantized.nbytes == quantized.parameter_nbytes + second.cached_weights.nbytes
+    report = quantization_report(network, quantized, np.random.rand(8, 32))
+    assert report["quantized_nbytes"] == quantized.nbytes
+    assert report["quantized_parameter_nbytes"] == quantized.parameter_nbytes
+    assert report["compression"] == pytest.approx(quantized.source_nbytes / quantized.nbytes)
+
+
+def test_default_quantization_is_smaller_than_float32():
+    np.random.seed(0)
+    network = NeuralNetwork(input_dim=128)
+    network.add_layer(num_neurons=256, activation_func=Activation.relu)
+    network.add_layer(num_neurons=128, activation_func=Activation.relu)
+    network.add_layer(num_neurons=10, activation_func=Activation.softmax)
+    quantized = quantize(network)
+    assert all(layer.cached_weights is None for layer in quantized.layers)
+    assert quantized.nbytes == quantized.parameter_nbytes
+    assert quantized.nbytes * 3.5 < quantized.source_nbytes
+    report = quantization_report(network, quantized, np.random.rand(8, 128))
+    assert report["compression"] > 3.5
@@ -0,0 +1,81 @@
+# tests/test_serialization.py
+
+import numpy as np
+import pytest
+
+from implementations.Activation import Activation
+from implementations.Network import NeuralNetwork
+from implementations.Serialization import MAGIC, load_network, read_header, save_network
+
+
+def _network(dtype):
+    np.random.seed(0)
+    network = NeuralNetwork(input_dim=5, name="SaveExample", dtype=dtype)
+    network.add_layer(num_neurons=7, activation_func=Activation.gelu)
+    network.add_layer(num_neurons=4, activation_func=Activation.tanh)
+    network.add_layer(num_neurons=3, activation_func=Activation.softmax)
+    return network
+
+
+@pytest.fixture
+def saved(tmp_path):
+    def save(dtype="float32"):
+        network = _network(dtype)
+        path = str(tmp_path / f"model_{dtype}.dnn")
+        save_network(network, path)
+        return network, path
+    return save
+
+
+@pytest.mark.parametrize("dtype", ["float64", "float32", "float16"])
+@pytest.mark.parametrize("mmap_mode", ["c", "r", None])
+def test_round_trip(saved, dtype, mmap_mode):
+    network, path = saved(dtype)
+    loaded = load_network(path, mmap_mode=mmap_mode)
+
+    assert loaded.name == network.name
+    assert loaded.dtype == network.dtype
+    assert [layer.activation_function for layer in loaded.layers] == \
+        [layer.activation_function for layer in network.layers]
+    assert loaded.layers[0].is_first_layer and loaded.layers[-1].is_output_layer
+    for original, layer in zip(network.layers, loaded.layers):
+        assert layer.weights.dtype == original.weights.dtype
+        np.testing.assert_array_equal(layer.weights, original.weights)
+        np.testing.assert_array_equal(layer.biases, original.biases)
+    X = np.random.rand(6, 5)
+    np.testing.assert_array_equal(loaded.predict(X), network.predict(X))
+
+
+def test_memmap_modes(saved):
+    network, path = saved()
+    assert isinstance(load_network(path, mmap_mode="r").layers[0].weights.base, np.memmap)
+    # Copy-on-write: yüklenen ağ eğitilebilir, dosya değişmez
+    loaded = load_network(path, mmap_mode="c")
+    loaded.fit(np.random.rand(8, 5), np.eye(3)[np.random.randint(0, 3, 8)], loss="categorical_crossentropy",
+               epochs=1, batch_size=8)
+    np.testing.assert_array_equal(load_network(path).layers[0].weights, network.layers[0].weights)
+
+
+def test_bad_magic_raises(tmp_path):
+    path = tmp_path / "bad.dnn"
+    path.write_bytes(b"NOTANET!" + bytes(64))
+    with pytest.raises(ValueError, match="geçerli bir ağ dosyası değil"):
+        load_network(str(path))
+
+
+@pytest.mark.parametrize("keep", [len(MAGIC) + 4, len(MAGIC) + 8 + 10, -1])
+def test_truncated_file_raises(saved, keep):
+    _, path = saved()
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(data[:keep])
+    for mmap_mode in ("c", None):
+        with pytest.raises(ValueError, match="kesik|eksik"):
+            load_network(path, mmap_mode=mmap_mode)
+
+
+def test_read_header_does_not_need_the_data(saved):
+    _, path = saved()
+    header = read_header(path)
+    assert [meta["num_neurons"] for meta in header["layers"]] == [7, 4, 3]